@@ -0,0 +1,110 @@
+"""
+Times every Interpreter phase on the corpus and on synthetic programs
+(see generators module). Run from the repository root:
+
+    python -m benchmarks.bench_phases --save baseline.json
+    python -m benchmarks.bench_phases --compare baseline.json
+
+With --compare exits with code 1 if any phase got slower than the baseline
+by more than --threshold times.
+"""
+import argparse
+import glob
+import json
+import platform
+import sys
+import time
+
+from benchmarks.generators import SYNTHETIC
+from interpreter import errors
+from interpreter.interpreter_file import Interpreter
+from interpreter.program import CompiledProgram
+
+CORPUS = sorted(glob.glob("test_programs/*.txt") + glob.glob("programs_4_reglament/*.txt"))
+
+PHASES = ("tokenize", "get_variables", "parse", "compile", "run_commands")
+
+# Differences smaller than this are noise for any threshold
+MIN_DIFFERENCE = 50e-6
+
+
+def time_phases(source: str, keep_path: bool, repeat: int) -> dict[str, float]:
+    # Best time of every phase, the cache is disabled so all phases run
+    interpreter = Interpreter(cache_size=0)
+    times = dict.fromkeys(PHASES, float("inf"))
+    for _ in range(repeat):
+        interpreter.reset()
+        interpreter.source = source
+        for phase in PHASES:
+            method = getattr(interpreter, phase)
+            start = time.perf_counter()
+            if phase == "run_commands":
+                method(keep_path)
+            else:
+                method()
+            times[phase] = min(times[phase], time.perf_counter() - start)
+            if phase == "compile":
+                # run_commands() runs the program build() would have made
+                interpreter.compiled = CompiledProgram(interpreter.variables, interpreter.program, interpreter.bytecode)
+
+    return times
+
+
+def programs():
+    # Yields (name, source, keep_path), corpus programs which fail are skipped
+    for path in CORPUS:
+        with open(path) as file:
+            source = file.read()
+        try:
+            Interpreter(cache_size=0).execute_source(source)
+
+        except errors.Error:
+            continue
+
+        yield path, source, True
+
+    for name, (source, keep_path) in SYNTHETIC.items():
+        yield name, source, keep_path
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    for name, times in results.items():
+        for phase, elapsed in times.items():
+            old = baseline.get(name, {}).get(phase)
+            if old is not None and elapsed > old * threshold and elapsed - old > MIN_DIFFERENCE:
+                regressions.append(f"{name} {phase}: {old * 1e3:.3f} ms -> {elapsed * 1e3:.3f} ms")
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_phases")
+    parser.add_argument("--save", help="write results to this JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare with")
+    parser.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown, 1.25 is 25%%")
+    parser.add_argument("--repeat", type=int, default=5, help="runs of every program, the best one is kept")
+    args = parser.parse_args(argv)
+
+    print(f"{'program':<40}" + "".join(f"{phase + ', ms':>18}" for phase in PHASES))
+    results = {}
+    for name, source, keep_path in programs():
+        results[name] = time_phases(source, keep_path, args.repeat)
+        print(f"{name:<40}" + "".join(f"{results[name][phase] * 1e3:>18.3f}" for phase in PHASES))
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"python": platform.python_version(), "results": results}, file, indent=2)
+
+    if args.compare:
+        with open(args.compare) as file:
+            baseline = json.load(file)
+        regressions = compare(results, baseline["results"], args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Measures cold start of the headless runner: a new Python process that
+runs one short program, compared with an empty Python process.
+Run from the repository root:
+
+    python -m benchmarks.bench_startup --max-overhead 100
+
+With --max-overhead exits with code 1 if python -m interpreter takes more
+than that many milliseconds over the empty process.
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+PROGRAM = "test_programs/program.txt"
+RUNS = 20
+
+COMMANDS = {
+    "python -c pass": [sys.executable, "-c", "pass"],
+    "import interpreter": [sys.executable, "-c", "import interpreter.interpreter_file"],
+    "python -m interpreter": [sys.executable, "-m", "interpreter", PROGRAM, "--jobs", "1"],
+}
+
+# Modules that must never be imported by the headless path
+GUI_MODULES = ("PyQt5", "lark")
+
+
+def measure(command):
+    times = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def gui_modules_imported():
+    code = "import sys, interpreter.__main__, core_tools.logger; print(' '.join(sys.modules))"
+    modules = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout.split()
+    return [name for name in modules if name.split(".")[0] in GUI_MODULES]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.bench_startup")
+    parser.add_argument("--max-overhead", type=float, help="allowed overhead of python -m interpreter, in ms")
+    args = parser.parse_args(argv)
+
+    base = overhead = None
+    for name, command in COMMANDS.items():
+        elapsed = measure(command)
+        base = elapsed if base is None else base
+        overhead = (elapsed - base) * 1000
+        print(f"{name:<24} {elapsed * 1000:8.1f} ms  (+{overhead:.1f} ms)")
+
+    gui_modules = gui_modules_imported()
+    print(f"GUI modules imported: {gui_modules or 'none'}")
+    if gui_modules:
+        return 1
+
+    # the last command is the whole headless run
+    if args.max_overhead is not None and overhead > args.max_overhead:
+        print(f"REGRESSION startup overhead {overhead:.1f} ms > {args.max_overhead:.1f} ms", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""
+Compares bytecode VM with the tree walking executor on the same parsed
+programs. Run from the repository root: python -m benchmarks.bench_vm
+"""
+import glob
+import timeit
+
+from interpreter import compiler, errors, executor, grid, tokenizer, trajectory, vm
+from interpreter.interpreter_file import Interpreter
+
+CORPUS = sorted(glob.glob("test_programs/*.txt") + glob.glob("programs_4_reglament/*.txt"))
+
+SYNTHETIC = {
+    "nested_repeat_1000x10x10": """
+REPEAT 1000
+    REPEAT 10
+        RIGHT 1
+        LEFT 1
+        REPEAT 10
+            UP 1
+            DOWN 1
+        ENDREPEAT
+    ENDREPEAT
+ENDREPEAT
+""",
+    "ifblocks_in_loop": """
+REPEAT 1000
+    REPEAT 20
+        IFBLOCK RIGHT
+            LEFT 20
+        ENDIF
+        RIGHT 1
+    ENDREPEAT
+ENDREPEAT
+""",
+}
+
+
+def parse_source(text):
+    interpreter = Interpreter()
+    interpreter.commands = tokenizer.tokenize(text.splitlines())
+    interpreter.get_variables()
+    interpreter.parse()
+    return interpreter.program
+
+
+def run_tree(program):
+    coordinates = [(0, 0)]
+    executor.TreeExecutor(program, grid.Grid(), coordinates).run()
+    return coordinates
+
+
+def run_vm(bytecode):
+    coordinates = trajectory.Trajectory([(0, 0)])
+    vm.run(bytecode, grid.Grid(), coordinates)
+    return coordinates
+
+
+def bench(name, program, number):
+    bytecode = compiler.compile_program(program)
+    if run_tree(program) != run_vm(bytecode):
+        raise AssertionError(f"{name}: executors disagree")
+
+    tree_time = min(timeit.repeat(lambda: run_tree(program), number=number, repeat=3)) / number
+    vm_time = min(timeit.repeat(lambda: run_vm(bytecode), number=number, repeat=3)) / number
+    print(f"{name:<48} {tree_time * 1e6:>12.1f} {vm_time * 1e6:>12.1f} {tree_time / vm_time:>8.2f}x")
+
+
+def main():
+    print(f"{'program':<48} {'tree, us':>12} {'vm, us':>12} {'speedup':>9}")
+    for path in CORPUS:
+        with open(path) as file:
+            source = file.read()
+        try:
+            program = parse_source(source)
+            run_tree(program)
+
+        except errors.Error:
+            continue
+
+        bench(path, program, 2000)
+
+    for name, source in SYNTHETIC.items():
+        bench(name, parse_source(source), 3)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Generators of synthetic programs for benchmarks. Every function returns
+the source of a valid program which stays inside the grid.
+"""
+
+
+def deep_repeat(counts: tuple[int, ...] = (1000, 1000, 1000), body: str = "RIGHT 1\nLEFT 1") -> str:
+    # Loops nested into each other, counts[0] is the outer one
+    lines = [f"REPEAT {count}" for count in counts]
+    lines.append(body)
+    lines.extend("ENDREPEAT" for _ in counts)
+    return "\n".join(lines)
+
+
+def deep_repeat_with_ifblock(counts: tuple[int, int] = (1000, 100)) -> str:
+    # IFBLOCK on the last allowed level, so the loops can't be folded
+    return deep_repeat(counts, "IFBLOCK RIGHT\nLEFT 20\nENDIF\nRIGHT 1")
+
+
+def procedure_chain(count: int = 300) -> str:
+    # Every procedure calls the previous one, the last one is called once
+    lines = ["PROCEDURE P0", "RIGHT 1", "LEFT 1", "ENDPROC"]
+    for i in range(1, count):
+        lines.extend((f"PROCEDURE P{i}", f"CALL P{i - 1}", "UP 1", "DOWN 1", "ENDPROC"))
+    lines.append(f"CALL P{count - 1}")
+    return "\n".join(lines)
+
+
+def ifblock_chain(count: int = 1000) -> str:
+    # Moves right and returns to the left border every 20 steps
+    lines = []
+    for _ in range(count):
+        lines.extend(("RIGHT 1", "IFBLOCK RIGHT", "LEFT 20", "ENDIF"))
+    return "\n".join(lines)
+
+
+def straight_moves(count: int = 10000) -> str:
+    # Squares of different sizes, every four moves return to (0, 0)
+    directions = ("RIGHT", "UP", "LEFT", "DOWN")
+    return "\n".join(f"{directions[i % 4]} {i // 4 % 20 + 1}" for i in range(count))
+
+
+def set_table(count: int = 1000) -> str:
+    # count variables, every one is declared through the previous one and used once
+    lines = ["SET V0 = 1"]
+    lines.extend(f"SET V{i} = V{i - 1}" for i in range(1, count))
+    for i in range(count):
+        lines.extend((f"RIGHT V{i}", f"LEFT V{i}"))
+    return "\n".join(lines)
+
+
+# name: (source, keep_path), loops of a billion moves are run without the path
+SYNTHETIC = {
+    "deep_repeat_1000x1000x1000": (deep_repeat(), False),
+    "deep_repeat_1000x10x10": (deep_repeat((1000, 10, 10)), True),
+    "deep_repeat_ifblock_1000x100": (deep_repeat_with_ifblock(), True),
+    "procedure_chain_300": (procedure_chain(), True),
+    "ifblock_chain_1000": (ifblock_chain(), True),
+    "straight_moves_10000": (straight_moves(), True),
+    "set_table_1000": (set_table(), True),
+}
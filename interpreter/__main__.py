@@ -0,0 +1,166 @@
+"""
+Runs grid programs without the UI and prints one JSON line per program:
+
+    python -m interpreter test_programs --jobs 4
+    python -m interpreter "submissions/**/*.txt" --path > results.jsonl
+    python -m interpreter submissions --thumbnails thumbnails --jobs 4
+    python -m interpreter big_programs --grid-size 1000000
+"""
+import argparse
+import glob
+import json
+import os
+import sys
+from itertools import repeat
+
+from interpreter import errors, grid, render
+from interpreter.interpreter_file import Interpreter
+from interpreter.stats import ExecutionStats
+
+# Interpreter of the current process, so every worker keeps its own caches
+worker = None
+# max_steps and timeout of every run
+limits = {}
+# directory, format and size of thumbnails, None if they are not saved
+thumbnails = None
+
+
+def init_worker(cache_dir: str | None, max_steps: int | None = None, timeout: float | None = None,
+                thumbnail_dir: str | None = None, thumbnail_format: str = "png",
+                thumbnail_size: int = render.THUMBNAIL_SIZE, grid_size: int = grid.GRID_SIZE) -> None:
+    global worker, limits, thumbnails
+    worker = Interpreter(cache_dir=cache_dir, grid_size=grid_size)
+    limits = {"max_steps": max_steps, "timeout": timeout}
+    thumbnails = (thumbnail_dir, thumbnail_format, thumbnail_size) if thumbnail_dir is not None else None
+
+
+def find_programs(patterns: list[str]) -> list[str]:
+    # Directories give their .txt files, patterns are expanded as globs,
+    # other paths are kept as they are, so a missing file is reported as an error
+    programs = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            programs.extend(sorted(glob.glob(os.path.join(glob.escape(pattern), "*.txt"))))
+        elif glob.escape(pattern) != pattern:
+            programs.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            programs.append(pattern)
+
+    return programs
+
+
+def run_program(program_file: str, with_path: bool = False) -> dict:
+    if worker is None:
+        init_worker(None)
+
+    result = {
+        "program": program_file,
+        "coords": None,
+        "path_length": None,
+        "path_hash": None,
+        "error": None,
+        "message": None,
+        "build_time": None,
+        "run_time": None,
+    }
+    stats = ExecutionStats()
+    try:
+        worker.execute(program_file, stats=stats, **limits)
+
+    except errors.Error as error:
+        result["error"] = type(error).__name__
+        result["message"] = error.get_message()
+
+    except Exception as error:
+        # A broken submission must not stop the whole batch
+        result["error"] = type(error).__name__
+        result["message"] = str(error)
+
+    run_time = stats.phases.get("run")
+    result["build_time"] = stats.total_time - (run_time or 0)
+    result["run_time"] = run_time
+    if result["error"] is not None:
+        return result
+
+    path = worker.coordinates
+    result["coords"] = list(path[-1])
+    result["path_length"] = len(path)
+    result["path_hash"] = path.digest()
+    if with_path:
+        result["path"] = [list(point) for point in path]
+    if thumbnails is not None:
+        result["thumbnail"] = result["thumbnail_error"] = None
+        try:
+            result["thumbnail"] = save_thumbnail(program_file, path)
+
+        except Exception as error:
+            # the program itself has run fine, error is left for its errors
+            result["thumbnail_error"] = f"{type(error).__name__}: {error}"
+
+    return result
+
+
+def save_thumbnail(program_file: str, path) -> str:
+    # test_programs/1.txt gives test_programs_1.png, so files from different directories don't clash
+    directory, image_format, size = thumbnails
+    name = os.path.splitext(os.path.normpath(program_file))[0].replace(os.sep, "_").lstrip("._")
+    filename = os.path.join(directory, f"{name}.{image_format}")
+    os.makedirs(directory, exist_ok=True)
+    render.save(path, filename, size, worker.grid_size)
+    return filename
+
+
+def parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m interpreter", description="Runs grid programs without the UI")
+    parser.add_argument("programs", nargs="+", help="program files, directories or glob patterns")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="number of worker processes, 1 runs everything in this process")
+    parser.add_argument("--path", action="store_true", help="print the whole path, not only its hash")
+    parser.add_argument("--cache-dir", help="directory for compiled programs shared between runs")
+    parser.add_argument("--grid-size", type=int, default=grid.GRID_SIZE,
+                        help=f"coordinates are from 0 to this number, up to {grid.MAX_GRID_SIZE}")
+    parser.add_argument("--max-steps", type=int, help="stop programs that make more moves")
+    parser.add_argument("--timeout", type=float, help="stop programs that run longer, in seconds")
+    parser.add_argument("--thumbnails", metavar="DIR", help="save a picture of every path into this directory")
+    parser.add_argument("--thumbnail-format", choices=("png", "svg"), default="png")
+    parser.add_argument("--thumbnail-size", type=int, default=render.THUMBNAIL_SIZE, help="in pixels")
+    parser.add_argument("--chunksize", type=int, default=16, help="programs sent to a worker at once")
+    args = parser.parse_args(argv)
+    if not 1 <= args.grid_size <= grid.MAX_GRID_SIZE:
+        parser.error(f"--grid-size must be between 1 and {grid.MAX_GRID_SIZE}")
+    return args
+
+
+def print_results(results) -> None:
+    for result in results:
+        print(json.dumps(result), flush=True)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    programs = find_programs(args.programs)
+    if not programs:
+        print("No programs found", file=sys.stderr)
+        return 1
+
+    worker_args = (
+        args.cache_dir, args.max_steps, args.timeout, args.thumbnails, args.thumbnail_format, args.thumbnail_size,
+        args.grid_size,
+    )
+    if args.jobs <= 1:
+        init_worker(*worker_args)
+        print_results(map(run_program, programs, repeat(args.path)))
+        return 0
+
+    # The pool is imported only here, it takes longer than the whole interpreter
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=args.jobs, initializer=init_worker, initargs=worker_args) as pool:
+        # map keeps the order of programs
+        print_results(pool.map(run_program, programs, repeat(args.path), chunksize=args.chunksize))
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import hashlib
+import os
+import sys
+from collections import OrderedDict
+from typing import NamedTuple
+
+from interpreter import __version__, compiler, errors, executor, folding, parser, program, tokenizer
+from interpreter.program import CompiledProgram
+from interpreter.trajectory import Trajectory
+
+DEFAULT_CACHE_SIZE = 128
+
+# Modules which make compiled programs, any change of them can change the
+# bytecode or the pickled classes, errors of failing moves included
+COMPILER_MODULES = (tokenizer, parser, compiler, folding, program, executor, errors)
+
+
+def sources_digest(modules) -> str:
+    # Hash of the source files of modules, empty if they can't be read,
+    # for example in a frozen application, then the version has to do
+    digest = hashlib.sha256()
+    try:
+        for module in modules:
+            with open(module.__file__, "rb") as file:
+                digest.update(file.read())
+
+    except (OSError, TypeError):
+        return ""
+
+    return digest.hexdigest()[:16]
+
+
+# Compiled programs on disk are valid only for the same compiler and
+# Python versions, so they are part of the key. The compiler version comes
+# from its sources, so entries don't outlive a change without a release
+DISK_CACHE_TAG = (
+    f"grid-{__version__}-{sources_digest(COMPILER_MODULES)}-py{sys.version_info.major}{sys.version_info.minor}"
+)
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class ProgramCache:
+    """
+    LRU cache of compiled programs keyed by sha256 of the source.
+    Optionally keeps the path the program has produced, programs always
+    start from (0, 0), so the same source gives the same path.
+    maxsize 0 disables the cache.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.results = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> CompiledProgram | None:
+        compiled = self.entries.get(key)
+        if compiled is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return compiled
+
+    def put(self, key: str, compiled: CompiledProgram) -> None:
+        if self.maxsize <= 0:
+            return
+
+        self.entries[key] = compiled
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            old_key, _ = self.entries.popitem(last=False)
+            self.results.pop(old_key, None)
+
+    def get_result(self, key: str, grid_size: int) -> Trajectory | None:
+        # The same program may fail or make a path of another typecode on
+        # a grid of another size, so results are kept for every size
+        result = self.results.get(key, {}).get(grid_size)
+        # slices are copies of the same typecode
+        return result[:] if result is not None else None
+
+    def put_result(self, key: str, grid_size: int, result: Trajectory) -> None:
+        if key in self.entries:
+            self.results.setdefault(key, {})[grid_size] = result[:]
+
+    def info(self) -> CacheInfo:
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.entries))
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.results.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class DiskCache:
+    """
+    Compiled programs stored as pickle files in directory, like
+    __pycache__. File name is a hash of the source and DISK_CACHE_TAG, so
+    entries of other versions are never read. Files are written to a
+    temporary file first and then renamed, so processes sharing the
+    directory never see a half written entry. The directory must be
+    trusted, entries are loaded with pickle.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(source: str) -> str:
+        return hashlib.sha256(f"{DISK_CACHE_TAG}\n{source}".encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key: str) -> CompiledProgram | None:
+        # pickle and tempfile are imported only when the disk cache is used,
+        # they are noticeable in the start up time
+        import pickle
+
+        try:
+            with open(self.path(key), "rb") as file:
+                compiled = pickle.load(file)
+
+        except Exception:
+            # missing, broken or incompatible entry is just a miss
+            self.misses += 1
+            return None
+
+        if not isinstance(compiled, CompiledProgram):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return compiled
+
+    def put(self, key: str, compiled: CompiledProgram) -> None:
+        import pickle
+        import tempfile
+
+        file = None
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=self.directory, suffix=".tmp", delete=False) as file:
+                pickle.dump(compiled, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(file.name, self.path(key))
+
+        except OSError:
+            # cache is optional, a read-only or full disk must not break runs
+            if file is not None:
+                try:
+                    os.remove(file.name)
+                except OSError:
+                    pass
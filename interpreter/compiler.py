@@ -0,0 +1,159 @@
+from array import array
+from typing import NamedTuple
+
+from interpreter import errors, folding
+from interpreter.executor import move_times
+from interpreter.parser import Call, If, Move, Program, Repeat
+from interpreter.tokenizer import Opcode
+
+# Every instruction is 2 ints: opcode and its argument.
+# Move opcodes match tokenizer.Opcode values, argument is number of steps
+RIGHT = Opcode.RIGHT.value
+LEFT = Opcode.LEFT.value
+UP = Opcode.UP.value
+DOWN = Opcode.DOWN.value
+# argument is number of iterations
+REPEAT = 4
+# argument is address of the first instruction of the loop body
+ENDREPEAT = 5
+# argument is address right after the block, used when the condition fails
+IF_RIGHT = 6
+IF_LEFT = 7
+IF_UP = 8
+IF_DOWN = 9
+# argument is address of the procedure
+CALL = 10
+RETURN = 11
+HALT = 12
+# argument is index in Bytecode.failures
+FAIL = 13
+# argument is index in Bytecode.folds, a loop without IFBLOCKs
+# or a straight block of commands
+FOLD = 14
+
+IF_OPCODES = {
+    Opcode.RIGHT: IF_RIGHT,
+    Opcode.LEFT: IF_LEFT,
+    Opcode.UP: IF_UP,
+    Opcode.DOWN: IF_DOWN,
+}
+
+OPCODE_NAMES = ("RIGHT", "LEFT", "UP", "DOWN", "REPEAT", "ENDREPEAT", "IF_RIGHT", "IF_LEFT", "IF_UP",
+                "IF_DOWN", "CALL", "RETURN", "HALT", "FAIL", "FOLD")
+
+
+class Bytecode(NamedTuple):
+    """
+    Compiled program. code holds pairs (opcode, argument), lines holds the
+    source line of every pair. failures are errors found while compiling
+    commands, they are raised only when such command is reached. folds are
+    summaries of loops and straight blocks without IFBLOCKs (see folding
+    module).
+    """
+    code: array
+    lines: array
+    failures: tuple[tuple[type, str], ...]
+    folds: tuple[folding.Fold, ...]
+
+
+class Compiler:
+    def __init__(self, program: Program, fold: bool = True):
+        self.program = program
+        # without folding every move is a separate instruction with its own
+        # line, it is used for tracing
+        self.fold = fold
+        self.code = array("i")
+        self.lines = array("i")
+        self.failures = []
+        self.folds = []
+        self.procedure_folds = {}
+        # addresses of CALL instructions, patched when all procedures are compiled
+        self.calls = []
+
+    def emit(self, opcode: int, argument: int, line: int) -> int:
+        # returns address of the emitted instruction
+        address = len(self.code)
+        self.code.append(opcode)
+        self.code.append(argument)
+        self.lines.append(line)
+        return address
+
+    def compile(self) -> Bytecode:
+        self.compile_block(self.program.body)
+        self.emit(HALT, 0, 0)
+        procedures = {}
+        for name, body in self.program.procedures.items():
+            procedures[name] = len(self.code)
+            self.compile_block(body)
+            self.emit(RETURN, 0, 0)
+
+        for address, name in self.calls:
+            self.code[address + 1] = procedures[name]
+
+        return Bytecode(self.code, self.lines, tuple(self.failures), tuple(self.folds))
+
+    def compile_block(self, body: tuple) -> None:
+        # Commands without IFBLOCKs are collected into straight blocks,
+        # so bounds are checked once per block instead of once per move
+        if not self.fold:
+            for node in body:
+                self.compile_node(node)
+            return
+
+        block = []
+        for node in body:
+            item = folding.summarize_node(node, self.program.procedures, self.procedure_folds)
+            if item is not None:
+                block.append((node, item))
+                continue
+
+            self.compile_straight_block(block)
+            block = []
+            self.compile_node(node)
+
+        self.compile_straight_block(block)
+
+    def compile_straight_block(self, block: list) -> None:
+        if not block:
+            return
+
+        node, item = block[0]
+        if len(block) == 1 and type(item) is not folding.Fold:
+            self.emit(node.direction.value, item[1], node.line)
+            return
+
+        if len(block) == 1:
+            fold = item
+        else:
+            fold = folding.fold_items([item for _, item in block], 1, [node.line for node, _ in block])
+
+        self.folds.append(fold)
+        self.emit(FOLD, len(self.folds) - 1, node.line)
+
+    def compile_node(self, node) -> None:
+        node_type = type(node)
+        if node_type is Move:
+            try:
+                self.emit(node.direction.value, move_times(node), node.line)
+
+            except errors.Error as error:
+                self.failures.append((type(error), error.args[0]))
+                self.emit(FAIL, len(self.failures) - 1, node.line)
+
+        elif node_type is Repeat:
+            self.emit(REPEAT, node.times, node.line)
+            start = len(self.code)
+            self.compile_block(node.body)
+            self.emit(ENDREPEAT, start, node.line)
+
+        elif node_type is If:
+            address = self.emit(IF_OPCODES[node.direction], 0, node.line)
+            self.compile_block(node.body)
+            self.code[address + 1] = len(self.code)
+
+        elif node_type is Call:
+            self.calls.append((self.emit(CALL, 0, node.line), node.name))
+
+
+def compile_program(program: Program, fold: bool = True) -> Bytecode:
+    return Compiler(program, fold).compile()
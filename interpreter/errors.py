@@ -1,6 +1,8 @@
 class Error(Exception):
     def __init__(self, message: str) -> None:
         self.message = f"{self.__class__.__name__}: {message}"
+        # source line of the command that failed, set by vm.Machine for errors of the run
+        self.line = None
 
     def get_message(self) -> str:
         return self.message
@@ -75,3 +77,10 @@ class SomethingWentWrongError(Error):
 
 class ForbiddenParametersError(Error):
     pass
+
+
+class ExecutionLimitError(Error):
+    # Raised when the run exceeds max_steps or timeout, coordinates is the path made so far
+    def __init__(self, message: str, coordinates=None) -> None:
+        super().__init__(message)
+        self.coordinates = coordinates
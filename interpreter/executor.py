@@ -0,0 +1,65 @@
+from typing import Callable
+
+from interpreter import errors
+from interpreter.grid import Grid
+from interpreter.parser import Call, If, Move, Program, Repeat
+
+
+def move_times(node: Move) -> int:
+    times = node.times
+    if not isinstance(times, int):
+        raise errors.NotDeclaredVariableError(
+            f"Variable {times} is not declared"
+        )
+
+    if times <= 0 or times > 1000:
+        raise errors.WrongSyntaxCommandError(
+            f"You can't move {node.direction.name} {times} times"
+        )
+
+    return times
+
+
+class TreeExecutor:
+    """
+    Walks Program tree without unrolling it. Loops are run in place and
+    procedures are entered on every call, so memory depends on the source
+    size and not on the number of iterations.
+    """
+
+    def __init__(self, program: Program, grid: Grid, coordinates: list,
+                 should_stop: Callable[[], bool] = lambda: False):
+        self.program = program
+        self.grid = grid
+        self.coordinates = coordinates
+        self.should_stop = should_stop
+
+    def run(self) -> None:
+        self.run_block(self.program.body)
+
+    def run_block(self, body: tuple) -> bool:
+        # returns False if execution was stopped
+        for node in body:
+            if self.should_stop():
+                return False
+
+            node_type = type(node)
+            if node_type is Move:
+                self.grid.move(node.direction.name, move_times(node))
+                self.coordinates.append(self.grid.get_coords())
+
+            elif node_type is Repeat:
+                for _ in range(node.times):
+                    if not self.run_block(node.body):
+                        return False
+
+            # IFBLOCK body runs only when we stand next to the border
+            elif node_type is If:
+                if self.grid.at_border(node.direction.name) and not self.run_block(node.body):
+                    return False
+
+            elif node_type is Call:
+                if not self.run_block(self.program.procedures[node.name]):
+                    return False
+
+        return True
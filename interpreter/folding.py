@@ -0,0 +1,216 @@
+from typing import Iterator, NamedTuple
+
+from interpreter import errors
+from interpreter.executor import move_times
+from interpreter.grid import DX, DY
+from interpreter.parser import Call, Move, Repeat
+
+
+class Fold(NamedTuple):
+    """
+    Summary of a loop without IFBLOCKs or of a straight block of commands
+    (times is 1 then). items are (direction, steps) moves
+    and nested Folds of one iteration, every iteration shifts the position
+    by (dx, dy). min_x..max_y are bounds of all positions visited by all
+    iterations relative to the position before the loop. offsets are
+    positions after every move of one iteration, they are known only if
+    there are no nested Folds. lines are source lines of items, loop is
+    False for straight blocks and procedures bodies, moves is the number
+    of positions of one iteration.
+    """
+    times: int
+    items: tuple
+    dx: int
+    dy: int
+    min_x: int
+    max_x: int
+    min_y: int
+    max_y: int
+    offsets: tuple | None
+    lines: tuple
+    loop: bool
+    moves: int
+
+
+def summarize_node(node, procedures: dict, cache: dict) -> tuple[int, int] | Fold | None:
+    """
+    Returns (direction, steps) for a move, Fold for a loop or a procedure
+    call and None if the node can't be folded: it is an IFBLOCK, has one
+    inside or it is a move that raises an error.
+    cache keeps Folds of procedures bodies.
+    """
+    node_type = type(node)
+    if node_type is Move:
+        try:
+            return node.direction.value, move_times(node)
+
+        except errors.Error:
+            return None
+
+    if node_type is Repeat:
+        return summarize(node.body, node.times, procedures, cache, True)
+
+    if node_type is Call:
+        if node.name not in cache:
+            cache[node.name] = summarize(procedures[node.name], 1, procedures, cache, False)
+        return cache[node.name]
+
+    return None
+
+
+def summarize(body: tuple, times: int, procedures: dict, cache: dict, loop: bool) -> Fold | None:
+    # Returns Fold for body repeated times or None if it can't be folded
+    items = []
+    for node in body:
+        item = summarize_node(node, procedures, cache)
+        if item is None:
+            return None
+        items.append(item)
+
+    return fold_items(items, times, [node.line for node in body], loop)
+
+
+def fold_items(items: list, times: int, lines: list, loop: bool = False) -> Fold:
+    offsets = []
+    x = y = min_x = max_x = min_y = max_y = moves = 0
+    for item in items:
+        if type(item) is not Fold:
+            direction, steps = item
+            x += DX[direction] * steps
+            y += DY[direction] * steps
+            moves += 1
+            if offsets is not None:
+                offsets.append((x, y))
+            min_x, max_x = min(min_x, x), max(max_x, x)
+            min_y, max_y = min(min_y, y), max(max_y, y)
+            continue
+
+        offsets = None
+        moves += item.moves * item.times
+        min_x, max_x = min(min_x, x + item.min_x), max(max_x, x + item.max_x)
+        min_y, max_y = min(min_y, y + item.min_y), max(max_y, y + item.max_y)
+        x += item.dx * item.times
+        y += item.dy * item.times
+
+    # Positions of the last iteration are the ones of the first shifted
+    # by (times - 1) * (dx, dy), others lie between them
+    shift_x, shift_y = (times - 1) * x, (times - 1) * y
+    return Fold(
+        times, tuple(items), x, y,
+        min_x + min(0, shift_x), max_x + max(0, shift_x),
+        min_y + min(0, shift_y), max_y + max(0, shift_y),
+        tuple(offsets) if offsets is not None else None,
+        tuple(lines), loop, moves,
+    )
+
+
+def fits(fold: Fold, x: int, y: int, size: int) -> bool:
+    return 0 <= x + fold.min_x and x + fold.max_x <= size and 0 <= y + fold.min_y and y + fold.max_y <= size
+
+
+def path(fold: Fold, x: int, y: int) -> Iterator[tuple[int, int]]:
+    # Lazily yields positions after every move of the loop without bounds checks
+    if fold.offsets is not None:
+        for _ in range(fold.times):
+            for offset_x, offset_y in fold.offsets:
+                yield x + offset_x, y + offset_y
+            x += fold.dx
+            y += fold.dy
+        return
+
+    for _ in range(fold.times):
+        for item in fold.items:
+            if type(item) is Fold:
+                yield from path(item, x, y)
+                x += item.dx * item.times
+                y += item.dy * item.times
+
+            else:
+                direction, steps = item
+                x += DX[direction] * steps
+                y += DY[direction] * steps
+                yield x, y
+
+
+def locate(fold: Fold, index: int) -> tuple[int, tuple[int, ...]]:
+    """
+    Source line of the move that gives the index-th position of path()
+    and numbers of iterations, from 1, of this and nested loops around it.
+    """
+    iteration, index = divmod(index, fold.moves)
+    iterations = (iteration + 1,) if fold.loop else ()
+    for item, line in zip(fold.items, fold.lines):
+        if type(item) is not Fold:
+            if not index:
+                return line, iterations
+            index -= 1
+            continue
+
+        positions = item.moves * item.times
+        if index < positions:
+            line, nested = locate(item, index)
+            return line, iterations + nested
+        index -= positions
+
+    raise IndexError("Fold has fewer positions")
+
+
+class Failure(NamedTuple):
+    # The move of a folded loop leaving the grid: index of the position it
+    # would make in path(), the position before it and the move itself
+    index: int
+    x: int
+    y: int
+    direction: int
+    steps: int
+
+
+def first_outside(low: int, high: int, step: int, size: int) -> int | None:
+    # First k with low + k * step .. high + k * step not within 0..size
+    if low < 0 or high > size:
+        return 0
+    if step > 0:
+        return (size - high) // step + 1
+    if step < 0:
+        return low // -step + 1
+    return None
+
+
+def failure(fold: Fold, x: int, y: int, size: int) -> Failure:
+    """
+    First move of path() leaving the grid, moves are straight, so a move
+    leaves the grid only if it ends outside. Every iteration is the first
+    one shifted by (dx, dy), so the first iteration leaving the grid
+    follows from the bounds of one iteration and only that iteration is
+    walked, nested Folds which fit are skipped as a whole.
+    """
+    # bounds of one iteration, see fold_items()
+    shift_x, shift_y = (fold.times - 1) * fold.dx, (fold.times - 1) * fold.dy
+    iterations = [
+        first_outside(x + fold.min_x - min(0, shift_x), x + fold.max_x - max(0, shift_x), fold.dx, size),
+        first_outside(y + fold.min_y - min(0, shift_y), y + fold.max_y - max(0, shift_y), fold.dy, size),
+    ]
+    iteration = min((iteration for iteration in iterations if iteration is not None), default=fold.times)
+    index = iteration * fold.moves
+    x += fold.dx * iteration
+    y += fold.dy * iteration
+    if iteration < fold.times:
+        for item in fold.items:
+            if type(item) is Fold:
+                if not fits(item, x, y, size):
+                    nested = failure(item, x, y, size)
+                    return nested._replace(index=index + nested.index)
+                index += item.moves * item.times
+                x += item.dx * item.times
+                y += item.dy * item.times
+                continue
+
+            direction, steps = item
+            new_x = x + DX[direction] * steps
+            new_y = y + DY[direction] * steps
+            if not (0 <= new_x <= size and 0 <= new_y <= size):
+                return Failure(index, x, y, direction, steps)
+            x, y = new_x, new_y
+            index += 1
+
+    raise IndexError("Fold fits the grid")
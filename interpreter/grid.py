@@ -1,57 +1,50 @@
 from interpreter import errors
 
+# Coordinates are allowed to be from 0 to GRID_SIZE inclusive by default,
+# other sizes are passed to Grid. Positions are stored as int32, see Trajectory
+GRID_SIZE = 20
+MAX_GRID_SIZE = 2 ** 31 - 1
+
+# Indexed by tokenizer.Opcode values of moves
+DIRECTIONS = ("RIGHT", "LEFT", "UP", "DOWN")
+DX = (1, -1, 0, 0)
+DY = (0, 0, 1, -1)
+STEPS = {direction: (DX[i], DY[i]) for i, direction in enumerate(DIRECTIONS)}
+
 
 class Grid:
-    def __init__(self, start_x=0, start_y=0):
+    def __init__(self, start_x=0, start_y=0, size=GRID_SIZE):
+        if not 1 <= size <= MAX_GRID_SIZE:
+            raise ValueError(f"Grid size must be between 1 and {MAX_GRID_SIZE}, got {size}")
         self.x = start_x
         self.y = start_y
-
-    def move(self, _direction: int, val: int) -> None:
+        self.size = size
+
+    def move(self, _direction: str, val: int) -> None:
+        step_x, step_y = STEPS[_direction]
+        new_x = self.x + step_x * val
+        new_y = self.y + step_y * val
+        if not (0 <= new_x <= self.size and 0 <= new_y <= self.size):
+            raise errors.GridOutOfBounceError(
+                f"Invalid direction. It must be between 0 and {self.size}. "
+                f"You can't "
+                f"move {_direction.lower()} {val} times. "
+                f"Your previous position: {self.get_coords()}")
+
+        self.x, self.y = new_x, new_y
+
+    def at_border(self, _direction: str) -> bool:
         match _direction:
             case "RIGHT":
-                if 0 <= (self.x + val) <= 20:
-                    self.x += val
-
-                else:
-                    raise errors.GridOutOfBounceError(
-                        f"Invalid direction. It must be between 0 and 20. "
-                        f"You can't "
-                        f"move right {val} times. "
-                        f"Your previous position: {self.get_coords()}")
-
+                return self.x >= self.size
             case "LEFT":
-                if 0 <= (self.x - val) <= 20:
-                    self.x -= val
-
-                else:
-                    raise errors.GridOutOfBounceError(
-                        f"Invalid direction. "
-                        f"It must be between 0 and 20. "
-                        f"You can't "
-                        f"move left {val} times. "
-                        f"Your previous position: {self.get_coords()}")
-
+                return self.x <= 0
             case "UP":
-                if 0 <= (self.y + val) <= 20:
-                    self.y += val
-
-                else:
-                    raise errors.GridOutOfBounceError(
-                        f"Invalid direction. It must be between 0 and 20. "
-                        f"You can't "
-                        f"move up {val} times. "
-                        f"Your previous position: {self.get_coords()}")
-
+                return self.y >= self.size
             case "DOWN":
-                if 0 <= (self.y - val) <= 20:
-                    self.y -= val
-
-                else:
-                    raise errors.GridOutOfBounceError(
-                        f"Invalid direction. It must be between 0 and 20. "
-                        f"You can't "
-                        f"move down {val} times. "
-                        f"Your previous position: {self.get_coords()}")
+                return self.y <= 0
+
+        return False
 
     def get_coords(self):
         return self.x, self.y
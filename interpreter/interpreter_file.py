@@ -1,5858 +1,416 @@
-from collections import defaultdict
+import functools
+import threading
+import time
+from typing import Callable, Iterable, Iterator, TYPE_CHECKING
 
-from interpreter import errors, grid
+from interpreter import compiler, errors, grid, parser, tokenizer, vm
+from interpreter.cache import DEFAULT_CACHE_SIZE, DiskCache, ProgramCache
+from interpreter.program import CompiledProgram, ExecutionContext
+from interpreter.source_map import SourceMap
+from interpreter.stats import ExecutionStats
+from interpreter.tokenizer import MOVES, Opcode
+from interpreter.trajectory import Trajectory, typecode_for
+
+if TYPE_CHECKING:
+    # concurrent.futures is slow to import and only execute_async() takes an executor
+    from concurrent.futures import Executor
+
+# Approximate number of positions iter_execute() computes before yielding them
+STREAM_CHUNK_SIZE = 4096
 
 
 class Interpreter:
     """
     Class represents simple interpreter. When u run the execute() method,
-    the interpreter declares all variables and procedures with get_variables()
-    and get_procedures() methods respectively. Then interpreter runs 2
-    parse methods,
-    to open all loops and procedures calls. After that, it'll have an
-    array of all static stuff and if-blocks.
+    the interpreter reads the file, tokenizes it once, then declares all variables
+    with get_variables() and builds a tree of loops, if-blocks and
+    procedures calls with parse(). compile() turns the tree into bytecode
+    with jumps for loops and if-blocks, which is run by the vm module.
+    Loops and procedures are never unrolled into a flat list of commands.
+    Compiled programs are kept in the LRU cache and, if cache_dir is given,
+    on disk, see cache module. Every run has its own ExecutionContext, see
+    program module. Coordinates are allowed to be from 0 to grid_size
+    inclusive, up to grid.MAX_GRID_SIZE.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE, cache_results: bool = False,
+                 cache_dir: str | None = None, grid_size: int = grid.GRID_SIZE):
+        # raises ValueError for a wrong size before anything is run
+        grid.Grid(size=grid_size)
+        self.grid_size = grid_size
         self.grid = None
         self.force_stop = False
+        # Compiled programs are cached by the source hash, so running the
+        # same program again skips everything before run_commands().
+        # With cache_results the path is cached too
+        self.cache = ProgramCache(cache_size)
+        self.cache_results = cache_results
+        # Directory shared between runs and processes, entries of other
+        # interpreter versions are ignored
+        self.disk_cache = DiskCache(cache_dir) if cache_dir is not None else None
+        self.source = ""
+        self.source_key = None
         self.commands = []
-        self.executable_commands = []
-        self.final_executable_commands = []
-        self.functions = defaultdict(list)
+        self.program = None
+        self.bytecode = None
+        self.compiled = None
+        self.functions = {}
         self.variables = {}
-        self.coordinates = [(0, 0)]
-        self.allowed_commands = ["RIGHT", "LEFT", "UP", "DOWN", "REPEAT", "ENDREPEAT", "IFBLOCK", "ENDIF",
-                                 "PROCEDURE", "ENDPROC", "SET"]
+        self.coordinates = self.trajectory([(0, 0)])
+        # compile_source() can be called from many threads
+        self.lock = threading.Lock()
+        # ExecutionStats and SourceMap of the current run, None if they are not collected
+        self.stats = None
+        self.source_map = None
+        # see set_trace()
+        self.trace = None
+        self.trace_every = 1
+        # Limits of the current run, see execute()
+        self.max_steps = None
+        self.timeout = None
+        self.deadline = None
 
     # Variables declaration
     def get_variables(self):
-        index = 0
-        while index < len(self.commands):
+        commands = []
+        for token in self.commands:
             if self.force_stop:
                 return 0
-            command = self.commands[index]
-            command_split = command.split()
-            if command_split[0] == "SET":
-                variable_name = command_split[1]
-                variable_value = command.split("=")[-1].strip()
-
-                try:
-
-                    variable_value = int(variable_value)
-                    if variable_value > 1000:
-                        raise errors.WrongSyntaxCommandError(
-                            "You can't declare a variable with value more than 1000"
-                        )
-                    self.variables[variable_name] = variable_value
-
-                except ValueError:
-                    if isinstance(variable_value, str):
-
-                        if self.variables.get(variable_value) is None:
-                            raise errors.NotDeclaredVariableError(
-                                f"No such variable: {variable_value}"
-                            )
-
-                        else:
-                            variable_value = self.variables.get(variable_value)
-
-                        if variable_value > 1000:
-                            raise errors.WrongSyntaxCommandError(
-                                "You can't declare a variable with value more than 1000"
-                            )
-                        self.variables[variable_name] = variable_value
-
-                self.commands.pop(index)
+            if token.opcode != Opcode.SET:
+                commands.append(token)
                 continue
 
-            else:
-                index += 1
-
-    def get_procedures(self):
-        index = 0
-        while index < len(self.commands):
-            if self.force_stop:
-                return 0
-            command_split = self.commands[index].split()
-            if command_split[0] == "PROCEDURE":
-                procedure_name = command_split[1]
-                if procedure_name in self.functions.keys():
-                    raise errors.ProcedureAlreadyDeclaredError(
-                        f"Procedure with name {procedure_name} is already "
-                        f"declared"
-                    )
-                procedure_body = []
-                index += 1
-
-                try:
-                    while self.commands[index] != "ENDPROC":
-                        if not self.commands[index].startswith("CALL"):
-                            procedure_body.append(self.commands[index])
-
-                        else:
-                            called_procedure = self.functions.get(self.commands[index].split()[1])
-                            if called_procedure is None:
-                                raise errors.ProcedureNotDeclaredError(
-                                    f"Procedure {self.commands[index].split()[1]} was not declared"
-                                )
-
-                            for procedure_command in called_procedure:
-                                procedure_body.append(procedure_command)
-
-                        index += 1
-
-                except IndexError:
-                    raise errors.ProcedureNotClosedError(
-                        f"Procedure {procedure_name} was never closed"
+            variable_name, variable_value = token.operand
+            if not isinstance(variable_value, int):
+                if self.variables.get(variable_value) is None:
+                    raise errors.NotDeclaredVariableError(
+                        f"No such variable: {variable_value}"
                     )
 
-                self.functions[procedure_name] = procedure_body
-                index += 1
-                continue
-
-            index += 1
-
-    def similar_command(self, command: str) -> str | None:
-        for allowed_command in self.allowed_commands:
-            if command in allowed_command and command != allowed_command:
-                return allowed_command
-
-        return None
-
-    def check_line(self, line: str) -> bool:
-        for command in self.allowed_commands:
-            if line in command and line != command:
-                return True
-
-        return False
-
-    def check_command(self, command):
-        command_split = command.split()
-        if len(command_split) == 0:
-            return True
-        command_title = command_split[0]
-
-        match command_title:
-            case "RIGHT" | "LEFT" | "UP" | "DOWN" | "REPEAT" | "PROCEDURE" | "IFBLOCK" | "CALL":
-                return len(command_split) == 2
-
-            case "ENDPROC" | "PROCEDURE" | "ENDIF" | "ENDREPEAT":
-                return len(command_split) == 1
+                variable_value = self.variables[variable_value]
+
+            if variable_value > 1000:
+                raise errors.WrongSyntaxCommandError(
+                    "You can't declare a variable with value more than 1000"
+                )
+            self.variables[variable_name] = variable_value
+
+        # Variables are global, so names can be replaced with values once
+        # for the whole program. Unknown names are kept and reported
+        # only if the command is actually reached
+        self.commands = [self.resolve_operand(token) for token in commands]
+
+    def resolve_operand(self, token: tokenizer.Token) -> tokenizer.Token:
+        if isinstance(token.operand, str) and (token.opcode in MOVES or token.opcode == Opcode.REPEAT):
+            value = self.variables.get(token.operand)
+            if value is not None:
+                return token._replace(operand=value)
+
+        return token
+
+    def parse(self) -> None:
+        self.program = parser.parse(self.commands)
+        self.functions = self.program.procedures
+
+    def compile(self) -> None:
+        self.bytecode = compiler.compile_program(self.program)
+
+    def set_trace(self, trace: vm.TraceHook | None, every: int = 1) -> None:
+        """
+        trace(line, opcode, position) is called for every executed move,
+        loop, IFBLOCK and call, or for every `every`-th of them. Traced
+        programs run without folding, opcodes are the compiler module ones.
+        None removes the hook.
+        """
+        if every < 1:
+            raise ValueError(f"Trace interval must be positive, got {every}")
+        self.trace = trace
+        self.trace_every = every
+
+    def context(self, keep_path: bool) -> ExecutionContext:
+        # Context of a run of the prepared program with settings of this interpreter
+        context = ExecutionContext(
+            self.compiled, keep_path, self.max_steps, trace=self.trace, trace_every=self.trace_every,
+            stats=self.stats, should_stop=lambda: self.force_stop, grid_size=self.grid_size,
+            source_map=self.source_map,
+        )
+        # the time limit includes reading and compiling the program
+        context.timeout, context.deadline = self.timeout, self.deadline
+        self.grid = context.grid
+        return context
+
+    def run_commands(self, keep_path: bool = True) -> None:
+        if (keep_path and self.cache_results and self.trace is None and self.max_steps is None
+                and self.source_map is None):
+            result = self.cache.get_result(self.source_key, self.grid_size)
+            if result is not None:
+                self.coordinates = result
+                self.grid.x, self.grid.y = result[-1]
+                return
+
+        context = self.context(keep_path)
+        try:
+            context.run()
 
-            case "SET":
-                return len(command_split) == 4
+        finally:
+            self.coordinates = context.coordinates
 
-        if self.check_line(command_title):
-            possible_command = self.similar_command(command_title)
-            if possible_command is not None:
-                raise errors.NoSuchCommandError(f"No such command: "
-                                                f"{command_title}. "
-                                                f"Maybe you ment "
-                                                f"{possible_command}")
+        if keep_path and context.finished and self.cache_results:
+            self.cache.put_result(self.source_key, self.grid_size, self.coordinates)
 
-        else:
-            raise errors.NoSuchCommandError(f"No such command: "
-                                            f"{command_title}")
+    def timed(self, phase: str, method: Callable, *args) -> None:
+        # Runs one phase and records its time if stats are collected
+        if self.stats is None:
+            method(*args)
+            return
 
-    def check_commands(self):
-        for command_line in self.commands:
-            self.check_command(command_line)
+        start = time.perf_counter()
+        try:
+            method(*args)
 
-    @staticmethod
-    def check_repeat_loop_declaration(split_command):
-        if len(split_command) != 2:
-            raise errors.IncorrectRepeatDeclarationError(
-                "Your loop is declared incorrectly. "
-                "It must be like: REPEAT <X>"
-            )
+        finally:
+            self.stats.phases[phase] = time.perf_counter() - start
 
-    @staticmethod
-    def check_repeat_loops(commands_array):
-        # Check if there is a not closed or not opened repeat cycle error
-        count_repeat = 0
-        count_endrepeat = 0
+    def reset(self) -> None:
+        self.source = ""
+        self.source_key = None
+        self.commands = []
+        self.program = None
+        self.bytecode = None
+        self.compiled = None
+        self.functions = {}
+        self.variables = {}
+        self.coordinates = self.trajectory([(0, 0)])
+        self.grid = grid.Grid(start_x=0, start_y=0, size=self.grid_size)
+
+    def trajectory(self, points) -> Trajectory:
+        return Trajectory(points, typecode_for(self.grid_size))
+
+    def prepare(self, program_file: str) -> None:
+        # Runs all phases before run_commands()
+        self.reset()
+        self.timed("load", self.load_file, program_file)
+        self.build()
+
+    def prepare_stream(self, stream: Iterable[str | bytes]) -> None:
+        # Same as prepare(), but the program is read from lines of stream
+        self.reset()
+        self.timed("load", self.load_stream, stream)
+        self.build()
+
+    def prepare_source(self, source: str) -> None:
+        self.reset()
+        self.source = source
+        self.build()
+
+    def build(self) -> None:
+        if self.cache.maxsize > 0:
+            self.source_key = self.cache.key(self.source)
+            compiled = self.cache.get(self.source_key)
+            if compiled is not None:
+                self.use_compiled(compiled, "memory")
+                return
+
+        if self.disk_cache is not None:
+            compiled = self.disk_cache.get(self.disk_cache.key(self.source))
+            if compiled is not None:
+                self.use_compiled(compiled, "disk")
+                if self.source_key is not None:
+                    self.cache.put(self.source_key, compiled)
+                return
+
+        self.timed("tokenize", self.tokenize)
+        if self.stats is not None:
+            self.stats.tokens = len(self.commands)
+        if not self.force_stop:
+            self.timed("get_variables", self.get_variables)
+        if not self.force_stop:
+            self.timed("parse", self.parse)
+        if not self.force_stop:
+            self.timed("compile", self.compile)
+        if self.force_stop:
+            return
+
+        compiled = self.compiled = CompiledProgram(self.variables, self.program, self.bytecode)
+        if self.source_key is not None:
+            self.cache.put(self.source_key, compiled)
+        if self.disk_cache is not None:
+            self.disk_cache.put(self.disk_cache.key(self.source), compiled)
+
+    def use_compiled(self, compiled: CompiledProgram, cache: str) -> None:
+        self.compiled = compiled
+        self.variables, self.program, self.bytecode = compiled
+        self.functions = self.program.procedures
+        if self.stats is not None:
+            self.stats.cache = cache
+
+    def compile_source(self, source: str) -> CompiledProgram:
+        """
+        Returns the compiled program, it can be run by ExecutionContexts
+        from any number of threads. Unlike execute() and others, which keep
+        the state of the last run in the interpreter, it can be called from
+        many threads.
+        """
+        with self.lock:
+            self.prepare_source(source)
+            return self.compiled
+
+    def tokenize(self) -> None:
+        self.commands = tokenizer.tokenize(self.source.splitlines())
+
+    def execute(self, program_file: str, keep_path: bool = True, stats: ExecutionStats | None = None,
+                max_steps: int | None = None, timeout: float | None = None,
+                source_map: SourceMap | None = None) -> (
+            None | errors.Error | Trajectory
+    ):
+        """
+        With keep_path=False only the final position is returned.
+        If stats is given it is filled with timings and counters of the run,
+        also when the program fails. If source_map is given and the path is
+        kept, it tells the line and loop iterations of every position.
+        If the program makes more than max_steps moves or runs longer than
+        timeout seconds, ExecutionLimitError with the path made so far is raised.
+        """
+        return self.execute_with(self.prepare, program_file, keep_path, stats, max_steps, timeout, source_map)
+
+    def execute_stream(self, stream: Iterable[str | bytes], keep_path: bool = True,
+                       stats: ExecutionStats | None = None, max_steps: int | None = None,
+                       timeout: float | None = None, source_map: SourceMap | None = None) -> Trajectory:
+        # Runs program from any iterable of lines, e.g. an opened file or io.StringIO
+        return self.execute_with(self.prepare_stream, stream, keep_path, stats, max_steps, timeout, source_map)
+
+    def execute_source(self, source: str, keep_path: bool = True, stats: ExecutionStats | None = None,
+                       max_steps: int | None = None, timeout: float | None = None,
+                       source_map: SourceMap | None = None) -> Trajectory:
+        # Runs program from a string without touching the filesystem
+        return self.execute_with(self.prepare_source, source, keep_path, stats, max_steps, timeout, source_map)
+
+    def execute_with(self, prepare: Callable, program, keep_path: bool, stats: ExecutionStats | None,
+                     max_steps: int | None, timeout: float | None,
+                     source_map: SourceMap | None = None) -> Trajectory:
+        self.stats = stats
+        self.source_map = source_map
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        try:
+            prepare(program)
+            if not self.force_stop:
+                self.timed("run", self.run_commands, keep_path)
 
-        for string in commands_array:
-            if string.startswith("REPEAT"):
-                count_repeat += 1
+        finally:
+            if stats is not None:
+                self.collect_stats(keep_path)
+            self.stats = self.source_map = None
+            self.max_steps = self.timeout = self.deadline = None
 
-            if string.startswith("ENDREPEAT"):
-                count_endrepeat += 1
+        return self.coordinates
 
-        if count_repeat > count_endrepeat:
-            raise errors.RepeatNotClosedError(
-                "Your repeat cycle is not closed"
+    def collect_stats(self, keep_path: bool) -> None:
+        stats = self.stats
+        stats.source_lines = len(self.source.splitlines())
+        stats.variables = len(self.variables)
+        stats.procedures = len(self.functions)
+        if self.bytecode is not None:
+            stats.instructions = len(self.bytecode.code) // 2
+            stats.folds = len(self.bytecode.folds)
+        stats.path_length = len(self.coordinates)
+        if keep_path and "run" in stats.phases:
+            stats.moves = len(self.coordinates) - 1
+
+    async def execute_async(self, source: str, keep_path: bool = True, max_steps: int | None = None,
+                            timeout: float | None = None, executor: "Executor | None" = None,
+                            yield_every: int = 1) -> Trajectory:
+        """
+        Runs program from a string without blocking the event loop. The
+        program is compiled here through the same caches as execute(),
+        then run either in this thread, giving control back to the loop
+        every yield_every stop checks (see ExecutionContext.run_async()),
+        or in executor, e.g. a ProcessPoolExecutor for long programs.
+        The state of the run is not kept in the interpreter, so any number
+        of runs can be awaited at once.
+        """
+        compiled = self.compile_source(source)
+        if compiled is None:
+            return self.trajectory([(0, 0)])
+
+        if executor is not None:
+            import asyncio
+
+            run = functools.partial(
+                compiled.run, keep_path, max_steps=max_steps, timeout=timeout, grid_size=self.grid_size
             )
+            return await asyncio.get_running_loop().run_in_executor(executor, run)
+
+        context = ExecutionContext(
+            compiled, keep_path, max_steps, timeout, should_stop=lambda: self.force_stop, grid_size=self.grid_size
+        )
+        return await context.run_async(yield_every)
+
+    def iter_execute(self, program_file: str, chunk_size: int = STREAM_CHUNK_SIZE,
+                     source_map: SourceMap | None = None) -> Iterator[tuple[int, int]]:
+        """
+        Same as execute(), but yields positions while the program runs.
+        The path is not kept in self.coordinates, to cancel the run just
+        close the generator. source_map counts positions from the first
+        yielded one.
+        """
+        self.prepare(program_file)
+        yield from self.iter_run(chunk_size, source_map)
+
+    def iter_execute_source(self, source: str, chunk_size: int = STREAM_CHUNK_SIZE,
+                            source_map: SourceMap | None = None) -> Iterator[tuple[int, int]]:
+        # Same as iter_execute(), but the program is given as a string
+        self.prepare_source(source)
+        yield from self.iter_run(chunk_size, source_map)
+
+    def iter_run(self, chunk_size: int, source_map: SourceMap | None = None) -> Iterator[tuple[int, int]]:
+        for chunk in self.iter_chunks(chunk_size, source_map):
+            yield from chunk
+
+    def iter_chunks(self, chunk_size: int = STREAM_CHUNK_SIZE,
+                    source_map: SourceMap | None = None) -> Iterator[Trajectory]:
+        """
+        Runs the program given to prepare() or prepare_source() like
+        iter_execute(), but yields Trajectory chunks of about chunk_size
+        positions instead of single ones, for consumers which would spend
+        more time on every position than the machine does.
+        """
+        if self.compiled is None:
+            return
+
+        self.source_map = source_map
+        try:
+            context = self.context(True)
 
-    def first_parse(self, commands_array) -> None | errors.Error:
-        index = 0
-        self.check_repeat_loops(commands_array)
-
-        while index < len(commands_array):
-            if self.force_stop:
-                return 0
-            command = commands_array[index]
-            split_command = command.split()
-            # ########################LOOPS##############################
-            # 1st loop
-            if split_command[0] == "REPEAT":
-                self.check_repeat_loop_declaration(split_command)
-                n1 = split_command[1]
-
-                check_n1 = None
-
-                try:
-                    check_n1 = int(n1)
-
-                except ValueError:
-                    if isinstance(n1, str):
-                        check_n1 = self.variables.get(n1)
-                        if check_n1 is None:
-                            raise errors.NotDeclaredVariableError(
-                                f"No such variable: {n1}"
-                            )
-
-                finally:
-                    if check_n1 is None:
-                        raise errors.SomethingWentWrongError(
-                            "Something went wrong"
-                        )
-
-                    n1 = check_n1
-
-                if n1 == 0:
-                    raise errors.EndlessRepeatError(
-                        "You can't create an endless repeat. "
-                        "Change your repeat times number to a "
-                        "number more then 0"
-                    )
-
-                if n1 < 0:
-                    raise errors.IncorrectRepeatDeclarationError(
-                        "You can't create a repeat cycle with "
-                        "with negative repeat times number"
-                    )
-
-                if n1 > 1000:
-                    raise errors.WrongSyntaxCommandError(
-                        "Maximum value for repeat loop times is 1000"
-                    )
-
-                cycle_body1 = []
-                index += 1
-                while commands_array[index] != "ENDREPEAT":
-                    command1 = commands_array[index]
-                    split_command1 = command1.split()
-                    ################################################
-                    # 2 nest loop
-                    if split_command1[0] == "REPEAT":
-                        self.check_repeat_loop_declaration(split_command1)
-                        n2 = split_command1[1]
-
-                        check_n2 = None
-
-                        try:
-                            check_n2 = int(n2)
-
-                        except ValueError:
-                            if isinstance(n2, str):
-                                check_n2 = self.variables.get(n2)
-                                if check_n2 is None:
-                                    raise errors.NotDeclaredVariableError(
-                                        f"No such variable: {n2}"
-                                    )
-
-                        finally:
-                            if check_n2 is None:
-                                raise errors.SomethingWentWrongError(
-                                    "Something went wrong"
-                                )
-
-                            n2 = check_n2
-
-                        if n2 == 0:
-                            raise errors.EndlessRepeatError(
-                                "You can't create an endless repeat "
-                                "Change your repeat times number to a "
-                                "number more then 0"
-                            )
-
-                        if n2 < 0:
-                            raise errors.IncorrectRepeatDeclarationError(
-                                "You can't create a repeat cycle with "
-                                "with negative repeat times number"
-                            )
-
-                        if n2 > 1000:
-                            raise errors.WrongSyntaxCommandError(
-                                "Maximum value for repeat loop times is 1000"
-                            )
-
-                        cycle_body2 = []
-                        index += 1
-                        # while we haven't quited 2 loop
-                        while commands_array[index] != "ENDREPEAT":
-                            command2 = commands_array[index]
-                            split_command2 = command2.split()
-                            # --------------------------------------------
-                            # last 3rd nested loop
-                            if split_command2[0] == "REPEAT":
-                                # we've found 3rd (last) loop
-                                self.check_repeat_loop_declaration(split_command2)
-                                n3 = split_command[1]
-
-                                check_n3 = None
-
-                                try:
-                                    check_n3 = int(n3)
-
-                                except ValueError:
-                                    if isinstance(n3, str):
-                                        check_n3 = self.variables.get(n3)
-                                        if check_n3 is None:
-                                            raise errors.NotDeclaredVariableError(
-                                                f"No such variable: {n3}"
-                                            )
-
-                                finally:
-                                    if check_n3 is None:
-                                        raise errors.SomethingWentWrongError(
-                                            "Something went wrong"
-                                        )
-
-                                    n3 = check_n3
-
-                                if n3 == 0:
-                                    raise errors.EndlessRepeatError(
-                                        "You can't create an endless repeat "
-                                        "Change your repeat times number to a "
-                                        "number more then 0"
-                                    )
-
-                                if n3 < 0:
-                                    raise (
-                                        errors.
-                                        IncorrectRepeatDeclarationError(
-                                            "You can't create a repeat cycle "
-                                            "with "
-                                            "with negative repeat times "
-                                            "number"
-                                        ))
-
-                                if n3 > 1000:
-                                    raise errors.WrongSyntaxCommandError(
-                                        "Maximum value for repeat loop times is 1000"
-                                    )
-
-                                cycle_body3 = []
-                                index += 1
-                                while commands_array[index] != "ENDREPEAT":
-                                    if (
-                                            commands_array[index].split()[0] in
-                                            ["REPEAT", "CALL", "IFBLOCK"]
-                                    ):
-                                        raise (
-                                            errors.Increasing3NestedCallsError(
-                                                "You've increased 3 nested "
-                                                "calls rule"
-                                            )
-                                        )
-
-                                    cycle_body3.append(commands_array[index])
-                                    index += 1
-
-                                    if index >= len(commands_array):
-                                        raise errors.RepeatNotClosedError(
-                                            "Your repeat cycle is not closed"
-                                        )
-
-                                # escaping from "ENDREPEAT" in 3rd loop
-                                index += 1
-                                # Adding elements from 3rd loop
-                                # n3 times to 2nd loop's body
-                                for _ in range(n3):
-                                    for elem in cycle_body3:
-                                        if not elem.startswith("CALL"):
-                                            cycle_body2.append(elem)
-
-                                        else:
-                                            procedure3 = self.functions.get(elem.split()[1])
-                                            if procedure3 is None:
-                                                raise errors.ProcedureNotDeclaredError(
-                                                    f"No such procedure {elem.split()[1]}"
-                                                )
-
-                                            for procedure_command3 in procedure3:
-                                                cycle_body2.append(procedure_command3)
-                                # 3 nest done
-                            # ---------------------------------------------#
-                            # continuing 2 nest
-                            ################################################
-                            else:  # We quited 3rd loop, and now we're
-                                # able to continue working with 2nd loop
-                                cycle_body2.append(commands_array[index])
-                                index += 1
-
-                            if index >= len(commands_array):
-                                raise errors.RepeatNotClosedError(
-                                    "Your repeat cycle is not closed"
-                                )
-
-                        index += 1  # escaping from "ENDREPEAT" in 2nd loop
-                        # Our 2nd loop has ended. Now we have to
-                        # add elements from cycle2 n2 times to cycle1
-                        for _ in range(n2):
-                            for elem in cycle_body2:
-                                if not elem.startswith("CALL"):
-                                    cycle_body1.append(elem)
-
-                                else:
-                                    procedure2 = self.functions.get(elem.split()[1])
-                                    if procedure2 is None:
-                                        raise errors.ProcedureNotDeclaredError(
-                                            f"No such procedure {elem.split()[1]}"
-                                        )
-
-                                    for procedure_command2 in procedure2:
-                                        cycle_body1.append(procedure_command2)
-
-                    #####################################################
-                    # continuing 1st nest
-                    else:  # We quited 2nd loop, and now we're able to
-                        # continue working with 1st loop
-                        cycle_body1.append(commands_array[index])
-                        index += 1
-
-                    if index >= len(commands_array):
-                        return errors.RepeatNotClosedError(
-                            "Your repeat cycle is not closed"
-                        )
-
-                index += 1  # escaping from "ENDREPEAT" in 1st loop
-                for _ in range(n1):
-                    for elem in cycle_body1:
-                        if not elem.startswith("CALL"):
-                            self.executable_commands.append(elem)
-
-                        else:
-                            procedure = self.functions.get(elem.split()[1])
-                            if procedure is None:
-                                raise errors.ProcedureNotDeclaredError(
-                                    f"No procedure {elem.split()[1]}"
-                                )
-
-                            for procedure_command in procedure:
-                                self.executable_commands.append(procedure_command)
-
-                continue
-
-            # ########################LOOPS##############################
-
-            # Skip PROCEDURES declaration
-            elif split_command[0] == "PROCEDURE":
-                index += 1
-                while commands_array[index] != "ENDPROC":
-                    index += 1
-
-                index += 1
-                continue
-
-            # Working with procedures calling
-            elif split_command[0] == "CALL":
-                procedure_name1 = split_command[1]
-
-                if procedure_name1 not in self.functions.keys():
-                    raise errors.ProcedureNotDeclaredError(
-                        f"No procedure with name {procedure_name1}"
-                    )
-
-                call_cycle1 = []
-                for elem1 in self.functions[procedure_name1]:
-                    elem_split1 = elem1.split()
-                    # Case we found 2nd func call
-                    if elem_split1[0] == "CALL":
-                        procedure_name2 = elem_split1[1]
-
-                        if procedure_name2 not in self.functions.keys():
-                            raise errors.ProcedureNotDeclaredError(
-                                f"No procedure with name {procedure_name2}"
-                            )
-
-                        call_cycle2 = []
-                        for elem2 in self.functions[procedure_name2]:
-                            elem_split2 = elem2.split()
-                            # Case we found 3rd procedure call
-                            if elem_split2[0] == "CALL":
-                                procedure_name3 = elem_split2[1]
-
-                                if (procedure_name3 not in
-                                        self.functions.keys()):
-                                    raise errors.ProcedureNotDeclaredError(
-                                        f"No procedure with name "
-                                        f"{procedure_name3}"
-                                    )
-
-                                call_cycle3 = []
-                                for elem3 in self.functions[procedure_name3]:
-                                    if elem3.split()[0] in ["CALL", "REPEAT", "IFBLOCK"]:
-                                        raise (
-                                            errors.Increasing3NestedCallsError(
-                                                "You've increased 3 nested "
-                                                "calls rule"
-                                            )
-                                        )
-
-                                    call_cycle3.append(elem3)
-
-                                for called3 in call_cycle3:
-                                    call_cycle2.append(called3)
-
-                            # We're done with 3rd procedure call
-                            else:
-                                call_cycle2.append(elem2)
-
-                        for called2 in call_cycle2:
-                            call_cycle1.append(called2)
-
-                    #  we're done with second func call
-                    else:
-                        call_cycle1.append(elem1)
-
-                # Now, let's add all commands from cycle1 to the main array
-                for c in call_cycle1:
-                    self.executable_commands.append(c)
-
-            # End of working with procedures calling
-
-            else:
-                if self.check_command(command):
-                    self.executable_commands.append(command)
-
-            index += 1
-
-    def second_parse(self):
-        index = 0
-        # Check if there is a not closed or not opened repeat cycle error
-        count_repeat = 0
-        count_endrepeat = 0
-
-        for string in self.executable_commands:
-            if string.startswith("REPEAT"):
-                count_repeat += 1
+        finally:
+            self.source_map = None
+        self.coordinates = context.coordinates
+        yield from context.iter_chunks(chunk_size)
 
-            if string.startswith("ENDREPEAT"):
-                count_endrepeat += 1
+    def load_file(self, program_file: str) -> None:
 
-        if count_repeat != count_endrepeat:
-            raise errors.RepeatNotClosedError(
-                "Your repeat cycle is not closed"
+        suffix = program_file.split(".")[-1]
+        if suffix != "txt":
+            raise errors.FileReadingError(
+                f"You can't open .{suffix} file. The only acceptable format is .txt"
             )
-        while index < len(self.executable_commands):
-            if self.force_stop:
-                return 0
-            command = self.executable_commands[index]
-            split_command = command.split()
-            # ########################LOOPS##############################
-            # 1st loop
-            if split_command[0] == "REPEAT":
-                self.check_repeat_loop_declaration(split_command)
-                n1 = split_command[1]
-
-                check_n1 = None
-
-                try:
-                    check_n1 = int(n1)
-
-                except ValueError:
-                    if isinstance(n1, str):
-                        check_n1 = self.variables.get(n1)
-                        if check_n1 is None:
-                            raise errors.NotDeclaredVariableError(
-                                f"No such variable: {n1}"
-                            )
-
-                finally:
-                    if check_n1 is None:
-                        raise errors.SomethingWentWrongError(
-                            "Something went wrong"
-                        )
-
-                    n1 = check_n1
-
-                if n1 == 0:
-                    raise errors.EndlessRepeatError(
-                        "You can't create an endless repeat"
-                        "Change your repeat times number to a "
-                        "number more then 0"
-                    )
-
-                if n1 < 0:
-                    raise errors.EndlessRepeatError(
-                        "You can't create an endless repeat"
-                        "Change your repeat times number to a "
-                        "number more then 0"
-                    )
-
-                if n1 > 1000:
-                    raise errors.WrongSyntaxCommandError(
-                        "Maximum value for repeat loop times is 1000"
-                    )
-
-                cycle_body1 = []
-                index += 1
-                while self.executable_commands[index] != "ENDREPEAT":
-                    command1 = self.executable_commands[index]
-                    split_command1 = command1.split()
-                    ########################################################
-                    # 2 nest loop
-                    if split_command1[0] == "REPEAT":
-                        self.check_repeat_loop_declaration(split_command1)
-                        n2 = split_command1[1]
-
-                        check_n2 = None
-
-                        try:
-                            check_n2 = int(n2)
-
-                        except ValueError:
-                            if isinstance(n2, str):
-                                check_n2 = self.variables.get(n2)
-                                if check_n2 is None:
-                                    raise errors.NotDeclaredVariableError(
-                                        f"No such variable: {n2}"
-                                    )
-
-                        finally:
-                            if check_n2 is None:
-                                raise errors.SomethingWentWrongError(
-                                    "Something went wrong"
-                                )
-
-                            n2 = check_n2
-
-                        if n2 == 0:
-                            raise errors.EndlessRepeatError(
-                                "You can't create an endless repeat"
-                                "Change your repeat times number to a "
-                                "number more then 0"
-                            )
-
-                        if n2 < 0:
-                            raise errors.EndlessRepeatError(
-                                "You can't create an endless repeat"
-                                "Change your repeat times number to a "
-                                "number more then 0"
-                            )
-
-                        if n2 > 1000:
-                            raise errors.WrongSyntaxCommandError(
-                                "Maximum value for repeat loop times is 1000"
-                            )
-
-                        cycle_body2 = []
-                        index += 1
-                        while self.executable_commands[index] != "ENDREPEAT":
-                            # while we haven't quited 2 loop
-                            command2 = self.executable_commands[index]
-                            split_command2 = command2.split()
-                            # ----------------------------------------------#
-                            # last 3rd nested loop
-                            if split_command2[0] == "REPEAT":
-                                # we've found 3rd (last) loop
-                                self.check_repeat_loop_declaration(split_command2)
-                                n3 = split_command2[1]
-
-                                check_n3 = None
-
-                                try:
-                                    check_n3 = int(n3)
-
-                                except ValueError:
-                                    if isinstance(n3, str):
-                                        check_n3 = self.variables.get(n3)
-                                        if check_n3 is None:
-                                            raise errors.NotDeclaredVariableError(
-                                                f"No such variable: {n3}"
-                                            )
-
-                                finally:
-                                    if check_n3 is None:
-                                        raise errors.SomethingWentWrongError(
-                                            "Something went wrong"
-                                        )
-
-                                    n3 = check_n3
-
-                                if n3 == 0:
-                                    raise errors.EndlessRepeatError(
-                                        "You can't create an endless repeat"
-                                        "Change your repeat times number to a "
-                                        "number more then 0"
-                                    )
-
-                                if n3 < 0:
-                                    raise errors.EndlessRepeatError(
-                                        "You can't create an endless repeat"
-                                        "Change your repeat times number to a "
-                                        "number more then 0"
-                                    )
-
-                                if n3 > 1000:
-                                    raise errors.WrongSyntaxCommandError(
-                                        "Maximum value for repeat loop times is 1000"
-                                    )
-
-                                cycle_body3 = []
-                                index += 1
-                                this_comm = self.executable_commands[index]
-                                while this_comm != "ENDREPEAT":
-                                    if (
-                                        self.executable_commands[index]. split()[0] in
-                                            ["REPEAT", "CALL", "IFBLOCK"]
-                                    ):
-                                        raise (
-                                            errors.
-                                            Increasing3NestedCallsError(
-                                                "You've increased 3 nested "
-                                                "calls rule"
-                                            )
-                                        )
-
-                                    cycle_body3.append(
-                                        self.executable_commands[index]
-                                    )
-
-                                    index += 1
-
-                                    if index >= len(self.executable_commands):
-                                        raise errors.RepeatNotClosedError(
-                                            "Your repeat cycle is not closed"
-                                        )
-                                    this_comm = self.executable_commands[index]
-                                # escaping from "ENDREPEAT" in 3rd loop
-                                index += 1
-                                # Adding elements from 3rd loop n3 times
-                                # to 2nd loop's body
-                                for _ in range(n3):
-                                    for elem in cycle_body3:
-                                        cycle_body2.append(elem)
-                                # 3 nest done
-                            # ---------------------------------------------#
-                            # continuing 2 nest
-                            ################################################
-                            else:  # We quited 3rd loop, and now we're able to
-                                # continue working with 2nd loop
-                                cycle_body2.append(
-                                    self.executable_commands[index]
-                                )
-
-                                index += 1
-
-                                if index >= len(self.executable_commands):
-                                    raise errors.RepeatNotClosedError(
-                                        "Your repeat cycle is not closed"
-                                    )
-
-                        index += 1  # escaping from "ENDREPEAT" in 2nd loop
-                        # Our 2nd loop has ended. Now we have to
-                        # add elements from cycle2 n2 times to cycle1
-                        for _ in range(n2):
-                            for elem in cycle_body2:
-                                cycle_body1.append(elem)
-
-                    #####################################################
-                    # continuing 1st nest
-                    else:  # We quited 2nd loop, and now we're able to
-                        # continue working with 1st loop
-                        cycle_body1.append(self.executable_commands[index])
-
-                        index += 1
-
-                        if index >= len(self.executable_commands):
-                            raise errors.RepeatNotClosedError(
-                                "Your repeat cycle was never closed"
-                            )
-
-                index += 1  # escaping from "ENDREPEAT" in 1st loop
-                for _ in range(n1):
-                    for elem in cycle_body1:
-                        self.final_executable_commands.append(elem)
-
-                continue
 
-            # ########################LOOPS#############################
-            else:
-                if self.check_command(command):
-                    self.final_executable_commands.append(command)
-
-            index += 1
-
-    def check_ifblocks(self):
-        count_if_blocks = 0
-        count_endif_blocks = 0
-
-        for command in self.final_executable_commands:
-            if command.startswith("IFBLOCK"):
-                count_if_blocks += 1
-
-            if command == "ENDIF":
-                count_endif_blocks += 1
+        try:
+            with open(program_file, "r") as file:
+                self.source = file.read()
 
-        if count_if_blocks > count_endif_blocks:
-            raise errors.IFBlockNotClosedError(
-                f"{count_if_blocks - count_endif_blocks} of your ifblocks are not closed"
-            )
+        except (OSError, UnicodeDecodeError):
+            raise errors.FileReadingError("Error during reading your file")
 
-        if count_if_blocks < count_endif_blocks:
-            raise errors.WrongSyntaxCommandError(
-                "You have wrong syntax with endif"
+    def load_stream(self, stream: Iterable[str | bytes]) -> None:
+        try:
+            self.source = "\n".join(
+                (line.decode("utf-8") if isinstance(line, bytes) else line).rstrip("\r\n") for line in stream
             )
 
-    def run_commands(self) -> None:
-        index = 0
-        self.check_ifblocks()
-        while index < len(self.final_executable_commands):
-            if self.force_stop:
-                return 0
-            command = self.final_executable_commands[index]
-            command_split = command.split()
-            if command_split[0] in ["UP", "DOWN", "RIGHT", "LEFT"]:
-                times_to_move = command_split[1]
-
-                check_time_to_move = None
-
-                try:
-                    check_time_to_move = int(times_to_move)
-
-                except ValueError:
-                    check_time_to_move = self.variables.get(times_to_move)
-                    if check_time_to_move is None:
-                        raise errors.NotDeclaredVariableError(
-                            f"Variable {times_to_move} is not declared"
-                        )
-
-                finally:
-                    if check_time_to_move is None:
-                        raise errors.SomethingWentWrongError(
-                            "Something went wrong"
-                        )
-
-                    times_to_move = int(check_time_to_move)
-
-                    if times_to_move <= 0 or times_to_move > 1000:
-                        raise errors.WrongSyntaxCommandError(
-                            f"You can't move {command_split[0]} {times_to_move} times"
-                        )
-
-                    self.grid.move(command_split[0], times_to_move)
-                    self.coordinates.append(self.grid.get_coords())
-                    index += 1
-                    continue
-
-            # first ifblock
-            # ###################################################################################1
-            if command_split[0] == "IFBLOCK":
-                block_direction = command_split[1]
-                if block_direction is None:
-                    raise errors.WrongSyntaxCommandError(
-                        "You can't check ifblock without provided direction"
-                    )
-
-                index += 1
-                if block_direction == "UP":
-                    if self.grid.y < 20:
-                        while self.final_executable_commands[index] != "ENDIF":
-                            index += 1
-                        index += 1
-                        continue
-
-                    else:
-                        command1 = self.final_executable_commands[index]
-                        command1_split = command1.split()
-                        if command1_split[0] in ["UP", "DOWN", "RIGHT", "LEFT"]:
-                            times_to_move1 = command1_split[1]
-                            check_times_to_move1 = None
-
-                            try:
-                                check_times_to_move1 = int(times_to_move1)
-
-                            except ValueError:
-                                check_times_to_move1 = self.variables.get(times_to_move1)
-                                if check_times_to_move1 is None:
-                                    raise errors.NotDeclaredVariableError(
-                                        f"No such variable: {times_to_move1}"
-                                    )
-
-                            finally:
-                                if check_times_to_move1 is None:
-                                    raise errors.SomethingWentWrongError(
-                                        "Something went wrong"
-                                    )
-
-                                times_to_move1 = check_times_to_move1
-
-                                if times_to_move1 <= 0 or times_to_move1 > 1000:
-                                    raise errors.WrongSyntaxCommandError(
-                                        f"You can't move {command1_split[0]} {times_to_move1} "
-                                        f"times"
-                                    )
-
-                                self.grid.move(command1_split[0], times_to_move1)
-                                self.coordinates.append(self.grid.get_coords())
-                                index += 1
-                                continue
-
-                        # first ifblock up -> second ifblock
-                        # #######################################################################2
-                        elif command1_split[0] == "IFBLOCK":
-                            block_direction1 = command1_split[1]
-                            if block_direction1 is None:
-                                raise errors.WrongSyntaxCommandError(
-                                    "You can't check ifblock without provided direction"
-                                )
-
-                            index += 1
-                            # first ifblock up -> second ifblock up
-                            if block_direction1 == "UP":
-                                if self.grid.y < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock up -> second ifblock up -> third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] == ["IFBLOCK",
-                                                                           "CALL", "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while (self.final_executable_commands[index]
-                                                       != "ENDIF"):
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "CALL",
-                                                                           "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "REPEAT",
-                                                                           "CALL"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock up -> second ifblock down
-                            if block_direction1 == "DOWN":
-                                if self.grid.y > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock up -> second ifblock up -> third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "CALL", "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "CALL", "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "CALL", "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock up ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "CALL",
-                                                                           "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock up -> second ifblock right
-                            if block_direction1 == "RIGHT":
-                                if self.grid.x < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock up -> second ifblock right -> third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock up -> second ifblock right ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["IFBLOCK", "CALL", "REPEAT"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock right ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock right ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock right ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock up -> second ifblock left
-                            if block_direction1 == "LEFT":
-                                if self.grid.x > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock up -> second ifblock left ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock up -> second ifblock left ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock left ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock left ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock up -> second ifblock left ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                #  continuing first ifblock down
-                # ###############################################################################1
-                if block_direction == "DOWN":
-                    if self.grid.y > 0:
-                        while self.final_executable_commands[index] != "ENDIF":
-                            index += 1
-                        index += 1
-                        continue
-
-                    else:
-                        command1 = self.final_executable_commands[index]
-                        command1_split = command1.split()
-                        if command1_split[0] in ["UP", "DOWN", "RIGHT", "LEFT"]:
-                            times_to_move1 = command1_split[1]
-                            check_times_to_move1 = None
-
-                            try:
-                                check_times_to_move1 = int(times_to_move1)
-
-                            except ValueError:
-                                check_times_to_move1 = self.variables.get(times_to_move1)
-                                if check_times_to_move1 is None:
-                                    raise errors.NotDeclaredVariableError(
-                                        f"No such variable: {times_to_move1}"
-                                    )
-
-                            finally:
-                                if check_times_to_move1 is None:
-                                    raise errors.SomethingWentWrongError(
-                                        "Something went wrong"
-                                    )
-
-                                times_to_move1 = check_times_to_move1
-
-                                if times_to_move1 <= 0 or times_to_move1 > 1000:
-                                    raise errors.WrongSyntaxCommandError(
-                                        f"You can't move {command1_split[0]} {times_to_move1} "
-                                        f"times"
-                                    )
-
-                                self.grid.move(command1_split[0], times_to_move1)
-                                self.coordinates.append(self.grid.get_coords())
-                                index += 1
-                                continue
-
-                        # first ifblock down -> second ifblock
-                        # #######################################################################2
-                        elif command1_split[0] == "IFBLOCK":
-                            block_direction1 = command1_split[1]
-                            if block_direction1 is None:
-                                raise errors.WrongSyntaxCommandError(
-                                    "You can't check ifblock without provided direction"
-                                )
-
-                            index += 1
-                            # first ifblock down -> second ifblock up
-                            if block_direction1 == "UP":
-                                if self.grid.y < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock down -> second ifblock up ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock down -> second ifblock up ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock up ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock up ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock up ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock down -> second ifblock down
-                            if block_direction1 == "DOWN":
-                                if self.grid.y > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock down -> second ifblock down ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock down -> second ifblock down ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock down ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL", "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock down ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock down ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock down -> second ifblock right
-                            if block_direction1 == "RIGHT":
-                                if self.grid.x < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock down -> second ifblock right ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock down -> second ifblock right ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock right ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # ffirst ifblock down -> second ifblock right ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock right ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock down -> second ifblock left
-                            if block_direction1 == "LEFT":
-                                if self.grid.x > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock down -> second ifblock left ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock down -> second ifblock left ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock left ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # ffirst ifblock down -> second ifblock left ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock down -> second ifblock left ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                # continuing first ifblock right
-                if block_direction == "RIGHT":
-                    if self.grid.x < 20:
-                        while self.final_executable_commands[index] != "ENDIF":
-                            index += 1
-                        index += 1
-                        continue
-
-                    else:
-                        command1 = self.final_executable_commands[index]
-                        command1_split = command1.split()
-                        if command1_split[0] in ["UP", "DOWN", "RIGHT", "LEFT"]:
-                            times_to_move1 = command1_split[1]
-                            check_times_to_move1 = None
-
-                            try:
-                                check_times_to_move1 = int(times_to_move1)
-
-                            except ValueError:
-                                check_times_to_move1 = self.variables.get(times_to_move1)
-                                if check_times_to_move1 is None:
-                                    raise errors.NotDeclaredVariableError(
-                                        f"No such variable: {times_to_move1}"
-                                    )
-
-                            finally:
-                                if check_times_to_move1 is None:
-                                    raise errors.SomethingWentWrongError(
-                                        "Something went wrong"
-                                    )
-
-                                times_to_move1 = check_times_to_move1
-
-                                if times_to_move1 <= 0 or times_to_move1 > 1000:
-                                    raise errors.WrongSyntaxCommandError(
-                                        f"You can't move {command1_split[0]} {times_to_move1} "
-                                        f"times"
-                                    )
-
-                                self.grid.move(command1_split[0], times_to_move1)
-                                self.coordinates.append(self.grid.get_coords())
-                                index += 1
-                                continue
-
-                        # first ifblock right -> second ifblock
-                        # ########################################################################
-                        elif command1_split[0] == "IFBLOCK":
-                            block_direction1 = command1_split[1]
-                            if block_direction1 is None:
-                                raise errors.WrongSyntaxCommandError(
-                                    "You can't check ifblock without provided direction"
-                                )
-
-                            index += 1
-
-                            # first ifblock right -> second ifblock up
-                            if block_direction1 == "UP":
-                                if self.grid.y < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock right -> second ifblock up ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock right -> second ifblock up ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock up ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock up ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock up ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock right -> second ifblock down
-                            if block_direction1 == "DOWN":
-                                if self.grid.y > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock right -> second ifblock down ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock right -> second ifblock down ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock down ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock down ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock down ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock right -> second ifblock right
-                            if not block_direction1 == "RIGHT":
-                                if self.grid.x < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock right -> second ifblock right ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock right -> second ifblock right ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock right ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock right ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock right ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock right -> second ifblock left
-                            if not block_direction1 == "LEFT":
-                                if self.grid.x > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock right -> second ifblock left ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock right -> second ifblock left ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock left ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock left ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock right -> second ifblock left ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                # continuing first ifblock left
-                if block_direction == "LEFT":
-                    if self.grid.x > 0:
-                        while self.final_executable_commands[index] != "ENDIF":
-                            index += 1
-                        index += 1
-                        continue
-
-                    else:
-                        command1 = self.final_executable_commands[index]
-                        command1_split = command1.split()
-                        if command1_split[0] in ["UP", "DOWN", "RIGHT", "LEFT"]:
-                            times_to_move1 = command1_split[1]
-                            check_times_to_move1 = None
-
-                            try:
-                                check_times_to_move1 = int(times_to_move1)
-
-                            except ValueError:
-                                check_times_to_move1 = self.variables.get(times_to_move1)
-                                if check_times_to_move1 is None:
-                                    raise errors.NotDeclaredVariableError(
-                                        f"No such variable: {times_to_move1}"
-                                    )
-
-                            finally:
-                                if check_times_to_move1 is None:
-                                    raise errors.SomethingWentWrongError(
-                                        "Something went wrong"
-                                    )
-
-                                times_to_move1 = check_times_to_move1
-
-                                if times_to_move1 <= 0 or times_to_move1 > 1000:
-                                    raise errors.WrongSyntaxCommandError(
-                                        f"You can't move {command1_split[0]} {times_to_move1} "
-                                        f"times"
-                                    )
-
-                                self.grid.move(command1_split[0], times_to_move1)
-                                self.coordinates.append(self.grid.get_coords())
-                                index += 1
-                                continue
-
-                        # first ifblock left -> second ifblock
-                        # ########################################################################
-                        elif command1_split[0] == "IFBLOCK":
-                            block_direction1 = command1_split[1]
-                            if block_direction1 is None:
-                                raise errors.WrongSyntaxCommandError(
-                                    "You can't check ifblock without provided direction"
-                                )
-
-                            index += 1
-                            # first ifblock left -> second ifblock ->
-                            # second ifblock up
-                            if block_direction1 == "UP":
-                                if self.grid.y < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock left -> second ifblock up ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock left -> second ifblock up ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock up ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock up ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock up ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock left -> second ifblock ->
-                            # second ifblock down
-                            if not block_direction1 == "DOWN":
-                                if self.grid.y > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock left -> second ifblock down ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock left -> second ifblock down ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock down ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock down ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock down ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock left -> second ifblock ->
-                            # second ifblock right
-                            if not block_direction1 == "RIGHT":
-                                if self.grid.x < 20:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock left -> second ifblock right ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock left -> second ifblock right ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock right ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock right ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock right ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                            # first ifblock left -> second ifblock ->
-                            # second ifblock left
-                            if not block_direction1 == "LEFT":
-                                if self.grid.x > 0:
-                                    while self.final_executable_commands[index] != "ENDIF":
-                                        index += 1
-                                    index += 1
-                                    continue
-
-                                else:
-                                    command2 = self.final_executable_commands[index]
-                                    command2_split = command2.split()
-                                    if command2_split[0] in ["UP", "DOWN", "LEFT", "RIGHT"]:
-                                        times_to_move2 = command2_split[1]
-                                        check_times_to_move2 = None
-
-                                        try:
-                                            check_times_to_move2 = int(times_to_move2)
-
-                                        except ValueError:
-                                            check_times_to_move2 = (
-                                                self.variables.get(times_to_move2))
-
-                                            if check_times_to_move2 is None:
-                                                raise errors.NotDeclaredVariableError(
-                                                    f"No such variable: {times_to_move2}"
-                                                )
-
-                                        finally:
-                                            if check_times_to_move2 is None:
-                                                raise errors.SomethingWentWrongError(
-                                                    "Something went wrong"
-                                                )
-
-                                            times_to_move2 = check_times_to_move2
-
-                                            if times_to_move2 <= 0 or times_to_move2 > 1000:
-                                                raise errors.WrongSyntaxCommandError(
-                                                    f"You can't move {command2_split[0]} "
-                                                    f"{times_to_move2} "
-                                                    f"times"
-                                                )
-
-                                            self.grid.move(command2_split[0], times_to_move2)
-                                            self.coordinates.append(self.grid.get_coords())
-                                            index += 1
-                                            continue
-
-                                    # first ifblock left -> second ifblock left ->
-                                    # third ifblock
-                                    # ###########################################################3
-                                    elif command2_split[0] == "IFBLOCK":
-                                        block_direction2 = command2_split[2]
-                                        if block_direction2 is None:
-                                            raise errors.WrongSyntaxCommandError(
-                                                "You can't check ifblock without provided "
-                                                "direction"
-                                            )
-
-                                        index += 1
-                                        # first ifblock left -> second ifblock left ->
-                                        # third ifblock up
-                                        if block_direction2 == "UP":
-                                            if self.grid.y < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif (command3_split[0] in
-                                                      ["REPEAT", "CALL", "IFBLOCK"]):
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock left ->
-                                        # third ifblock down
-                                        if block_direction2 == "DOWN":
-                                            if self.grid.y > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: "
-                                                                f"{times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0],
-                                                                       times_to_move3)
-                                                        self.coordinates.append(
-                                                            self.grid.get_coords()
-                                                        )
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock left ->
-                                        # third ifblock right
-                                        if block_direction2 == "RIGHT":
-                                            if self.grid.x < 20:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-                                        # first ifblock left -> second ifblock left ->
-                                        # third ifblock left
-                                        if block_direction2 == "LEFT":
-                                            if self.grid.x > 0:
-                                                while self.final_executable_commands[index] != "ENDIF":
-                                                    index += 1
-                                                index += 1
-                                                continue
-
-                                            else:
-                                                command3 = self.final_executable_commands[index]
-                                                command3_split = command3.split()
-
-                                                if command3_split[0] in ["UP", "DOWN",
-                                                                         "LEFT", "RIGHT"]:
-                                                    times_to_move3 = command3_split[1]
-                                                    check_times_to_move3 = None
-
-                                                    try:
-                                                        check_times_to_move3 = int(times_to_move3)
-
-                                                    except ValueError:
-                                                        check_times_to_move3 = self.variables.get(
-                                                            times_to_move3
-                                                        )
-
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.NotDeclaredVariableError(
-                                                                f"No such variable: {times_to_move3}"
-                                                            )
-
-                                                    finally:
-                                                        if check_times_to_move3 is None:
-                                                            raise errors.SomethingWentWrongError(
-                                                                "Something went wrong"
-                                                            )
-
-                                                        times_to_move3 = check_times_to_move3
-                                                        if times_to_move3 <= 0 or times_to_move3 > 1000:
-                                                            raise errors.WrongSyntaxCommandError(
-                                                                f"You can't move "
-                                                                f"{command3_split[0]} "
-                                                                f"{times_to_move3} "
-                                                                f"times"
-                                                            )
-
-                                                        self.grid.move(command3_split[0], times_to_move3)
-                                                        self.coordinates.append(self.grid.get_coords())
-                                                        index += 1
-                                                        continue
-
-                                                elif command3_split[0] in ["REPEAT", "CALL",
-                                                                           "IFBLOCK"]:
-                                                    raise errors.Increasing3NestedCallsError(
-                                                        "You've increased 3 nested "
-                                                        "calls rule"
-                                                    )
-
-            index += 1
-
-    def execute(self, program_file: str) -> (
-            None | errors.Error | list[tuple[int, int]]
-    ):
-        self.commands = []
-        self.executable_commands = []
-        self.final_executable_commands = []
-        self.functions = defaultdict(list)
-        self.variables = {}
-        self.coordinates = [(0, 0)]
-
-        self.grid = grid.Grid(start_x=0, start_y=0)
-        self.load_file(program_file)
-        self.check_commands()
-        if not self.force_stop:
-            self.get_variables()
-        if not self.force_stop:
-            self.get_procedures()
-        if not self.force_stop:
-            self.first_parse(self.commands)
-        if not self.force_stop:
-            self.second_parse()
-        if not self.force_stop:
-            self.run_commands()
-        return self.coordinates
-
-    def load_file(self, program_file: str) -> None:
-
-        suffix = program_file.split(".")[-1]
-        if suffix != "txt":
-            raise errors.FileReadingError(
-                f"You can't open .{suffix} file. The only acceptable format is .txt"
-            )
-
-        try:
-            with open(program_file, "r") as check_file:
-                lines = check_file.read()
-                if not lines[-1].endswith("\n"):
-                    with open(program_file, "a") as file:
-                        file.write("\n")
-
-            with open(program_file, "r") as file:
-                for line in file:
-                    if len(line) > 2 and line != "'\n":
-                        self.commands.append(line[:-1].strip())
-
-        except Exception:
-            raise errors.FileReadingError("Error during reading your file")
+        except (OSError, UnicodeDecodeError):
+            raise errors.FileReadingError("Error during reading your program")
 
     def interpreter_get_coords(self):
         if self.grid:
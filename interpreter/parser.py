@@ -0,0 +1,197 @@
+from typing import NamedTuple
+
+from interpreter import errors
+from interpreter.tokenizer import MOVES, Opcode, Token
+
+
+class Move(NamedTuple):
+    direction: Opcode
+    times: int | str
+    line: int
+
+
+class Repeat(NamedTuple):
+    times: int
+    body: tuple
+    line: int
+
+
+class If(NamedTuple):
+    direction: Opcode
+    body: tuple
+    line: int
+
+
+class Call(NamedTuple):
+    name: str
+    line: int
+
+
+class Program(NamedTuple):
+    """
+    Parsed program. Loops and calls are kept as nodes, so the size of
+    the tree depends only on the size of the source.
+    """
+    body: tuple
+    procedures: dict[str, tuple]
+
+
+def repeat_times(token: Token) -> int:
+    times = token.operand
+    if not isinstance(times, int):
+        raise errors.NotDeclaredVariableError(
+            f"No such variable: {times}"
+        )
+
+    if times == 0:
+        raise errors.EndlessRepeatError(
+            "You can't create an endless repeat. "
+            "Change your repeat times number to a "
+            "number more then 0"
+        )
+
+    if times < 0:
+        raise errors.IncorrectRepeatDeclarationError(
+            "You can't create a repeat cycle with "
+            "with negative repeat times number"
+        )
+
+    if times > 1000:
+        raise errors.WrongSyntaxCommandError(
+            "Maximum value for repeat loop times is 1000"
+        )
+
+    return times
+
+
+class Parser:
+    """
+    Builds Program from tokens without SET commands (see
+    Interpreter.get_variables). Only 3 nested REPEAT or IFBLOCK levels
+    are allowed, a procedure may call only procedures declared before it.
+    """
+
+    def __init__(self, tokens: list[Token]):
+        self.tokens = tokens
+        self.index = 0
+        self.open_ifblocks = 0
+        self.procedures = {}
+        self.main_calls = []
+
+    def parse(self) -> Program:
+        body = self.parse_block(None, 0, 0, None)
+        for call in self.main_calls:
+            if call.operand not in self.procedures:
+                raise errors.ProcedureNotDeclaredError(
+                    f"No procedure with name {call.operand}"
+                )
+
+        return Program(body, self.procedures)
+
+    def parse_procedure(self, token: Token) -> None:
+        procedure_name = token.operand
+        if procedure_name in self.procedures:
+            raise errors.ProcedureAlreadyDeclaredError(
+                f"Procedure with name {procedure_name} is already "
+                f"declared"
+            )
+
+        self.procedures[procedure_name] = self.parse_block(Opcode.ENDPROC, 0, 0, procedure_name)
+
+    def parse_block(self, closing, repeat_depth, if_depth, procedure_name) -> tuple:
+        body = []
+        while self.index < len(self.tokens):
+            token = self.tokens[self.index]
+            opcode = token.opcode
+            self.index += 1
+
+            if opcode == closing:
+                return tuple(body)
+
+            if opcode in MOVES:
+                body.append(Move(opcode, token.operand, token.line))
+                continue
+
+            if (repeat_depth == 3 or if_depth == 3) and opcode in (Opcode.REPEAT, Opcode.CALL, Opcode.IFBLOCK):
+                raise errors.Increasing3NestedCallsError(
+                    "You've increased 3 nested "
+                    "calls rule"
+                )
+
+            match opcode:
+                case Opcode.REPEAT:
+                    times = repeat_times(token)
+                    cycle_body = self.parse_block(Opcode.ENDREPEAT, repeat_depth + 1, if_depth, procedure_name)
+                    body.append(Repeat(times, cycle_body, token.line))
+
+                case Opcode.IFBLOCK:
+                    self.open_ifblocks += 1
+                    if_body = self.parse_block(Opcode.ENDIF, repeat_depth, if_depth + 1, procedure_name)
+                    self.open_ifblocks -= 1
+                    body.append(If(token.operand, if_body, token.line))
+
+                case Opcode.CALL:
+                    if procedure_name is None:
+                        self.main_calls.append(token)
+
+                    elif token.operand not in self.procedures:
+                        raise errors.ProcedureNotDeclaredError(
+                            f"Procedure {token.operand} was not declared"
+                        )
+
+                    body.append(Call(token.operand, token.line))
+
+                case Opcode.PROCEDURE:
+                    if closing is not None:
+                        raise errors.WrongSyntaxCommandError(
+                            f"Procedure {token.operand} can't be declared inside another block"
+                        )
+
+                    self.parse_procedure(token)
+
+                case _:
+                    self.unexpected_closing(token, closing, procedure_name)
+
+        self.unexpected_closing(None, closing, procedure_name)
+
+        return tuple(body)
+
+    def unexpected_closing(self, token: Token | None, closing, procedure_name) -> None:
+        # token is None when the file has ended
+        match closing:
+            case Opcode.ENDREPEAT:
+                raise errors.RepeatNotClosedError(
+                    "Your repeat cycle is not closed"
+                )
+
+            case Opcode.ENDIF:
+                raise errors.IFBlockNotClosedError(
+                    f"{self.open_ifblocks} of your ifblocks are not closed"
+                )
+
+            case Opcode.ENDPROC:
+                raise errors.ProcedureNotClosedError(
+                    f"Procedure {procedure_name} was never closed"
+                )
+
+        if token is None:
+            return
+
+        match token.opcode:
+            case Opcode.ENDREPEAT:
+                raise errors.RepeatNotClosedError(
+                    "Your repeat cycle is not closed"
+                )
+
+            case Opcode.ENDIF:
+                raise errors.WrongSyntaxCommandError(
+                    "You have wrong syntax with endif"
+                )
+
+        raise errors.WrongSyntaxCommandError(
+            f"Unexpected {token.opcode.name} in line {token.line}"
+        )
+
+
+def parse(tokens: list[Token]) -> Program:
+    return Parser(tokens).parse()
@@ -0,0 +1,176 @@
+import time
+from typing import Callable, Iterator, NamedTuple
+
+from interpreter import compiler, errors, vm
+from interpreter.compiler import Bytecode
+from interpreter.grid import GRID_SIZE, Grid
+from interpreter.parser import Program
+from interpreter.source_map import SourceMap
+from interpreter.stats import ExecutionStats
+from interpreter.trajectory import Trajectory, typecode_for
+
+
+class CompiledProgram(NamedTuple):
+    """
+    Result of all phases before the run. It is never changed, so one
+    compiled program can be run by many ExecutionContexts at once, from
+    threads or, after pickling, from other processes.
+    """
+    variables: dict[str, int]
+    program: Program
+    bytecode: Bytecode
+
+    def run(self, keep_path: bool = True, **options) -> Trajectory:
+        # Runs the program in a new ExecutionContext, options are the ExecutionContext ones
+        return ExecutionContext(self, keep_path, **options).run()
+
+
+class ExecutionContext:
+    """
+    State of one run of a compiled program: the grid, the path, the stop
+    flag and limits. Every run needs its own context, they are cheap.
+    The run stops when force_stop is set, should_stop() returns True, the
+    program makes more than max_steps moves or runs longer than timeout
+    seconds. trace is called as described in vm.Machine. Coordinates are
+    allowed to be from 0 to grid_size inclusive. source_map is filled if
+    the path is kept, see source_map module.
+    """
+
+    def __init__(self, compiled: CompiledProgram, keep_path: bool = True, max_steps: int | None = None,
+                 timeout: float | None = None, trace: vm.TraceHook | None = None, trace_every: int = 1,
+                 stats: ExecutionStats | None = None, should_stop: Callable[[], bool] | None = None,
+                 grid_size: int = GRID_SIZE, source_map: SourceMap | None = None):
+        self.compiled = compiled
+        self.keep_path = keep_path
+        self.grid = Grid(start_x=0, start_y=0, size=grid_size)
+        self.coordinates = self.trajectory([(0, 0)])
+        self.force_stop = False
+        self.external_stop = should_stop
+        self.max_steps = max_steps
+        self.timeout = timeout
+        self.deadline = time.monotonic() + timeout if timeout is not None else None
+        self.trace = trace
+        self.trace_every = trace_every
+        self.stats = stats
+        self.source_map = source_map
+        self.finished = False
+
+    def trajectory(self, points) -> Trajectory:
+        return Trajectory(points, typecode_for(self.grid.size))
+
+    def machine(self, coordinates: Trajectory | None) -> vm.Machine:
+        bytecode = self.compiled.bytecode
+        if self.trace is not None:
+            # Traced programs are run without folding, so every move has its own line
+            bytecode = compiler.compile_program(self.compiled.program, fold=False)
+        if self.source_map is not None:
+            self.source_map.start(bytecode)
+        return vm.Machine(bytecode, self.grid, coordinates, self.trace, self.trace_every, self.source_map)
+
+    def should_stop(self) -> bool:
+        # Polled by the VM every vm.STOP_CHECK_INTERVAL loop iterations and calls
+        return (
+            self.force_stop
+            or self.external_stop is not None and self.external_stop()
+            or self.max_steps is not None and len(self.coordinates) > self.max_steps + 1
+            or self.deadline is not None and time.monotonic() > self.deadline
+        )
+
+    def check_limits(self, deadline: bool = True) -> None:
+        if self.max_steps is not None and len(self.coordinates) > self.max_steps + 1:
+            # The VM stops a bit later, the path is cut to be the same every time
+            self.coordinates = self.coordinates[:self.max_steps + 1]
+            self.grid.x, self.grid.y = self.coordinates[-1]
+            raise errors.ExecutionLimitError(
+                f"Program made more than {self.max_steps} moves", self.coordinates
+            )
+
+        if deadline and self.deadline is not None and time.monotonic() > self.deadline:
+            raise errors.ExecutionLimitError(
+                f"Program is running longer than {self.timeout} seconds", self.coordinates
+            )
+
+    def run(self) -> Trajectory:
+        """
+        Returns the path, or only the final position if keep_path is False.
+        If the run was stopped the path made so far is returned.
+        """
+        machine = self.start()
+        try:
+            machine.run(self.should_stop)
+
+        finally:
+            self.count_ifblocks(machine)
+
+        return self.finish(machine)
+
+    async def run_async(self, yield_every: int = 1) -> Trajectory:
+        """
+        Same as run(), but gives control back to the event loop every
+        yield_every stop checks of the VM, that is at least every
+        vm.STOP_CHECK_INTERVAL loop iterations or calls.
+        """
+        import asyncio
+
+        checks = 0
+
+        def should_pause() -> bool:
+            nonlocal checks
+            checks += 1
+            return self.should_stop() or checks % yield_every == 0
+
+        machine = self.start()
+        try:
+            while not machine.run(should_pause) and not self.should_stop():
+                await asyncio.sleep(0)
+
+        finally:
+            self.count_ifblocks(machine)
+
+        return self.finish(machine)
+
+    def start(self) -> vm.Machine:
+        self.check_limits()
+        # Steps are counted by the path, so it is kept while max_steps is set,
+        # it can't grow much longer than max_steps
+        keep_path = self.keep_path or self.max_steps is not None
+        return self.machine(self.coordinates if keep_path else None)
+
+    def finish(self, machine: vm.Machine) -> Trajectory:
+        self.finished = machine.finished
+        if machine.coordinates is None:
+            self.coordinates = self.trajectory([self.grid.get_coords()])
+        # Short straight blocks are run without stop checks, so the path can
+        # be too long even if the program has finished
+        self.check_limits(deadline=not self.finished)
+        if not self.keep_path:
+            self.coordinates = self.trajectory([self.grid.get_coords()])
+
+        return self.coordinates
+
+    def count_ifblocks(self, machine: vm.Machine) -> None:
+        if self.stats is not None:
+            self.stats.ifblocks_taken = machine.ifblocks - machine.ifblocks_skipped
+            self.stats.ifblocks_skipped = machine.ifblocks_skipped
+
+    def iter_run(self, chunk_size: int) -> Iterator[tuple[int, int]]:
+        # Yields positions while the program runs, the path is not kept
+        for chunk in self.iter_chunks(chunk_size):
+            yield from chunk
+
+    def iter_chunks(self, chunk_size: int) -> Iterator[Trajectory]:
+        # Same as iter_run(), but yields the path by Trajectory chunks of
+        # about chunk_size positions, so they can be extended by at once
+        machine = self.machine(self.coordinates)
+        finished = self.should_stop()
+        while True:
+            if not finished:
+                finished = machine.run(lambda: self.should_stop() or len(self.coordinates) >= chunk_size)
+            if self.coordinates:
+                yield self.coordinates[:]
+            if self.source_map is not None:
+                self.source_map.offset += len(self.coordinates)
+            self.coordinates.clear()
+            if finished or self.should_stop():
+                self.finished = machine.finished
+                return
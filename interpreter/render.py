@@ -0,0 +1,180 @@
+"""
+Draws a path the same way ui.field.Field does, but without Qt, so
+thumbnails can be made by headless batch jobs. All moves are horizontal
+or vertical, so lines are drawn as filled rectangles.
+"""
+import math
+import struct
+import zlib
+from typing import Iterable, NamedTuple
+
+from interpreter.grid import GRID_SIZE
+from interpreter.trajectory import Trajectory
+
+BACKGROUND_COLOR = (44, 44, 88)
+GRID_COLOR = (0, 0, 0)
+PATH_COLOR = (111, 180, 111)
+PATH_WIDTH = 3
+THUMBNAIL_SIZE = 256
+# Grid lines closer than this number of pixels are thinned out, so huge
+# grids don't turn into a solid fill
+MIN_LINE_SPACING = 4
+# The view can't be zoomed in further than this number of cells
+MIN_VIEW_SPAN = 4
+
+
+def line_stride(step: float) -> int:
+    # Every line_stride(step)-th grid line is drawn when cells are step pixels wide
+    return max(1, math.ceil(MIN_LINE_SPACING / step)) if step > 0 else 1
+
+
+class Viewport(NamedTuple):
+    """
+    Square part of the grid shown in an image: x from left to left + span
+    and y from bottom to bottom + span in grid coordinates. whole() is
+    the whole grid with half a cell around it, as on thumbnails.
+    """
+    left: float
+    bottom: float
+    span: float
+
+    @classmethod
+    def whole(cls, cell_num: int = GRID_SIZE) -> "Viewport":
+        return cls(-0.5, -0.5, cell_num + 1)
+
+    def step(self, size: int) -> float:
+        # Width of a cell in pixels
+        return size / self.span
+
+    def to_pixels(self, x: float, y: float, size: int) -> tuple[float, float]:
+        step = self.step(size)
+        return (x - self.left) * step, size - (y - self.bottom) * step
+
+    def to_grid(self, pixel_x: float, pixel_y: float, size: int) -> tuple[float, float]:
+        step = self.step(size)
+        return self.left + pixel_x / step, self.bottom + (size - pixel_y) / step
+
+    def rect(self, margin: float = 0) -> tuple[float, float, float, float]:
+        # left, bottom, right and top, as SegmentIndex.query() takes them
+        return (
+            self.left - margin, self.bottom - margin,
+            self.left + self.span + margin, self.bottom + self.span + margin,
+        )
+
+    def zoom(self, factor: float, x: float, y: float, cell_num: int = GRID_SIZE) -> "Viewport":
+        # factor > 1 zooms in, the grid point (x, y) stays in its place
+        factor = self.span / Viewport(self.left, self.bottom, self.span / factor).clamp(cell_num).span
+        return Viewport(
+            x - (x - self.left) / factor, y - (y - self.bottom) / factor, self.span / factor
+        ).clamp(cell_num)
+
+    def pan(self, dx: float, dy: float, cell_num: int = GRID_SIZE) -> "Viewport":
+        return Viewport(self.left + dx, self.bottom + dy, self.span).clamp(cell_num)
+
+    def clamp(self, cell_num: int = GRID_SIZE) -> "Viewport":
+        # Keeps the view inside whole(cell_num)
+        whole = Viewport.whole(cell_num)
+        span = min(max(self.span, min(MIN_VIEW_SPAN, whole.span)), whole.span)
+        limit = whole.left + whole.span - span
+        return Viewport(min(max(self.left, whole.left), limit), min(max(self.bottom, whole.bottom), limit), span)
+
+    def grid_lines(self, size: int, cell_num: int = GRID_SIZE) -> tuple[list[int], list[int]]:
+        # Pixel positions of the vertical and horizontal grid lines in the view
+        stride = line_stride(self.step(size))
+        return (
+            [int(self.to_pixels(x, 0, size)[0]) for x in self.visible_lines(self.left, stride, cell_num)],
+            [int(self.to_pixels(0, y, size)[1]) for y in self.visible_lines(self.bottom, stride, cell_num)],
+        )
+
+    def visible_lines(self, start: float, stride: int, cell_num: int) -> range:
+        first = max(math.ceil(start / stride) * stride, 0)
+        return range(first, min(math.floor(start + self.span), cell_num) + 1, stride)
+
+
+def cell_step(size: int, cell_num: int = GRID_SIZE) -> float:
+    # Width of a cell in pixels, there are cell_num + 1 cells around the lines
+    return size / (cell_num + 1)
+
+
+def grid_lines(size: int, cell_num: int = GRID_SIZE) -> list[int]:
+    # Pixel positions of the grid lines, the same for x and y
+    step = cell_step(size, cell_num)
+    return [int(step * (i + 0.5)) for i in range(0, cell_num + 1, line_stride(step))]
+
+
+def to_pixels(x: int, y: int, size: int, cell_num: int = GRID_SIZE) -> tuple[int, int]:
+    # Grid coordinates to pixels, y goes up on the grid and down in images
+    step = cell_step(size, cell_num)
+    return int((x + 0.5) * step), size - int((y + 0.5) * step)
+
+
+def render_svg(way: Iterable[tuple[int, int]], size: int = THUMBNAIL_SIZE, cell_num: int = GRID_SIZE) -> str:
+    lines = "".join(
+        f'<line x1="{position}" y1="0" x2="{position}" y2="{size}"/>'
+        f'<line x1="0" y1="{position}" x2="{size}" y2="{position}"/>'
+        for position in grid_lines(size, cell_num)
+    )
+    points = " ".join(
+        "{},{}".format(*to_pixels(x, y, size, cell_num)) for x, y in Trajectory(way, "i").corners()
+    )
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" viewBox="0 0 {size} {size}">'
+        f'<rect width="{size}" height="{size}" fill="rgb{BACKGROUND_COLOR}"/>'
+        f'<g stroke="rgb{GRID_COLOR}" stroke-width="1">{lines}</g>'
+        f'<polyline points="{points}" fill="none" stroke="rgb{PATH_COLOR}" stroke-width="{PATH_WIDTH}"/>'
+        f"</svg>"
+    )
+
+
+def render_png(way: Iterable[tuple[int, int]], size: int = THUMBNAIL_SIZE, cell_num: int = GRID_SIZE) -> bytes:
+    pixels = bytearray(bytes(BACKGROUND_COLOR) * (size * size))
+
+    def fill(left: int, top: int, right: int, bottom: int, color: bytes) -> None:
+        # Fills pixels from left to right and from top to bottom inclusive
+        left, top = max(left, 0), max(top, 0)
+        right, bottom = min(right, size - 1), min(bottom, size - 1)
+        if left > right:
+            return
+        span = color * (right - left + 1)
+        for row in range(top, bottom + 1):
+            start = (row * size + left) * 3
+            pixels[start:start + len(span)] = span
+
+    grid_color, path_color = bytes(GRID_COLOR), bytes(PATH_COLOR)
+    for position in grid_lines(size, cell_num):
+        fill(position, 0, position, size - 1, grid_color)
+        fill(0, position, size - 1, position, grid_color)
+
+    corners = Trajectory(way, "i").corners()
+    half = PATH_WIDTH // 2
+    for i in range(1, len(corners)):
+        x_start, y_start = to_pixels(*corners[i - 1], size, cell_num)
+        x_end, y_end = to_pixels(*corners[i], size, cell_num)
+        fill(
+            min(x_start, x_end) - half, min(y_start, y_end) - half,
+            max(x_start, x_end) + half, max(y_start, y_end) + half,
+            path_color,
+        )
+
+    rows = b"".join(b"\x00" + bytes(pixels[row * size * 3:(row + 1) * size * 3]) for row in range(size))
+    return b"".join((
+        b"\x89PNG\r\n\x1a\n",
+        png_chunk(b"IHDR", struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)),
+        png_chunk(b"IDAT", zlib.compress(rows)),
+        png_chunk(b"IEND", b""),
+    ))
+
+
+def png_chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def save(way: Iterable[tuple[int, int]], filename: str, size: int = THUMBNAIL_SIZE, cell_num: int = GRID_SIZE) -> None:
+    # The format is chosen by the extension, .png or .svg
+    if filename.lower().endswith(".svg"):
+        with open(filename, "w", encoding="utf-8") as file:
+            file.write(render_svg(way, size, cell_num))
+        return
+
+    with open(filename, "wb") as file:
+        file.write(render_png(way, size, cell_num))
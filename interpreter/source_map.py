@@ -0,0 +1,110 @@
+from array import array
+from bisect import bisect_right
+from typing import NamedTuple
+
+from interpreter import folding
+from interpreter.compiler import Bytecode, FOLD, REPEAT
+
+# Iterations of loops are kept after every this number of loop events, so
+# locate() replays at most that many events
+CHECKPOINT_INTERVAL = 1024
+
+
+class Location(NamedTuple):
+    # iterations are numbers, from 1, of iterations of all loops around the
+    # move, from the outermost one, loops of callers included
+    line: int
+    iterations: tuple[int, ...]
+
+
+class SourceMap:
+    """
+    Maps positions of a path to the moves that made them, filled only if
+    passed to Interpreter.execute() and others. vm.Machine adds a record
+    for every executed move or folded block, not for every position: index
+    of its first position and its address. Loops add events: entering a
+    loop, going to its next iteration and leaving it. Nothing is copied,
+    so the map costs a couple of appends per instruction and nothing per
+    position of folded loops. locate() replays loop events from the
+    nearest checkpoint to know the iterations, positions of folded loops
+    are found in the Fold.
+    """
+
+    def __init__(self):
+        self.bytecode = None
+        # 32-bit, 8 bytes per record, widen() makes starts 64-bit if the
+        # path gets longer than that
+        self.starts = array("i")
+        self.addresses = array("i")
+        # number of records before every event and the address of its REPEAT
+        # or ENDREPEAT, ~address of ENDREPEAT when the loop is left
+        self.event_records = array("i")
+        self.events = array("i")
+        # positions emitted before the current path, see ExecutionContext.iter_run()
+        self.offset = 0
+        # iterations after every CHECKPOINT_INTERVAL events, made by locate()
+        self.checkpoints = [()]
+
+    def start(self, bytecode: Bytecode) -> None:
+        # Drops records of the previous run
+        self.__init__()
+        self.bytecode = bytecode
+
+    def record(self, start: int, address: int) -> None:
+        try:
+            self.starts.append(start + self.offset)
+
+        except OverflowError:
+            self.widen()
+            self.starts.append(start + self.offset)
+        self.addresses.append(address)
+
+    def widen(self) -> None:
+        # Called when a start doesn't fit 32 bits, numbers of records are
+        # widened at the same time, so vm.Machine rebinds both once
+        self.starts = array("q", self.starts)
+        self.event_records = array("q", self.event_records)
+
+    def event(self, address: int) -> None:
+        self.event_records.append(len(self.starts))
+        self.events.append(address)
+
+    def locate(self, index: int) -> Location | None:
+        # Where the index-th position of the path comes from, None for the start position
+        record = bisect_right(self.starts, index) - 1
+        if record < 0:
+            return None
+
+        code = self.bytecode.code
+        address = self.addresses[record]
+        iterations = self.iterations(record)
+        if code[address] != FOLD:
+            return Location(self.bytecode.lines[address // 2], iterations)
+
+        line, nested = folding.locate(self.bytecode.folds[code[address + 1]], index - self.starts[record])
+        return Location(line, iterations + nested)
+
+    def iterations(self, record: int) -> tuple[int, ...]:
+        end = bisect_right(self.event_records, record)
+        # the map may still grow while the program is running, see iter_run()
+        while len(self.checkpoints) * CHECKPOINT_INTERVAL <= len(self.events):
+            start = (len(self.checkpoints) - 1) * CHECKPOINT_INTERVAL
+            self.checkpoints.append(self.replay(self.checkpoints[-1], start, start + CHECKPOINT_INTERVAL))
+
+        checkpoint = end // CHECKPOINT_INTERVAL
+        return self.replay(self.checkpoints[checkpoint], checkpoint * CHECKPOINT_INTERVAL, end)
+
+    def replay(self, iterations: tuple[int, ...], start: int, end: int) -> tuple[int, ...]:
+        code = self.bytecode.code
+        stack = list(iterations)
+        for address in self.events[start:end]:
+            if address < 0:
+                stack.pop()
+            elif code[address] == REPEAT:
+                stack.append(1)
+            else:
+                stack[-1] += 1
+        return tuple(stack)
+
+    def __len__(self) -> int:
+        return len(self.starts)
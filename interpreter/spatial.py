@@ -0,0 +1,127 @@
+import math
+from array import array
+from itertools import repeat
+from typing import Iterable
+
+from interpreter.trajectory import Trajectory
+
+# Side of the smallest buckets in cells
+BUCKET_SIZE = 16
+
+
+class SegmentIndex:
+    """
+    Segments of a path between its points, found by the rectangle they
+    cross, so a part of a huge grid is drawn without looking at the whole
+    path. Points are meant to be corners of the path, see
+    Trajectory.corners(), positions are their indexes in the path, -1 if
+    they are unknown. Buckets are squares of a few sizes:
+    BUCKET_SIZE, twice as big and so on. A segment is kept in buckets of
+    the smallest size where it crosses at most two of them on each axis,
+    so a long line doesn't fill thousands of buckets and a query looks
+    only at buckets near the rectangle.
+    """
+
+    def __init__(self, points: Iterable[tuple[int, int]] = (), positions: Iterable[int] | None = None):
+        # 32-bit points, the path may come from a grid of any size
+        self.points = Trajectory(typecode="i")
+        self.positions = array("q")
+        # buckets of every level, (column, row) -> indexes of segments
+        self.levels = []
+        self.extend(points, positions)
+
+    def append(self, point: tuple[int, int], position: int = -1) -> None:
+        # Adds the segment from the last point to point, repeated points are skipped
+        points = self.points
+        x, y = point
+        if points:
+            last_x, last_y = points.xs[-1], points.ys[-1]
+            if x == last_x and y == last_y:
+                return
+            self.insert(len(points) - 1, min(x, last_x), min(y, last_y), max(x, last_x), max(y, last_y))
+        points.append(point)
+        self.positions.append(position)
+
+    def extend(self, points: Iterable[tuple[int, int]], positions: Iterable[int] | None = None) -> None:
+        for point, position in zip(points, repeat(-1) if positions is None else positions):
+            self.append(point, position)
+
+    def insert(self, segment: int, left: int, bottom: int, right: int, top: int) -> None:
+        level, size = 0, BUCKET_SIZE
+        while right // size - left // size > 1 or top // size - bottom // size > 1:
+            level += 1
+            size *= 2
+        while len(self.levels) <= level:
+            self.levels.append({})
+
+        buckets = self.levels[level]
+        for column in range(left // size, right // size + 1):
+            for row in range(bottom // size, top // size + 1):
+                bucket = buckets.get((column, row))
+                if bucket is None:
+                    bucket = buckets[(column, row)] = array("i")
+                bucket.append(segment)
+
+    def query(self, left: float, bottom: float, right: float, top: float) -> list[int]:
+        # Indexes of segments crossing the rectangle, in the order of the path
+        found = set()
+        for level, buckets in enumerate(self.levels):
+            size = BUCKET_SIZE << level
+            first_column, last_column = math.floor(left / size), math.floor(right / size)
+            first_row, last_row = math.floor(bottom / size), math.floor(top / size)
+            if (last_column - first_column + 1) * (last_row - first_row + 1) <= len(buckets):
+                for column in range(first_column, last_column + 1):
+                    for row in range(first_row, last_row + 1):
+                        bucket = buckets.get((column, row))
+                        if bucket is not None:
+                            found.update(bucket)
+            else:
+                # the rectangle is bigger than the part of the grid the path covers
+                for (column, row), bucket in buckets.items():
+                    if first_column <= column <= last_column and first_row <= row <= last_row:
+                        found.update(bucket)
+
+        return [segment for segment in sorted(found) if self.crosses(segment, left, bottom, right, top)]
+
+    def crossing(self, left: float, bottom: float, right: float, top: float, start: int = 0) -> list[int]:
+        # Same as query() for segments from start on, without buckets, for segments just added
+        return [
+            segment for segment in range(start, len(self))
+            if self.crosses(segment, left, bottom, right, top)
+        ]
+
+    def crosses(self, segment: int, left: float, bottom: float, right: float, top: float) -> bool:
+        xs, ys = self.points.xs, self.points.ys
+        x_start, x_end = xs[segment], xs[segment + 1]
+        y_start, y_end = ys[segment], ys[segment + 1]
+        return (
+            min(x_start, x_end) <= right and max(x_start, x_end) >= left
+            and min(y_start, y_end) <= top and max(y_start, y_end) >= bottom
+        )
+
+    def nearest(self, x: float, y: float, radius: float) -> int | None:
+        # Segment closest to (x, y), not farther than radius on both axes,
+        # the latest one of equally close segments, as it is drawn on top
+        best, best_distance = None, radius
+        xs, ys = self.points.xs, self.points.ys
+        for segment in self.query(x - radius, y - radius, x + radius, y + radius):
+            x_start, x_end = sorted((xs[segment], xs[segment + 1]))
+            y_start, y_end = sorted((ys[segment], ys[segment + 1]))
+            distance = max(abs(x - min(max(x, x_start), x_end)), abs(y - min(max(y, y_start), y_end)))
+            if distance <= best_distance:
+                best, best_distance = segment, distance
+        return best
+
+    def polylines(self, segments: list[int]) -> list[Trajectory]:
+        # Sorted segments joined into polylines, one for every run of consecutive ones
+        result = []
+        start = 0
+        for i in range(1, len(segments) + 1):
+            if i == len(segments) or segments[i] != segments[i - 1] + 1:
+                result.append(self.points[segments[start]:segments[i - 1] + 2])
+                start = i
+        return result
+
+    def __len__(self) -> int:
+        # Number of segments
+        return max(len(self.points) - 1, 0)
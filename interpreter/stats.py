@@ -0,0 +1,65 @@
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # logging takes a few milliseconds to import, stats are created on every run
+    import logging
+
+
+class ExecutionStats:
+    """
+    Statistics of one run, filled only if passed to Interpreter.execute()
+    and others. phases holds wall time in seconds of every phase that has
+    run, in order. cache is "memory" or "disk" if the compiled program was
+    taken from a cache, then tokenize..compile phases are missing.
+    moves is known only if the path is kept.
+    """
+
+    def __init__(self):
+        self.phases = {}
+        self.cache = None
+        self.source_lines = 0
+        self.tokens = 0
+        self.variables = 0
+        self.procedures = 0
+        self.instructions = 0
+        self.folds = 0
+        self.moves = None
+        self.ifblocks_taken = 0
+        self.ifblocks_skipped = 0
+        self.path_length = 0
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.phases.values())
+
+    def as_dict(self) -> dict:
+        return {
+            "phases": dict(self.phases),
+            "total_time": self.total_time,
+            "cache": self.cache,
+            "source_lines": self.source_lines,
+            "tokens": self.tokens,
+            "variables": self.variables,
+            "procedures": self.procedures,
+            "instructions": self.instructions,
+            "folds": self.folds,
+            "moves": self.moves,
+            "ifblocks_taken": self.ifblocks_taken,
+            "ifblocks_skipped": self.ifblocks_skipped,
+            "path_length": self.path_length,
+        }
+
+    def log(self, logger: "logging.Logger", level: int | None = None) -> None:
+        # e.g. with the logger from core_tools.logger.setup_logger(), INFO by default
+        import logging
+
+        logger.log(logging.INFO if level is None else level, str(self), stacklevel=2)
+
+    def __str__(self):
+        phases = ", ".join(f"{name} {elapsed * 1000:.3f} ms" for name, elapsed in self.phases.items())
+        return (
+            f"{phases}; cache: {self.cache}; lines: {self.source_lines}, tokens: {self.tokens}, "
+            f"variables: {self.variables}, procedures: {self.procedures}, instructions: {self.instructions}, "
+            f"folds: {self.folds}; moves: {self.moves}, IFBLOCKs taken: {self.ifblocks_taken}, "
+            f"skipped: {self.ifblocks_skipped}, path length: {self.path_length}"
+        )
@@ -0,0 +1,131 @@
+from enum import IntEnum
+from typing import Iterable, NamedTuple
+
+from interpreter import errors
+
+
+class Opcode(IntEnum):
+    RIGHT = 0
+    LEFT = 1
+    UP = 2
+    DOWN = 3
+    REPEAT = 4
+    ENDREPEAT = 5
+    IFBLOCK = 6
+    ENDIF = 7
+    PROCEDURE = 8
+    ENDPROC = 9
+    CALL = 10
+    SET = 11
+
+
+MOVES = frozenset((Opcode.RIGHT, Opcode.LEFT, Opcode.UP, Opcode.DOWN))
+
+# Commands that take exactly one operand, everything else (except SET) takes none
+UNARY = frozenset((Opcode.RIGHT, Opcode.LEFT, Opcode.UP, Opcode.DOWN, Opcode.REPEAT, Opcode.IFBLOCK,
+                   Opcode.PROCEDURE, Opcode.CALL))
+
+# Used for "Maybe you ment ..." hints, CALL is intentionally not suggested
+ALLOWED_COMMANDS = ["RIGHT", "LEFT", "UP", "DOWN", "REPEAT", "ENDREPEAT", "IFBLOCK", "ENDIF",
+                    "PROCEDURE", "ENDPROC", "SET"]
+
+
+class Token(NamedTuple):
+    """
+    One command of the program. operand is an int for numeric literals,
+    a str for names, an Opcode for IFBLOCK direction and a (name, value)
+    tuple for SET. line is 1-based line number in the source.
+    """
+    opcode: Opcode
+    operand: int | str | Opcode | tuple[str, int | str] | None
+    line: int
+
+
+def similar_command(command: str) -> str | None:
+    for allowed_command in ALLOWED_COMMANDS:
+        if command in allowed_command and command != allowed_command:
+            return allowed_command
+
+    return None
+
+
+def parse_operand(value: str) -> int | str:
+    try:
+        return int(value)
+
+    except ValueError:
+        return value
+
+
+def tokenize_line(text: str, line: int) -> Token | None:
+    command_split = text.split()
+    if not command_split:
+        return None
+
+    command_title = command_split[0]
+    opcode = Opcode.__members__.get(command_title)
+    if opcode is None:
+        possible_command = similar_command(command_title)
+        if possible_command is not None:
+            raise errors.NoSuchCommandError(f"No such command: "
+                                            f"{command_title}. "
+                                            f"Maybe you ment "
+                                            f"{possible_command}")
+
+        raise errors.NoSuchCommandError(f"No such command: "
+                                        f"{command_title}")
+
+    if opcode == Opcode.SET:
+        name, equals, value = text.strip()[3:].partition("=")
+        name, value = name.split(), value.split()
+        if not equals or len(name) != 1 or len(value) != 1:
+            raise errors.WrongSyntaxCommandError(
+                f"Variable declaration must be like: SET <X> = <Y>. Line {line}: {text.strip()}"
+            )
+        return Token(opcode, (name[0], parse_operand(value[0])), line)
+
+    if opcode in UNARY:
+        if len(command_split) != 2:
+            if opcode == Opcode.REPEAT:
+                raise errors.IncorrectRepeatDeclarationError(
+                    "Your loop is declared incorrectly. "
+                    "It must be like: REPEAT <X>"
+                )
+            raise errors.WrongSyntaxCommandError(
+                f"{command_title} takes exactly one argument. Line {line}: {text.strip()}"
+            )
+
+        operand = command_split[1]
+        if opcode == Opcode.IFBLOCK:
+            direction = Opcode.__members__.get(operand)
+            if direction not in MOVES:
+                raise errors.WrongSyntaxCommandError(
+                    f"IFBLOCK direction must be one of UP, DOWN, LEFT, RIGHT. Line {line}: {text.strip()}"
+                )
+            return Token(opcode, direction, line)
+
+        if opcode in (Opcode.PROCEDURE, Opcode.CALL):
+            return Token(opcode, operand, line)
+
+        return Token(opcode, parse_operand(operand), line)
+
+    if len(command_split) != 1:
+        raise errors.WrongSyntaxCommandError(
+            f"{command_title} takes no arguments. Line {line}: {text.strip()}"
+        )
+    return Token(opcode, None, line)
+
+
+def tokenize(lines: Iterable[str]) -> list[Token]:
+    """
+    Scans the source once and returns typed tokens for every
+    non-empty line. Unknown commands and wrong arity are reported here,
+    so later phases never have to split strings again.
+    """
+    tokens = []
+    for line, text in enumerate(lines, start=1):
+        token = tokenize_line(text, line)
+        if token is not None:
+            tokens.append(token)
+
+    return tokens
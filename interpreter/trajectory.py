@@ -0,0 +1,132 @@
+import hashlib
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterable
+
+# Largest coordinate stored in shorts, larger grids need ints, see typecode_for()
+SHORT_MAX = 2 ** 15 - 1
+
+
+def typecode_for(size: int) -> str:
+    # Typecode of a path on a grid with coordinates from 0 to size
+    return "h" if size <= SHORT_MAX else "i"
+
+
+class Trajectory(Sequence):
+    """
+    Sequence of (x, y) points stored in two arrays of shorts, that is
+    4 bytes per point instead of a tuple for each one, or ints for grids
+    larger than SHORT_MAX. Behaves like a list of tuples: supports indexing,
+    slicing, iteration, len() and can be compared with lists.
+    """
+    __slots__ = ("xs", "ys")
+
+    def __init__(self, points: Iterable[tuple[int, int]] = (), typecode: str = "h"):
+        self.xs = array(typecode)
+        self.ys = array(typecode)
+        self.extend(points)
+
+    def append(self, point: tuple[int, int]) -> None:
+        x, y = point
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def extend(self, points: Iterable[tuple[int, int]]) -> None:
+        if isinstance(points, Trajectory):
+            if points.xs.typecode == self.xs.typecode:
+                self.xs.extend(points.xs)
+                self.ys.extend(points.ys)
+            else:
+                self.xs.extend(array(self.xs.typecode, points.xs))
+                self.ys.extend(array(self.ys.typecode, points.ys))
+            return
+
+        xs_append, ys_append = self.xs.append, self.ys.append
+        for x, y in points:
+            xs_append(x)
+            ys_append(y)
+
+    def clear(self) -> None:
+        del self.xs[:]
+        del self.ys[:]
+
+    def corners(self, min_length: float = 0, indexes: array | None = None) -> "Trajectory":
+        """
+        First and last points and the ones where the path turns, lines
+        between them look the same as the whole path. Turns closer than
+        min_length (by x plus y) to the previous kept point are dropped as
+        well, for drawing it is the length of one pixel. If indexes is
+        given, indexes of the kept points in this path are appended to it.
+        """
+        result = Trajectory(typecode=self.xs.typecode)
+        points = iter(self)
+        first = next(points, None)
+        if first is None:
+            return result
+
+        result.append(first)
+        last_x, last_y = prev_x, prev_y = first
+        prev_index = 0
+        if indexes is not None:
+            indexes.append(0)
+        direction = None
+        for index, (x, y) in enumerate(points, 1):
+            step = ((x > prev_x) - (x < prev_x), (y > prev_y) - (y < prev_y))
+            if step == (0, 0):
+                continue
+            if direction is not None and step != direction and (
+                    abs(prev_x - last_x) + abs(prev_y - last_y) >= min_length):
+                result.append((prev_x, prev_y))
+                last_x, last_y = prev_x, prev_y
+                if indexes is not None:
+                    indexes.append(prev_index)
+            direction = step
+            prev_x, prev_y, prev_index = x, y, index
+
+        if (prev_x, prev_y) != (last_x, last_y):
+            result.append((prev_x, prev_y))
+            if indexes is not None:
+                indexes.append(prev_index)
+        return result
+
+    def digest(self) -> str:
+        # sha256 of all xs and then all ys as little endian 32-bit ints,
+        # doesn't depend on the array typecode and the platform
+        xs, ys = array("i", self.xs), array("i", self.ys)
+        if sys.byteorder == "big":
+            xs.byteswap()
+            ys.byteswap()
+        return hashlib.sha256(xs.tobytes() + ys.tobytes()).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            result = Trajectory(typecode=self.xs.typecode)
+            result.xs = self.xs[index]
+            result.ys = self.ys[index]
+            return result
+
+        return self.xs[index], self.ys[index]
+
+    def __iter__(self):
+        return zip(self.xs, self.ys)
+
+    def __reversed__(self):
+        return zip(reversed(self.xs), reversed(self.ys))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, Trajectory):
+            return self.xs == other.xs and self.ys == other.ys
+
+        if isinstance(other, Sequence) and not isinstance(other, str):
+            return len(self) == len(other) and all(
+                point == tuple(other_point) for point, other_point in zip(self, other)
+            )
+
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -0,0 +1,422 @@
+from itertools import islice
+from typing import Callable, TYPE_CHECKING
+
+from interpreter import errors, folding
+from interpreter.compiler import (
+    Bytecode,
+    CALL,
+    DOWN,
+    ENDREPEAT,
+    FAIL,
+    FOLD,
+    HALT,
+    IF_DOWN,
+    IF_LEFT,
+    IF_RIGHT,
+    IF_UP,
+    REPEAT,
+    RETURN,
+)
+from interpreter.grid import DIRECTIONS, DX, DY, Grid
+from interpreter.trajectory import Trajectory
+
+if TYPE_CHECKING:
+    from interpreter.source_map import SourceMap
+
+# force_stop is polled once per this number of loop iterations and calls
+STOP_CHECK_INTERVAL = 1024
+
+# trace(line, opcode, position) is called after an executed instruction
+TraceHook = Callable[[int, int, tuple[int, int]], None]
+
+
+class Machine:
+    """
+    Runs compiled program starting from the grid position and appends
+    every new position to coordinates. If coordinates is None only the
+    final position is computed, so folded loops take O(1).
+
+    run() can be paused by should_stop and then continued with another
+    run() call, the machine keeps its program counter, loops counters and
+    not yet emitted positions of a folded loop.
+
+    If trace is given, instructions are executed one by one with step()
+    and every trace_every-th of them is passed to trace. Folded loops are
+    traced as one instruction, compile the program with fold=False to see
+    every move. Without trace the main loop doesn't check anything.
+
+    If source_map is given and the path is kept, every executed move,
+    folded block and loop event is recorded there, see source_map module. Errors of the
+    run get the line of the failed move in error.line in any case.
+    """
+
+    def __init__(self, bytecode: Bytecode, grid: Grid, coordinates: Trajectory | None,
+                 trace: TraceHook | None = None, trace_every: int = 1, source_map: "SourceMap | None" = None):
+        self.bytecode = bytecode
+        self.grid = grid
+        self.coordinates = coordinates
+        self.pc = 0
+        self.counters = []
+        self.returns = []
+        # positions of a folded loop left after a pause and the position
+        # after that loop
+        self.points = None
+        self.points_end = None
+        # folded loop leaving the grid after self.points and its folding.Failure
+        self.failure = None
+        self.finished = False
+        # executed IFBLOCKs and the ones whose body was skipped
+        self.ifblocks = 0
+        self.ifblocks_skipped = 0
+        self.trace = trace
+        self.trace_every = trace_every
+        self.trace_countdown = trace_every
+        self.source_map = source_map if coordinates is not None else None
+
+    def emit_points(self, should_stop: Callable[[], bool]) -> bool:
+        # Returns False if paused before all positions were emitted
+        chunk = tuple(islice(self.points, STOP_CHECK_INTERVAL))
+        while chunk:
+            self.coordinates.extend(chunk)
+            if should_stop():
+                self.grid.x, self.grid.y = chunk[-1]
+                return False
+            chunk = tuple(islice(self.points, STOP_CHECK_INTERVAL))
+
+        self.grid.x, self.grid.y = self.points_end
+        self.points = None
+        return True
+
+    def run(self, should_stop: Callable[[], bool] = lambda: False) -> bool:
+        """
+        Returns True when the program has finished and False if it was
+        paused by should_stop, which is polled every STOP_CHECK_INTERVAL
+        loop iterations or calls.
+        """
+        if self.finished:
+            return True
+
+        if self.points is not None and not self.emit_points(should_stop):
+            return False
+
+        if self.failure is not None:
+            self.fail()
+
+        if self.trace is not None:
+            return self.run_traced(should_stop)
+
+        code = self.bytecode.code
+        folds = self.bytecode.folds
+        grid = self.grid
+        coordinates = self.coordinates
+        dx, dy = DX, DY
+        x, y = grid.x, grid.y
+        size = grid.size
+        append = coordinates.append if coordinates is not None else None
+        if coordinates is not None:
+            xs_append, ys_append = coordinates.xs.append, coordinates.ys.append
+        counters = self.counters
+        returns = self.returns
+        source_map = self.source_map
+        if source_map is not None:
+            # same as SourceMap.record() and event(), calls are too slow for this loop
+            xs = coordinates.xs
+            starts_append, addresses_append = source_map.starts.append, source_map.addresses.append
+            starts = source_map.starts
+            event_records_append, events_append = source_map.event_records.append, source_map.events.append
+            offset = source_map.offset
+        pc = self.pc
+        budget = STOP_CHECK_INTERVAL
+        ifblocks = skipped = 0
+
+        try:
+            while True:
+                opcode = code[pc]
+                argument = code[pc + 1]
+                pc += 2
+
+                if opcode <= DOWN:
+                    new_x = x + dx[opcode] * argument
+                    new_y = y + dy[opcode] * argument
+                    if not (0 <= new_x <= size and 0 <= new_y <= size):
+                        # Grid raises the error with the usual message
+                        grid.x, grid.y = x, y
+                        grid.move(DIRECTIONS[opcode], argument)
+
+                    x, y = new_x, new_y
+                    if append is not None:
+                        if source_map is not None:
+                            try:
+                                starts_append(len(xs) + offset)
+
+                            except OverflowError:
+                                # the path is longer than 2 ** 31 positions
+                                source_map.widen()
+                                starts, starts_append = source_map.starts, source_map.starts.append
+                                event_records_append = source_map.event_records.append
+                                starts_append(len(xs) + offset)
+                            addresses_append(pc - 2)
+                        xs_append(x)
+                        ys_append(y)
+
+                elif opcode == FOLD:
+                    fold = folds[argument]
+                    if source_map is not None:
+                        try:
+                            starts_append(len(xs) + offset)
+
+                        except OverflowError:
+                            source_map.widen()
+                            starts, starts_append = source_map.starts, source_map.starts.append
+                            event_records_append = source_map.event_records.append
+                            starts_append(len(xs) + offset)
+                        addresses_append(pc - 2)
+                    if not folding.fits(fold, x, y, size):
+                        # positions before the move leaving the grid are emitted
+                        # like the ones of any folded loop, with stop checks
+                        failure = folding.failure(fold, x, y, size)
+                        self.failure = fold, failure
+                        if append is not None:
+                            self.points = islice(folding.path(fold, x, y), failure.index)
+                            self.points_end = failure.x, failure.y
+                            if not self.emit_points(should_stop):
+                                self.pc = pc
+                                return False
+                        self.pc = pc
+                        self.fail()
+
+                    elif append is not None and fold.times == 1 and fold.offsets is not None:
+                        for offset_x, offset_y in fold.offsets:
+                            xs_append(x + offset_x)
+                            ys_append(y + offset_y)
+                        x += fold.dx
+                        y += fold.dy
+
+                    elif append is not None:
+                        self.points = folding.path(fold, x, y)
+                        x += fold.dx * fold.times
+                        y += fold.dy * fold.times
+                        self.points_end = x, y
+                        if not self.emit_points(should_stop):
+                            self.pc = pc
+                            return False
+
+                    else:
+                        x += fold.dx * fold.times
+                        y += fold.dy * fold.times
+
+                elif opcode == ENDREPEAT:
+                    left = counters[-1] - 1
+                    if source_map is not None:
+                        event_records_append(len(starts))
+                        events_append(pc - 2 if left else ~(pc - 2))
+                    if left:
+                        counters[-1] = left
+                        pc = argument
+
+                    else:
+                        counters.pop()
+
+                    # Straight code is bounded by the source size, so it is enough
+                    # to poll should_stop on jumps back and calls
+                    budget -= 1
+                    if not budget:
+                        budget = STOP_CHECK_INTERVAL
+                        if should_stop():
+                            grid.x, grid.y = x, y
+                            self.pc = pc
+                            return False
+
+                elif opcode == REPEAT:
+                    counters.append(argument)
+                    if source_map is not None:
+                        event_records_append(len(starts))
+                        events_append(pc - 2)
+
+                elif opcode == IF_RIGHT:
+                    ifblocks += 1
+                    if x < size:
+                        pc = argument
+                        skipped += 1
+
+                elif opcode == IF_LEFT:
+                    ifblocks += 1
+                    if x > 0:
+                        pc = argument
+                        skipped += 1
+
+                elif opcode == IF_UP:
+                    ifblocks += 1
+                    if y < size:
+                        pc = argument
+                        skipped += 1
+
+                elif opcode == IF_DOWN:
+                    ifblocks += 1
+                    if y > 0:
+                        pc = argument
+                        skipped += 1
+
+                elif opcode == CALL:
+                    returns.append(pc)
+                    pc = argument
+
+                    budget -= 1
+                    if not budget:
+                        budget = STOP_CHECK_INTERVAL
+                        if should_stop():
+                            grid.x, grid.y = x, y
+                            self.pc = pc
+                            return False
+
+                elif opcode == RETURN:
+                    pc = returns.pop()
+
+                elif opcode == HALT:
+                    grid.x, grid.y = x, y
+                    self.pc = pc
+                    self.finished = True
+                    return True
+
+                elif opcode == FAIL:
+                    grid.x, grid.y = x, y
+                    self.pc = pc
+                    error, message = self.bytecode.failures[argument]
+                    raise error(message)
+
+        except errors.Error as error:
+            if error.line is None:
+                error.line = self.bytecode.lines[(pc - 2) // 2]
+            raise
+
+        finally:
+            # counted in locals, they are cheaper than attributes
+            self.ifblocks += ifblocks
+            self.ifblocks_skipped += skipped
+
+    def run_traced(self, should_stop: Callable[[], bool]) -> bool:
+        budget = STOP_CHECK_INTERVAL
+        while self.step():
+            budget -= 1
+            if not budget:
+                budget = STOP_CHECK_INTERVAL
+                if should_stop():
+                    return False
+
+        return True
+
+    def step(self) -> bool:
+        """
+        Executes one instruction, returns False when the program has
+        finished. Slower than run(), but the state is always up to date,
+        so it can be used for stepping through the program.
+        """
+        if self.finished:
+            return False
+
+        grid = self.grid
+        coordinates = self.coordinates
+        if self.points is not None:
+            coordinates.extend(self.points)
+            grid.x, grid.y = self.points_end
+            self.points = None
+        if self.failure is not None:
+            self.fail()
+
+        pc = self.pc
+        opcode = self.bytecode.code[pc]
+        argument = self.bytecode.code[pc + 1]
+        self.pc += 2
+        if self.source_map is not None and (opcode <= DOWN or opcode == FOLD):
+            self.source_map.record(len(coordinates), pc)
+
+        if opcode <= DOWN:
+            try:
+                grid.move(DIRECTIONS[opcode], argument)
+
+            except errors.Error as error:
+                error.line = self.bytecode.lines[pc // 2]
+                raise
+
+            if coordinates is not None:
+                coordinates.append((grid.x, grid.y))
+
+        elif opcode == FOLD:
+            fold = self.bytecode.folds[argument]
+            if not folding.fits(fold, grid.x, grid.y, grid.size):
+                failure = folding.failure(fold, grid.x, grid.y, grid.size)
+                self.failure = fold, failure
+                if coordinates is not None:
+                    coordinates.extend(islice(folding.path(fold, grid.x, grid.y), failure.index))
+                self.fail()
+
+            else:
+                if coordinates is not None:
+                    coordinates.extend(folding.path(fold, grid.x, grid.y))
+                grid.x += fold.dx * fold.times
+                grid.y += fold.dy * fold.times
+
+        elif opcode == ENDREPEAT:
+            self.counters[-1] -= 1
+            if self.source_map is not None:
+                self.source_map.event(pc if self.counters[-1] else ~pc)
+            if self.counters[-1]:
+                self.pc = argument
+            else:
+                self.counters.pop()
+
+        elif opcode == REPEAT:
+            self.counters.append(argument)
+            if self.source_map is not None:
+                self.source_map.event(pc)
+
+        elif IF_RIGHT <= opcode <= IF_DOWN:
+            self.ifblocks += 1
+            if not grid.at_border(DIRECTIONS[opcode - IF_RIGHT]):
+                self.pc = argument
+                self.ifblocks_skipped += 1
+
+        elif opcode == CALL:
+            self.returns.append(self.pc)
+            self.pc = argument
+
+        elif opcode == RETURN:
+            self.pc = self.returns.pop()
+
+        elif opcode == HALT:
+            self.finished = True
+            return False
+
+        elif opcode == FAIL:
+            error, message = self.bytecode.failures[argument]
+            error = error(message)
+            error.line = self.bytecode.lines[pc // 2]
+            raise error
+
+        # RETURN has no source line of its own
+        if self.trace is not None and opcode != RETURN:
+            self.trace_countdown -= 1
+            if not self.trace_countdown:
+                self.trace_countdown = self.trace_every
+                self.trace(self.bytecode.lines[pc // 2], opcode, (grid.x, grid.y))
+
+        return True
+
+    def fail(self) -> None:
+        # Raises the error of the folded loop in self.failure, the move
+        # leaving the grid is made by Grid, so the message is the usual one
+        fold, failure = self.failure
+        self.failure = None
+        self.grid.x, self.grid.y = failure.x, failure.y
+        try:
+            self.grid.move(DIRECTIONS[failure.direction], failure.steps)
+
+        except errors.Error as error:
+            error.line, _ = folding.locate(fold, failure.index)
+            raise
+
+
+def run(bytecode: Bytecode, grid: Grid, coordinates: Trajectory | None,
+        should_stop: Callable[[], bool] = lambda: False) -> bool:
+    # Runs the whole program, returns False if it was stopped
+    return Machine(bytecode, grid, coordinates).run(should_stop)
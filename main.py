@@ -4,6 +4,7 @@ import sys
 from PyQt5 import QtWidgets
 
 from core_tools.logger import setup_logger
+from interpreter.grid import GRID_SIZE
 from interpreter.interpreter_file import Interpreter
 from ui.db_bridge import DBManager
 from ui.ui import Ui
@@ -15,6 +16,6 @@ if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
     logger = setup_logger()
     db = DBManager()
-    interpreter = Interpreter()
+    interpreter = Interpreter(grid_size=int(db.get_settings().get("grid_size", GRID_SIZE)))
     window = Ui(interpreter, db, logger)
     app.exec_()
@@ -1,6 +1,34 @@
+import asyncio
+import contextlib
+import io
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
 import unittest
-
-from interpreter import errors, interpreter_file
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from benchmarks import bench_phases
+from interpreter import (
+    __main__ as cli,
+    cache,
+    compiler,
+    errors,
+    executor,
+    grid,
+    interpreter_file,
+    parser,
+    program,
+    render,
+    source_map,
+    spatial,
+    stats,
+    tokenizer,
+    trajectory,
+    vm,
+)
 
 
 class TestInterpreter(unittest.TestCase):
@@ -114,3 +142,561 @@ class TestInterpreter(unittest.TestCase):
 
         except errors.WrongSyntaxCommandError as error:
             self.assertEqual(error.get_message(), "WrongSyntaxCommandError: You can't move LEFT -5 times")
+
+    def test_ifblocks3_nested_skip(self):
+        interpreter = interpreter_file.Interpreter()
+        result = interpreter.execute("test_programs/test_ifblocks3.txt")
+
+        self.assertEqual(result, [(0, 0)])
+
+    def test_loops_are_not_unrolled(self):
+        tokens = tokenizer.tokenize(["REPEAT 1000", "REPEAT 1000", "REPEAT 1000", "UP 1", "DOWN 1",
+                                     "ENDREPEAT", "ENDREPEAT", "ENDREPEAT"])
+        program = parser.parse(tokens)
+
+        self.assertEqual(len(program.body), 1)
+        self.assertEqual(program.body[0].body[0].body[0].body, (
+            parser.Move(tokenizer.Opcode.UP, 1, 4),
+            parser.Move(tokenizer.Opcode.DOWN, 1, 5),
+        ))
+
+    def test_vm_matches_tree_executor(self):
+        tokens = tokenizer.tokenize(["PROCEDURE A", "UP 1", "ENDPROC", "PROCEDURE B", "CALL A", "RIGHT 2", "ENDPROC",
+                                     "REPEAT 3", "CALL B", "IFBLOCK UP", "DOWN 3", "ENDIF", "ENDREPEAT",
+                                     "REPEAT 2", "REPEAT 2", "RIGHT 1", "ENDREPEAT", "ENDREPEAT"])
+        program = parser.parse(tokens)
+        tree_coordinates = [(0, 0)]
+        executor.TreeExecutor(program, grid.Grid(), tree_coordinates).run()
+        vm_coordinates = trajectory.Trajectory([(0, 0)])
+        vm.run(compiler.compile_program(program), grid.Grid(), vm_coordinates)
+
+        self.assertEqual(vm_coordinates, tree_coordinates)
+        self.assertEqual(vm_coordinates[-1], (10, 3))
+
+    def test_folded_repeat(self):
+        tokens = tokenizer.tokenize(["REPEAT 10", "REPEAT 1000", "RIGHT 1", "LEFT 1", "ENDREPEAT", "UP 2",
+                                     "DOWN 1", "ENDREPEAT", "IFBLOCK LEFT", "RIGHT 3", "ENDIF"])
+        bytecode = compiler.compile_program(parser.parse(tokens))
+        position = grid.Grid()
+        vm.run(bytecode, position, None)
+
+        self.assertEqual(len(bytecode.folds), 1)
+        self.assertEqual(position.get_coords(), (3, 10))
+
+        coordinates = trajectory.Trajectory([(0, 0)])
+        vm.run(bytecode, grid.Grid(), coordinates)
+        self.assertEqual(len(coordinates), 1 + 10 * 2002 + 1)
+        self.assertEqual(coordinates[2000:2003], [(0, 0), (0, 2), (0, 1)])
+
+    def test_folded_repeat_out_of_bounds(self):
+        tokens = tokenizer.tokenize(["REPEAT 10", "UP 3", "RIGHT 1", "DOWN 1", "ENDREPEAT"])
+        bytecode = compiler.compile_program(parser.parse(tokens))
+        coordinates = trajectory.Trajectory([(0, 0)])
+
+        with self.assertRaises(errors.GridOutOfBounceError) as error:
+            vm.run(bytecode, grid.Grid(), coordinates)
+
+        self.assertEqual(error.exception.get_message(), "GridOutOfBounceError: Invalid direction. "
+                                                        "It must be between 0 and 20. You can't move up 3 times. "
+                                                        "Your previous position: (9, 18)")
+        self.assertEqual(coordinates[-1], (9, 18))
+
+    def test_straight_block_out_of_bounds(self):
+        tokens = tokenizer.tokenize(["UP 5", "RIGHT 3", "DOWN 6", "LEFT 1"])
+        bytecode = compiler.compile_program(parser.parse(tokens))
+        coordinates = trajectory.Trajectory([(0, 0)])
+
+        with self.assertRaises(errors.GridOutOfBounceError) as error:
+            vm.run(bytecode, grid.Grid(), coordinates)
+
+        self.assertEqual(bytecode.code[0], compiler.FOLD)
+        self.assertEqual(error.exception.get_message(), "GridOutOfBounceError: Invalid direction. "
+                                                        "It must be between 0 and 20. You can't move down 6 times. "
+                                                        "Your previous position: (3, 5)")
+        self.assertEqual(coordinates, [(0, 0), (0, 5), (3, 5)])
+
+    def test_iter_execute(self):
+        interpreter = interpreter_file.Interpreter()
+        result = interpreter.execute("test_programs/program1.txt")
+
+        self.assertEqual(list(interpreter.iter_execute("test_programs/program1.txt", chunk_size=2)), result)
+
+        interpreter.prepare("test_programs/program1.txt")
+        way = trajectory.Trajectory()
+        for chunk in interpreter.iter_chunks(2):
+            self.assertIsInstance(chunk, trajectory.Trajectory)
+            way.extend(chunk)
+        self.assertEqual(way, result)
+
+    def test_iter_execute_close(self):
+        interpreter = interpreter_file.Interpreter()
+        way = interpreter.iter_execute("test_programs/test_ui_with_proc.txt")
+
+        self.assertEqual(next(way), (0, 0))
+        self.assertEqual(next(way), (0, 2))
+        way.close()
+        with self.assertRaises(StopIteration):
+            next(way)
+
+    def test_execute_source(self):
+        interpreter = interpreter_file.Interpreter()
+        with open("test_programs/program2.txt") as file:
+            source = file.read()
+
+        self.assertEqual(interpreter.execute_source(source), [(0, 0), (2, 0), (4, 0), (6, 0), (8, 0)])
+        self.assertEqual(interpreter.execute_stream(io.BytesIO(source.encode())),
+                         [(0, 0), (2, 0), (4, 0), (6, 0), (8, 0)])
+        self.assertEqual(interpreter.execute_source("UP 2\nRIGHT 6"), [(0, 0), (0, 2), (6, 2)])
+
+    def test_compiled_program_cache(self):
+        interpreter = interpreter_file.Interpreter(cache_size=2)
+        for _ in range(3):
+            interpreter.execute("test_programs/program1.txt")
+        interpreter.execute_source("UP 1")
+        interpreter.execute_source("UP 2")
+        result = interpreter.execute("test_programs/program1.txt")
+
+        self.assertEqual(result, [(0, 0), (2, 0), (4, 0), (6, 0), (8, 0), (8, 2), (8, 4)])
+        self.assertEqual(interpreter.cache.info(), cache.CacheInfo(hits=2, misses=4, maxsize=2, currsize=2))
+
+    def test_cached_result(self):
+        interpreter = interpreter_file.Interpreter(cache_results=True)
+        result1 = interpreter.execute("test_programs/test_ui_with_proc.txt")
+        result2 = interpreter.execute("test_programs/test_ui_with_proc.txt")
+
+        self.assertEqual(result1, result2)
+        self.assertIsNot(result1, result2)
+        self.assertEqual(interpreter.interpreter_get_coords(), (15, 10))
+        self.assertEqual(interpreter.cache.hits, 1)
+
+        # results depend on the grid size
+        self.assertEqual(interpreter.execute_source("RIGHT 10"), [(0, 0), (10, 0)])
+        interpreter.grid_size = 5
+        with self.assertRaises(errors.GridOutOfBounceError):
+            interpreter.execute_source("RIGHT 10")
+        interpreter.grid_size = 100_000
+        self.assertEqual(interpreter.execute_source("RIGHT 10").xs.typecode, "i")
+
+    def test_disk_cache(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            result1 = interpreter_file.Interpreter(cache_dir=cache_dir).execute("test_programs/test_ui_with_proc.txt")
+            interpreter = interpreter_file.Interpreter(cache_dir=cache_dir)
+            result2 = interpreter.execute("test_programs/test_ui_with_proc.txt")
+
+            self.assertEqual(result1, result2)
+            self.assertEqual(interpreter.disk_cache.hits, 1)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+
+    def test_disk_cache_broken_entry(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            interpreter = interpreter_file.Interpreter(cache_size=0, cache_dir=cache_dir)
+            interpreter.execute_source("RIGHT 2")
+            path = interpreter.disk_cache.path(interpreter.disk_cache.key("RIGHT 2"))
+            with open(path, "wb") as file:
+                file.write(b"broken")
+
+            self.assertEqual(interpreter.execute_source("RIGHT 2"), [(0, 0), (2, 0)])
+            self.assertEqual(interpreter.disk_cache.misses, 2)
+            self.assertEqual(interpreter.execute_source("RIGHT 2"), [(0, 0), (2, 0)])
+            self.assertEqual(interpreter.disk_cache.hits, 1)
+
+    def test_disk_cache_unwritable(self):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            # the directory can't be made, the program still runs
+            path = os.path.join(cache_dir, "file")
+            open(path, "w").close()
+            interpreter = interpreter_file.Interpreter(cache_dir=os.path.join(path, "cache"))
+
+            self.assertEqual(interpreter.execute_source("RIGHT 2"), [(0, 0), (2, 0)])
+            self.assertEqual(os.listdir(cache_dir), ["file"])
+
+    def test_execution_stats(self):
+        interpreter = interpreter_file.Interpreter()
+        source = "REPEAT 3\nRIGHT 10\nIFBLOCK RIGHT\nLEFT 20\nENDIF\nENDREPEAT"
+        execution_stats = stats.ExecutionStats()
+        interpreter.execute_source(source, stats=execution_stats)
+
+        self.assertEqual(list(execution_stats.phases), ["tokenize", "get_variables", "parse", "compile", "run"])
+        self.assertEqual(execution_stats.moves, 4)
+        self.assertEqual(execution_stats.ifblocks_taken, 1)
+        self.assertEqual(execution_stats.ifblocks_skipped, 2)
+        self.assertIsNone(interpreter.stats)
+
+        execution_stats = stats.ExecutionStats()
+        interpreter.execute_source(source, stats=execution_stats)
+        self.assertEqual(execution_stats.cache, "memory")
+        self.assertEqual(list(execution_stats.phases), ["run"])
+
+    def test_trace_hook(self):
+        events = []
+        interpreter = interpreter_file.Interpreter()
+        interpreter.set_trace(lambda line, opcode, position: events.append((line, opcode, position)))
+        result = interpreter.execute_source("REPEAT 2\nRIGHT 10\nIFBLOCK RIGHT\nUP 1\nENDIF\nENDREPEAT")
+
+        self.assertEqual(result, [(0, 0), (10, 0), (20, 0), (20, 1)])
+        self.assertEqual(events, [
+            (1, compiler.REPEAT, (0, 0)),
+            (2, compiler.RIGHT, (10, 0)),
+            (3, compiler.IF_RIGHT, (10, 0)),
+            (1, compiler.ENDREPEAT, (10, 0)),
+            (2, compiler.RIGHT, (20, 0)),
+            (3, compiler.IF_RIGHT, (20, 0)),
+            (4, compiler.UP, (20, 1)),
+            (1, compiler.ENDREPEAT, (20, 1)),
+        ])
+
+        events.clear()
+        interpreter.set_trace(lambda line, opcode, position: events.append(line), every=3)
+        interpreter.execute_source("REPEAT 2\nRIGHT 10\nIFBLOCK RIGHT\nUP 1\nENDIF\nENDREPEAT")
+        self.assertEqual(events, [3, 3])
+
+        # returns from procedures have no line
+        events.clear()
+        interpreter.set_trace(lambda line, opcode, position: events.append((line, opcode)))
+        interpreter.execute_source("PROCEDURE P\nRIGHT 1\nENDPROC\nCALL P")
+        self.assertEqual(events, [(4, compiler.CALL), (2, compiler.RIGHT)])
+        with self.assertRaises(ValueError):
+            interpreter.set_trace(lambda line, opcode, position: None, every=0)
+
+    def test_traced_run_matches_vm(self):
+        for program_file in ("test_programs/test_ui_with_proc.txt", "test_programs/3nested_proc.txt"):
+            interpreter = interpreter_file.Interpreter()
+            expected = interpreter.execute(program_file)
+            interpreter.set_trace(lambda line, opcode, position: None)
+
+            self.assertEqual(interpreter.execute(program_file), expected)
+
+    def test_max_steps(self):
+        interpreter = interpreter_file.Interpreter()
+        source = "REPEAT 1000\nREPEAT 1000\nRIGHT 1\nLEFT 1\nENDREPEAT\nENDREPEAT"
+        with self.assertRaises(errors.ExecutionLimitError) as context:
+            interpreter.execute_source(source, max_steps=5001)
+
+        self.assertEqual(len(context.exception.coordinates), 5002)
+        self.assertEqual(context.exception.coordinates[-2:], [(0, 0), (1, 0)])
+        self.assertEqual(interpreter.interpreter_get_coords(), (1, 0))
+        self.assertEqual(interpreter.execute_source("RIGHT 1\nLEFT 1", max_steps=2), [(0, 0), (1, 0), (0, 0)])
+
+    def test_limits_of_failing_fold(self):
+        # the folded loop leaves the grid only after a million moves
+        source = "REPEAT 1000\nREPEAT 1000\nREPEAT 100\nRIGHT 1\nLEFT 1\nENDREPEAT\nENDREPEAT\nRIGHT 1\nENDREPEAT"
+        interpreter = interpreter_file.Interpreter()
+        with self.assertRaises(errors.ExecutionLimitError):
+            interpreter.execute_source(source, max_steps=1000)
+
+        with self.assertRaises(errors.GridOutOfBounceError) as error:
+            interpreter.execute_source(source, keep_path=False)
+        self.assertEqual(error.exception.line, 4)
+        self.assertEqual(interpreter.interpreter_get_coords(), (20, 0))
+
+    def test_timeout(self):
+        interpreter = interpreter_file.Interpreter()
+        source = "REPEAT 1000\nREPEAT 1000\nIFBLOCK RIGHT\nLEFT 1\nENDIF\nRIGHT 1\nLEFT 1\nENDREPEAT\nENDREPEAT"
+        with self.assertRaises(errors.ExecutionLimitError) as context:
+            interpreter.execute_source(source, keep_path=False, timeout=0.05)
+
+        self.assertEqual(context.exception.coordinates, [(0, 0)])
+
+    def test_compiled_program_in_threads(self):
+        compiled = interpreter_file.Interpreter().compile_source(
+            "REPEAT 100\nRIGHT 10\nIFBLOCK RIGHT\nLEFT 20\nENDIF\nENDREPEAT"
+        )
+        expected = compiled.run()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda _: program.ExecutionContext(compiled).run(), range(8)))
+
+        self.assertEqual(len(expected), 151)
+        self.assertTrue(all(result == expected for result in results))
+        self.assertEqual(pickle.loads(pickle.dumps(compiled)).run(keep_path=False), [(0, 0)])
+
+    def test_execute_async(self):
+        interpreter = interpreter_file.Interpreter()
+        long_source = "REPEAT 1000\nREPEAT 100\nIFBLOCK RIGHT\nLEFT 20\nENDIF\nRIGHT 1\nENDREPEAT\nENDREPEAT"
+        order = []
+
+        async def run(source):
+            result = await interpreter.execute_async(source, keep_path=False)
+            order.append(source)
+            return result
+
+        async def main():
+            return await asyncio.gather(run(long_source), run("UP 3"))
+
+        long_result, short_result = asyncio.run(main())
+        self.assertEqual(order, ["UP 3", long_source])
+        self.assertEqual(long_result, interpreter.execute_source(long_source, keep_path=False))
+        self.assertEqual(short_result, [(0, 3)])
+        self.assertEqual(interpreter.cache.hits, 1)
+
+    def test_execute_async_in_process_pool(self):
+        interpreter = interpreter_file.Interpreter()
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            result = asyncio.run(interpreter.execute_async("REPEAT 3\nRIGHT 2\nENDREPEAT", executor=pool))
+            with self.assertRaises(errors.ExecutionLimitError):
+                asyncio.run(interpreter.execute_async("RIGHT 1\nLEFT 1", max_steps=1, executor=pool))
+
+        self.assertEqual(result, [(0, 0), (2, 0), (4, 0), (6, 0)])
+
+    def test_grid_size(self):
+        source = "REPEAT 100\nRIGHT 1000\nUP 1000\nENDREPEAT"
+        with self.assertRaises(errors.GridOutOfBounceError):
+            interpreter_file.Interpreter().execute_source(source)
+
+        result = interpreter_file.Interpreter(grid_size=1_000_000).execute_source(source)
+        self.assertEqual(result[-1], (100_000, 100_000))
+        self.assertEqual(result.xs.typecode, "i")
+
+        with self.assertRaises(errors.GridOutOfBounceError):
+            interpreter_file.Interpreter(grid_size=5).execute_source("RIGHT 6")
+        with self.assertRaises(ValueError):
+            interpreter_file.Interpreter(grid_size=0)
+
+    def test_source_map(self):
+        source = (
+            "PROCEDURE P\nREPEAT 2\nRIGHT 1\nUP 1\nENDREPEAT\nENDPROC\n"
+            "REPEAT 2\nIFBLOCK LEFT\nRIGHT 1\nENDIF\nCALL P\nDOWN 1\nENDREPEAT\nLEFT 1"
+        )
+        interpreter = interpreter_file.Interpreter()
+        path_map = source_map.SourceMap()
+        result = interpreter.execute_source(source, source_map=path_map)
+
+        self.assertEqual(len(result), 13)
+        self.assertIsNone(path_map.locate(0))
+        self.assertEqual(path_map.locate(1), (9, (1,)))
+        self.assertEqual(path_map.locate(4), (3, (1, 2)))
+        self.assertEqual(path_map.locate(10), (4, (2, 2)))
+        self.assertEqual(path_map.locate(11), (12, (2,)))
+        self.assertEqual(path_map.locate(12), (14, ()))
+
+        streamed = source_map.SourceMap()
+        list(interpreter.iter_execute_source(source, chunk_size=2, source_map=streamed))
+        self.assertEqual([streamed.locate(i) for i in range(13)], [path_map.locate(i) for i in range(13)])
+
+        # iterations past a few checkpoints of loop events
+        path_map = source_map.SourceMap()
+        interpreter.execute_source(
+            "REPEAT 3\nREPEAT 1000\nIFBLOCK LEFT\nENDIF\nRIGHT 1\nLEFT 1\nENDREPEAT\nENDREPEAT", source_map=path_map
+        )
+        self.assertEqual(path_map.locate(2600), (6, (2, 300)))
+        self.assertEqual(path_map.locate(4001), (5, (3, 1)))
+        self.assertEqual(path_map.locate(6000), (6, (3, 1000)))
+
+        # starts are widened when the path gets longer than 32 bits
+        compiled = interpreter.compile_source("REPEAT 3\nIFBLOCK LEFT\nENDIF\nRIGHT 1\nENDREPEAT")
+        path_map = source_map.SourceMap()
+        path_map.start(compiled.bytecode)
+        path_map.offset = 2 ** 31 - 2
+        vm.Machine(compiled.bytecode, grid.Grid(), trajectory.Trajectory(), source_map=path_map).run()
+        self.assertEqual(path_map.starts.typecode, "q")
+        self.assertEqual(path_map.locate(2 ** 31), (4, (3,)))
+
+    def test_source_map_matches_trace(self):
+        for program_file in ("test_programs/test_ui_with_proc.txt", "test_programs/program1.txt"):
+            interpreter = interpreter_file.Interpreter()
+            path_map = source_map.SourceMap()
+            result = interpreter.execute(program_file, source_map=path_map)
+            lines = []
+            interpreter.set_trace(lambda line, opcode, position: opcode <= compiler.DOWN and lines.append(line))
+            interpreter.execute(program_file)
+
+            self.assertEqual([path_map.locate(i).line for i in range(1, len(result))], lines)
+
+    def test_error_line(self):
+        interpreter = interpreter_file.Interpreter()
+        with self.assertRaises(errors.GridOutOfBounceError) as error:
+            interpreter.execute_source("REPEAT 3\nRIGHT 5\nUP 1\nENDREPEAT\nRIGHT 1\nRIGHT 10")
+        self.assertEqual(error.exception.line, 6)
+
+        with self.assertRaises(errors.GridOutOfBounceError) as error:
+            interpreter.execute_source("RIGHT 5\nIFBLOCK LEFT\nENDIF\nUP 21")
+        self.assertEqual(error.exception.line, 4)
+
+        # positions before the failed move are emitted, by chunks as well
+        source = "REPEAT 3\nRIGHT 5\nUP 1\nENDREPEAT\nREPEAT 5\nRIGHT 2\nENDREPEAT"
+        with self.assertRaises(errors.GridOutOfBounceError) as error:
+            interpreter.execute_source(source)
+        self.assertEqual(error.exception.line, 6)
+        self.assertEqual(interpreter.coordinates[-1], (19, 3))
+        way = []
+        with self.assertRaises(errors.GridOutOfBounceError):
+            way.extend(interpreter.iter_execute_source(source, chunk_size=2))
+        self.assertEqual(way[-1], (19, 3))
+
+
+class TestBatchRunner(unittest.TestCase):
+
+    def test_find_programs(self):
+        programs = cli.find_programs(["test_programs", "test_programs/program.txt"])
+
+        self.assertIn("test_programs/1.txt", programs)
+        self.assertEqual(programs[-1], "test_programs/program.txt")
+        self.assertEqual(cli.find_programs(["test_programs/test_ifblocks*.txt"]), [
+            "test_programs/test_ifblocks1.txt", "test_programs/test_ifblocks2.txt", "test_programs/test_ifblocks3.txt",
+        ])
+
+    def test_run_program(self):
+        result = cli.run_program("test_programs/test_ui_with_proc.txt", with_path=True)
+
+        self.assertEqual(result["coords"], [15, 10])
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["path_hash"], trajectory.Trajectory(result["path"]).digest())
+
+    def test_run_program_error(self):
+        result = cli.run_program("test_programs/out_of_bounds_error.txt")
+
+        self.assertIsNone(result["coords"])
+        self.assertEqual(result["error"], "GridOutOfBounceError")
+
+    def test_thumbnails(self):
+        self.addCleanup(cli.init_worker, None)
+        with tempfile.TemporaryDirectory() as directory, contextlib.redirect_stdout(io.StringIO()) as output:
+            cli.main(["test_programs/test_ui_with_proc.txt", "--thumbnails", directory, "--thumbnail-format", "svg"])
+            filename = os.path.join(directory, "test_programs_test_ui_with_proc.svg")
+            with open(filename, encoding="utf-8") as file:
+                self.assertIn("<polyline", file.read())
+
+        self.assertIn(filename, output.getvalue())
+
+    def test_thumbnail_error(self):
+        self.addCleanup(cli.init_worker, None)
+        with tempfile.TemporaryDirectory() as directory:
+            # a file where the directory of thumbnails should be
+            path = os.path.join(directory, "thumbnails")
+            open(path, "w").close()
+            cli.init_worker(None, thumbnail_dir=path)
+            result = cli.run_program("test_programs/test_ui_with_proc.txt")
+
+        self.assertEqual(result["coords"], [15, 10])
+        self.assertIsNone(result["error"])
+        self.assertIsNone(result["thumbnail"])
+        self.assertIsNotNone(result["thumbnail_error"])
+
+    def test_no_gui_imports(self):
+        # Headless runs must not depend on PyQt5 and lark, the check runs in a
+        # new process because the tests may have imported them already
+        code = "import sys, interpreter.__main__, core_tools.logger; print(' '.join(sys.modules))"
+        modules = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout.split()
+
+        self.assertFalse([name for name in modules if name.split(".")[0] in ("PyQt5", "lark")])
+
+
+class TestBenchmarks(unittest.TestCase):
+
+    def test_time_phases(self):
+        times = bench_phases.time_phases("REPEAT 3\nRIGHT 2\nENDREPEAT", keep_path=True, repeat=1)
+
+        self.assertEqual(list(times), list(bench_phases.PHASES))
+        self.assertTrue(all(0 <= elapsed < 1 for elapsed in times.values()))
+
+
+class TestRender(unittest.TestCase):
+
+    def test_png(self):
+        image = render.render_png([(0, 0), (0, 5), (3, 5)], size=64)
+
+        self.assertTrue(image.startswith(b"\x89PNG\r\n\x1a\n"))
+        self.assertEqual(image[12:24], b"IHDR" + (64).to_bytes(4, "big") * 2)
+
+    def test_svg(self):
+        image = render.render_svg([(0, 0), (0, 1), (0, 2), (1, 2)], size=210, cell_num=20)
+
+        self.assertIn('points="5,205 5,185 15,185"', image)
+
+    def test_huge_grid_lines_are_thinned(self):
+        self.assertLessEqual(len(render.grid_lines(256, 1_000_000)), 256 // render.MIN_LINE_SPACING + 1)
+
+    def test_viewport(self):
+        view = render.Viewport.whole(20)
+        self.assertEqual(view.to_pixels(0, 0, 210), (5, 205))
+        self.assertEqual(view.to_grid(5, 205, 210), (0, 0))
+
+        zoomed = view.zoom(2, 10, 10, 20)
+        self.assertEqual(zoomed, render.Viewport(4.75, 4.75, 10.5))
+        self.assertEqual(zoomed.grid_lines(210, 20)[0], [5, 25, 45, 65, 85, 105, 125, 145, 165, 185, 205])
+        # the view never leaves the grid and can't be zoomed out further than the whole grid
+        self.assertEqual(zoomed.pan(100, -100, 20), render.Viewport(10, -0.5, 10.5))
+        self.assertEqual(zoomed.zoom(0.1, 0, 0, 20), view)
+        self.assertEqual(view.zoom(1000, 0, 0, 20).span, render.MIN_VIEW_SPAN)
+
+
+class TestSegmentIndex(unittest.TestCase):
+
+    def test_query(self):
+        points = [(0, 0)]
+        for i in range(1, 300):
+            x, y = points[-1]
+            points.append((x + (i * 7) % 23, y) if i % 2 else (x, (y + i * 13) % 500))
+        points.append((0, points[-1][1]))
+        index = spatial.SegmentIndex(points)
+        rects = [(0, 0, 10, 10), (100.5, 40, 300, 45.5), (-5, -5, 10 ** 6, 10 ** 6), (2000, 0, 3000, 10)]
+        for rect in rects:
+            expected = [i for i in range(len(index)) if index.crosses(i, *rect)]
+            self.assertEqual(index.query(*rect), expected)
+            self.assertEqual(index.crossing(*rect), expected)
+
+    def test_polylines(self):
+        index = spatial.SegmentIndex([(0, 0), (0, 5), (5, 5), (5, 5), (5, 0), (0, 0)])
+
+        self.assertEqual(len(index), 4)
+        self.assertEqual(index.query(4, 1, 6, 2), [2])
+        self.assertEqual(index.polylines([0, 1, 3]), [[(0, 0), (0, 5), (5, 5)], [(5, 0), (0, 0)]])
+
+    def test_nearest(self):
+        index = spatial.SegmentIndex([(0, 0), (0, 5), (5, 5), (0, 5)], [0, 5, 10, 15])
+
+        self.assertEqual(index.nearest(2, 5.5, 1), 2)
+        self.assertEqual(index.nearest(0.5, 1, 1), 0)
+        self.assertIsNone(index.nearest(3, 1, 1))
+        self.assertEqual(list(index.positions), [0, 5, 10, 15])
+
+
+class TestTokenizer(unittest.TestCase):
+
+    def test_tokens_are_typed(self):
+        tokens = tokenizer.tokenize(["SET X = 2\n", "\n", "    UP X\n", "IFBLOCK LEFT\n", "RIGHT 3\n", "ENDIF"])
+
+        self.assertEqual(tokens, [
+            tokenizer.Token(tokenizer.Opcode.SET, ("X", 2), 1),
+            tokenizer.Token(tokenizer.Opcode.UP, "X", 3),
+            tokenizer.Token(tokenizer.Opcode.IFBLOCK, tokenizer.Opcode.LEFT, 4),
+            tokenizer.Token(tokenizer.Opcode.RIGHT, 3, 5),
+            tokenizer.Token(tokenizer.Opcode.ENDIF, None, 6),
+        ])
+
+    def test_wrong_arguments_number(self):
+        with self.assertRaises(errors.WrongSyntaxCommandError):
+            tokenizer.tokenize(["UP 2 3"])
+
+        with self.assertRaises(errors.IncorrectRepeatDeclarationError):
+            tokenizer.tokenize(["REPEAT"])
+
+
+class TestTrajectory(unittest.TestCase):
+
+    def test_behaves_like_list(self):
+        points = [(0, 0), (0, 2), (5, 2), (5, 1)]
+        way = trajectory.Trajectory(points)
+        way.append((6, 1))
+        points.append((6, 1))
+
+        self.assertEqual(way, points)
+        self.assertEqual(len(way), 5)
+        self.assertEqual(way[-1], (6, 1))
+        self.assertEqual(way[1:3], [(0, 2), (5, 2)])
+        self.assertEqual(list(way), points)
+        self.assertEqual(str(way), str(points))
+        self.assertEqual(way.xs.itemsize + way.ys.itemsize, 4)
+
+    def test_corners(self):
+        way = trajectory.Trajectory([(0, 0), (1, 0), (2, 0), (2, 0), (2, 1), (2, 2), (1, 2), (2, 2), (3, 2)])
+
+        self.assertEqual(way.corners(), [(0, 0), (2, 0), (2, 2), (1, 2), (3, 2)])
+        self.assertEqual(way.corners(min_length=3), [(0, 0), (2, 2), (3, 2)])
+        self.assertEqual(trajectory.Trajectory([(4, 4)]).corners(), [(4, 4)])
+        self.assertEqual(trajectory.Trajectory().corners(), [])
+
+        indexes = array("q")
+        way.corners(min_length=3, indexes=indexes)
+        self.assertEqual(list(indexes), [0, 5, 8])
@@ -1,99 +1,107 @@
 import logging
-import os
+import time
+from array import array
 
 from PyQt5.QtCore import QObject, pyqtSignal
-from PyQt5.QtGui import QIcon
+from PyQt5.QtGui import QImage
 
+from interpreter.source_map import SourceMap
+from interpreter.spatial import SegmentIndex
+from interpreter.trajectory import Trajectory, typecode_for
 
-BASE_DIR = os.path.dirname(__file__)
+from .field import FRAME_INTERVAL, PathBuffer
+
+
+# positions are taken by chunks of about this size, the coordinates label
+# is updated once per chunk
+COORDS_UPDATE_INTERVAL = 4096
 
 
 class Worker(QObject):
+    """
+    Runs the program in its own thread. Widgets are never touched here,
+    everything goes to the GUI thread through queued signals. The path is
+    drawn into a PathBuffer while the program runs, so the GUI thread only
+    has to show ready images.
+    """
+    started = pyqtSignal()
     finished = pyqtSignal()
+    # the path to animate and its SourceMap, the animation runs on the GUI thread
+    animation_ready = pyqtSignal(object, object)
+    # QImage is passed by value, so Qt shares it between the threads safely,
+    # the view is the render.Viewport the image shows
+    frame_ready = pyqtSignal(QImage, object)
+    # the path, its SourceMap and SegmentIndex, its image and view, a null
+    # image if the field had no size
+    path_ready = pyqtSignal(object, object, object, QImage, object)
+    coords_changed = pyqtSignal(str)
+    # text and logging level
+    message = pyqtSignal(object, int)
+    # source line of the command the program has failed on
+    error_line = pyqtSignal(int)
 
     def __init__(self, interpreter, parent=None):
         super().__init__()
         self.interpreter = interpreter
         self.parent = parent
-        self.stop_img = QIcon(os.path.join(BASE_DIR, "./assets/stop-icon.png"))
-        self.run_img = QIcon(os.path.join(BASE_DIR, "./assets/run-icon.png"))
-        self.run_slow_img = QIcon(os.path.join(BASE_DIR, "./assets/run-animated-icon.png"))
         self.force_stop = False
         self.animate = False
-        self.drawing = False
+        # program text from the editor, set before the thread starts
+        self.source = ""
 
     def run(self):
-        self.paint_btn()
+        self.started.emit()
+        buffer = None
         try:
-            self.parent.way = self.interpreter.execute(self.parent.filename)
+            way = Trajectory(typecode=typecode_for(self.interpreter.grid_size))
+            # tells which line has made a point clicked on the field
+            source_map = SourceMap()
+            last_frame = time.monotonic()
+            # chunks of positions come while the program is running, so the
+            # label and the field show progress of long programs
+            self.interpreter.prepare_source(self.source)
+            for chunk in self.interpreter.iter_chunks(COORDS_UPDATE_INTERVAL, source_map):
+                way.extend(chunk)
+                x, y = chunk[-1]
+                self.coords_changed.emit(f"X: {x}\n Y: {y}")
+                if not self.animate and time.monotonic() - last_frame > FRAME_INTERVAL / 1000:
+                    buffer = self.draw(buffer, way)
+                    self.frame_ready.emit(buffer.frame(), buffer.view)
+                    last_frame = time.monotonic()
             if not self.force_stop:
-                result_x, result_y = self.parent.way[-1][0], self.parent.way[-1][1]
-                self.parent.cords.setText(f"X: {result_x}\n Y: {result_y}")
-                self.parent.log(self.parent.way)
+                result_x, result_y = way[-1]
+                self.coords_changed.emit(f"X: {result_x}\n Y: {result_y}")
+                self.message.emit(str(way), logging.INFO)
         except Exception as ex:
-            self.parent.cords.setText("X: ---\nY: ---")
-            self.parent.way = []
-            self.parent.log(ex, level=logging.ERROR)
+            self.coords_changed.emit("X: ---\nY: ---")
+            way = []
+            source_map = None
+            self.message.emit(ex, logging.ERROR)
+            if getattr(ex, "line", None) is not None:
+                self.error_line.emit(ex.line)
         if not self.force_stop:
-            self.drawing = True
             if self.animate:
-                if len(self.parent.way) < 100:
-                    self.parent.preview.update(self.parent.way, 0.01)
-                else:
-                    self.parent.log("The way is too long to be animated")
-                    self.parent.preview.update(self.parent.way)
+                self.animation_ready.emit(way, source_map)
+            elif way:
+                # the index is built here, so zooming the field never walks the whole path
+                buffer = self.draw(buffer, way)
+                positions = array("q")
+                index = SegmentIndex(way.corners(indexes=positions), positions)
+                self.path_ready.emit(way, source_map, index, buffer.frame(), buffer.view)
             else:
-                self.parent.preview.update(self.parent.way)
-            self.drawing = False
-        self.repaint_btn_back()
+                self.path_ready.emit(way, source_map, SegmentIndex(), QImage(), None)
         self.force_stop = False
         self.interpreter.force_stop = False
         self.finished.emit()
 
-    def paint_btn(self):
-        style = """
-            QPushButton {
-                border-radius: 4px;
-                background: rgb(170, 60, 60);
-            }
-
-            QPushButton:hover {
-                border-radius: 4px;
-                background: rgb(180, 70, 70);
-            }
-
-            QPushButton:pressed  {
-                border-radius: 4px;
-                background: rgb(190, 77, 77);
-            }
-        """
-        self.parent.run_btn.setStyleSheet(style)
-        self.parent.run_slowly_btn.setStyleSheet(style)
-        self.parent.run_btn.setIcon(self.stop_img)
-        self.parent.run_slowly_btn.setIcon(self.stop_img)
-
-    def repaint_btn_back(self):
-        style = """
-                    QPushButton {
-                        border-radius: 4px;
-                        background: rgb(50, 50, 50);
-                    }
-
-                    QPushButton:hover {
-                        border-radius: 4px;
-                        background: rgb(60, 60, 60);
-                    }
-
-                    QPushButton:pressed  {
-                        border-radius: 4px;
-                        background: rgb(77, 77, 77);
-                    }
-                """
-
-        self.parent.run_btn.setStyleSheet(style)
-        self.parent.run_slowly_btn.setStyleSheet(style)
-        self.parent.run_btn.setIcon(self.run_img)
-        self.parent.run_slowly_btn.setIcon(self.run_slow_img)
+    def draw(self, buffer, way):
+        # The field may have been resized or its view moved since the last
+        # frame, then the whole path is drawn again
+        size, view = self.parent.preview.size, self.parent.preview.view
+        if buffer is None or buffer.size != size or buffer.view != view:
+            buffer = PathBuffer(size, view)
+        buffer.add(way)
+        return buffer
 
     def stop_it(self):
         try:
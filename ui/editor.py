@@ -30,3 +30,8 @@ class Editor(QsciScintilla):
         self.setTabWidth(4)
         self.lexer = Lexer(self)
         self.setLexer(self.lexer)
+
+    def highlight_line(self, line):
+        # Selects the line, lines of the interpreter start from 1
+        self.setSelection(line - 1, 0, line - 1, self.lineLength(line - 1))
+        self.ensureLineVisible(line - 1)
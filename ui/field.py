@@ -1,77 +1,441 @@
 import time
+from array import array
 from datetime import datetime
 
-from PyQt5.QtGui import QColor, QPainter, QPen, QPixmap
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QImage, QPainter, QPainterPath, QPen, QPixmap, QTransform
 from PyQt5.QtWidgets import QLabel
 
+from interpreter import render
+from interpreter.grid import GRID_SIZE
+from interpreter.spatial import SegmentIndex
+from interpreter.trajectory import Trajectory
+
+# Milliseconds between animation frames
+FRAME_INTERVAL = 16
+# Segments of the path per second
+DEFAULT_SPEED = 20
+# The view is zoomed by this factor per step of the mouse wheel
+ZOOM_FACTOR = 1.25
+# A click is a press and a release closer than this number of pixels,
+# it selects the path closer than this number of pixels as well
+CLICK_DISTANCE = 4
+
+
+def segment(x_start, y_start, x_end, y_end):
+    path = QPainterPath()
+    path.moveTo(x_start, y_start)
+    path.lineTo(x_end, y_end)
+    return path
+
+
+def polyline(points):
+    path = QPainterPath()
+    path.moveTo(*points[0])
+    for x, y in points[1:]:
+        path.lineTo(x, y)
+    return path
+
+
+def as_trajectory(points):
+    return points if isinstance(points, Trajectory) else Trajectory(points, "i")
+
+
+def grid_transform(size, view):
+    # Maps grid coordinates to pixels of the view on the canvas, y goes up
+    step = view.step(size)
+    return QTransform(step, 0, 0, -step, -view.left * step, size + view.bottom * step)
+
+
+def path_pen():
+    pen = QPen(QColor(*render.PATH_COLOR), render.PATH_WIDTH)
+    # the width is in pixels whatever the transform is
+    pen.setCosmetic(True)
+    return pen
+
+
+def min_length(size, view):
+    # Length of one pixel in cells
+    return view.span / max(size, 1)
+
+
+def view_rect(size, view):
+    # The view with the width of the path around it, segments outside are not drawn
+    return view.rect(render.PATH_WIDTH * min_length(size, view))
+
+
+def paint_path(device, size, view, paths):
+    painter = QPainter(device)
+    painter.setTransform(grid_transform(size, view))
+    painter.setPen(path_pen())
+    for path in paths:
+        painter.drawPath(path)
+    painter.end()
+
+
+class PathBuffer:
+    """
+    Path layer drawn outside the GUI thread, QImage unlike QPixmap can be
+    painted in any thread. There are two images: frame() paints the new
+    segments on the back one and swaps them, the front one goes to the GUI
+    thread through a queued signal. The segments are painted on the other
+    image by the next frame(). If the GUI thread still holds that image,
+    Qt copies it before painting, as QImage is implicitly shared.
+    The images show view, a render.Viewport.
+    """
+
+    def __init__(self, size, view):
+        self.size = size
+        self.view = view
+        self.front = self.image()
+        self.back = self.image()
+        # segments the back image lacks and segments added since the last frame
+        self.missed = []
+        self.pending = []
+        self.drawn = 0
+
+    def image(self):
+        image = QImage(self.size, self.size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.transparent)
+        return image
+
+    def add(self, way):
+        # Adds points of way after the ones added before
+        if len(way) <= self.drawn:
+            return
+
+        corners = as_trajectory(way[max(self.drawn - 1, 0):]).corners(min_length(self.size, self.view))
+        self.pending.append(polyline(corners))
+        self.drawn = len(way)
+
+    def frame(self):
+        if self.size == 0:
+            return QImage()
+
+        paint_path(self.back, self.size, self.view, self.missed + self.pending)
+        self.front, self.back = self.back, self.front
+        self.missed, self.pending = self.pending, []
+        return self.front
+
 
 class Field(QLabel):
-    def __init__(self, parent, cell_num=20):
+    """
+    Shows the part of the grid in self.view, a render.Viewport, which is
+    zoomed by the mouse wheel and moved by dragging. The grid is drawn
+    once per size and view into self.background, the path is kept in
+    self.path_layer and only segments added since the last update() are
+    drawn there. self.index keeps the drawn segments by their place on
+    the grid, so after a resize or a move of the view only the segments
+    in the view are drawn again, however long the path is.
+
+    Paths computed by code_executor.Worker come already drawn in a
+    PathBuffer image: show_image() shows frames of a running program,
+    show_rendered() takes the image as the path layer.
+
+    animate() plays the path on the GUI thread: every FRAME_INTERVAL ms
+    the timer adds as many segments as self.speed (segments per second)
+    requires, the current segment is drawn partially. seek() jumps to
+    any point of the path.
+
+    A click on the path emits point_clicked with the index of the point
+    the clicked move has led to.
+    """
+    # index of the last point shown by the animation
+    progress = pyqtSignal(int)
+    point_clicked = pyqtSignal(int)
+
+    def __init__(self, parent, cell_num=GRID_SIZE):
         super(Field, self).__init__()
         self.parent = parent
         self.cell_num = cell_num
         self.setStyleSheet("border: 4px solid; border-radius: 6px;")
-        self.steps_for_cell = 3
+        # the view is zoomed around the cursor, so the image must be where the cursor is
+        self.setAlignment(Qt.AlignCenter)
         self.last_click = datetime.now()
+        # last position of the mouse while the view is dragged and where it was pressed
+        self.drag_position = None
+        self.press_position = None
+        self.size = 0
+        self.view = render.Viewport.whole(cell_num)
+        self.way = None
+        self.background = None
+        self.path_layer = None
+        # size and view the background and the path layer were drawn for
+        self.background_key = None
+        self.layer_key = None
+        # segments between corners of the drawn part of self.way, with their indexes in it
+        self.index = SegmentIndex()
+        # number of points of self.way already in self.index
+        self.drawn = 0
+        self.speed = DEFAULT_SPEED
+        # position of the animation in segments, the fraction is the part
+        # of the current segment
+        self.position = 0.0
+        self.last_frame = 0.0
+        self.timer = QTimer(self)
+        self.timer.setInterval(FRAME_INTERVAL)
+        self.timer.timeout.connect(self.next_frame)
+
+    def update(self, way=None):
+        # Shows the whole path, an animation of the same path keeps going
+        self.update_size()
+        if self.timer.isActive() and way is self.way:
+            self.render_field(self.drawn)
+            return
+
+        self.timer.stop()
+        if way is not self.way or not way or len(way) < self.drawn:
+            self.set_way(way)
+        self.render_field(len(way) if way else 0)
+
+    def show_image(self, image, view):
+        # A frame of a running program, the path shown before is kept
+        if self.size == 0 or image.width() != self.size or view != self.view:
+            return
+
+        self.timer.stop()
+        self.update_background()
+        canvas = QPixmap(self.background)
+        painter = QPainter(canvas)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        self.setPixmap(canvas)
 
-    def update(self, way=None, delay=0):
+    def show_rendered(self, way, index, image, view):
+        # The index of the whole path comes with the image, it is drawn
+        # again from the index if the size or the view has changed since
+        self.update_size()
+        self.timer.stop()
+        self.set_way(way)
+        self.index = index
+        self.drawn = len(way)
+        if not image.isNull() and image.width() == self.size and view == self.view:
+            self.path_layer = QPixmap.fromImage(image)
+            self.layer_key = self.key()
+        self.render_field(self.drawn)
+
+    def animate(self, way):
+        self.timer.stop()
+        self.update_size()
+        self.set_way(way)
+        self.position = 0.0
+        self.render_field(1)
+        if way and len(way) > 1 and self.path_layer is not None:
+            self.last_frame = time.monotonic()
+            self.timer.start()
+
+    def stop_animation(self):
+        self.timer.stop()
+
+    def set_speed(self, speed):
+        self.speed = speed
+
+    def seek(self, index):
+        if not self.way:
+            return
+
+        index = max(0, min(index, len(self.way) - 1))
+        if index + 1 < self.drawn:
+            # going back, the path is drawn again up to index at once
+            self.set_way(self.way)
+        self.position = float(index)
+        self.last_frame = time.monotonic()
+        self.render_field(index + 1)
+
+    def set_cell_num(self, cell_num):
+        # A grid of another size, nothing drawn on the old one is kept
+        self.timer.stop()
+        self.cell_num = cell_num
+        self.view = render.Viewport.whole(cell_num)
+        self.set_way(None)
+        self.render_field(0)
+
+    def set_view(self, view):
+        if view == self.view:
+            return
+
+        self.view = view
+        self.render_field(self.drawn)
+
+    def next_frame(self):
+        now = time.monotonic()
+        last = len(self.way) - 1
+        self.position = min(self.position + (now - self.last_frame) * self.speed, last)
+        self.last_frame = now
+        index = int(self.position)
+        self.draw_segments(index + 1)
+        self.show_frame(self.partial_segment(index))
+        self.progress.emit(index)
+        if index >= last:
+            self.timer.stop()
+
+    def update_size(self):
         self.size = int(min(
             self.parent.preview_layout.geometry().width(),
             self.parent.preview_layout.geometry().height()
         ) * 0.96)
-        while self.size == 0 and self.parent.isVisible():
-            self.size = int(min(
-                self.parent.preview_layout.geometry().width(),
-                self.parent.preview_layout.geometry().height()
-            ) * 0.96)  # Fixes bad PyQt5 MultiThreading
         self.setMinimumSize(self.size, self.size)
         self.parent.preview_layout.update()
+
+    def key(self):
+        return self.size, self.view
+
+    def set_way(self, way):
+        # Drops everything drawn before
         self.way = way
-        self.render_field(delay)
+        self.index = SegmentIndex()
+        self.drawn = 0
+        self.path_layer = None
+
+    def update_background(self):
+        if self.background is None or self.background_key != self.key():
+            self.background = self.render_background()
+            self.background_key = self.key()
+
+    def render_background(self):
+        # Same picture as interpreter.render makes for thumbnails, lines
+        # of huge grids are thinned out in the same way
+        background = QPixmap(self.size, self.size)
+        background.fill(QColor(*render.BACKGROUND_COLOR))
+        painter = QPainter(background)
+        painter.setPen(QColor(*render.GRID_COLOR))
+        xs, ys = self.view.grid_lines(self.size, self.cell_num)
+        for x in xs:
+            painter.drawLine(x, 0, x, self.size)
+        for y in ys:
+            painter.drawLine(0, y, self.size, y)
+        painter.end()
+        return background
+
+    def render_path_layer(self):
+        # The drawn path in the view at once, used when the size or the view has changed
+        path_layer = QPixmap(self.size, self.size)
+        path_layer.fill(Qt.transparent)
+        self.path_layer = path_layer
+        self.paint_segments(self.index.query(*view_rect(self.size, self.view)))
+        return path_layer
+
+    def render_field(self, end):
+        # Shows the first end points of the path, nothing before the layout sets the size
+        if self.size == 0:
+            return
+
+        self.update_background()
+        if self.path_layer is None or self.layer_key != self.key():
+            self.path_layer = self.render_path_layer()
+            self.layer_key = self.key()
 
-    def render_field(self, delay=0):
-        canvas = QPixmap(self.size, self.size)
-        canvas.fill(QColor(44, 44, 88))
+        self.draw_segments(end)
+        self.show_frame(self.partial_segment(int(self.position)) if self.timer.isActive() else None)
+
+    def draw_segments(self, end):
+        # Adds points of the path up to end to the index and to the path layer
+        way = self.way
+        if not way or end <= self.drawn:
+            return
+
+        if self.drawn == 0:
+            self.index.append(way[0])
+            self.drawn = 1
+
+        # Runs of moves in one direction become one segment, only the new
+        # segments in the view are drawn
+        start = len(self.index)
+        positions = array("q")
+        corners = as_trajectory(way[self.drawn - 1:end]).corners(indexes=positions)
+        self.index.extend(corners, (self.drawn - 1 + position for position in positions))
+        self.paint_segments(self.index.crossing(*view_rect(self.size, self.view), start))
+        self.drawn = max(self.drawn, min(end, len(way)))
+
+    def paint_segments(self, segments):
+        # Details smaller than a pixel are dropped, see Trajectory.corners()
+        length = self.min_length()
+        paths = [polyline(line.corners(length)) for line in self.index.polylines(segments)]
+        if paths:
+            paint_path(self.path_layer, self.size, self.view, paths)
+
+    def min_length(self):
+        return min_length(self.size, self.view)
+
+    def partial_segment(self, index):
+        # Part of the segment after the point index passed by the animation
+        fraction = self.position - index
+        if not fraction or index + 1 >= len(self.way):
+            return None
+
+        (x_start, y_start), (x_end, y_end) = self.way[index], self.way[index + 1]
+        return segment(
+            x_start, y_start, x_start + (x_end - x_start) * fraction, y_start + (y_end - y_start) * fraction
+        )
+
+    def show_frame(self, partial=None):
+        canvas = QPixmap(self.background)
         painter = QPainter(canvas)
-        step = self.size / (self.cell_num + 1)
-        for i in range(0, self.cell_num + 1):
-            painter.drawLine(int(step * (i + 0.5)), 0, int(step * (i + 0.5)), self.size)
-            painter.drawLine(0, int(step * (i + 0.5)), self.size, int(step * (i + 0.5)))
-        if self.way:
-            painter.setPen(QPen(QColor(111, 180, 111), 3))
-            for i in range(len(self.way) - 1):
-                if self.parent.worker.force_stop:
-                    break
-                x_start = int((self.way[i][0] + 0.5) * step)
-                y_start = int((self.way[i][1] + 0.5) * step)
-                x_end = int((self.way[i + 1][0] + 0.5) * step)
-                y_end = int((self.way[i + 1][1] + 0.5) * step)
-                y_start = self.size - y_start
-                y_end = self.size - y_end
-                tx_start = x_start
-                ty_start = y_start
-                cells_move = abs(
-                    self.way[i + 1][0] - self.way[i][0] + self.way[i + 1][1] - self.way[i][1]
-                ) * self.steps_for_cell
-                if delay:
-                    for k in range(cells_move):
-                        tx_end = (x_end - x_start) * k // cells_move + x_start
-                        ty_end = (y_end - y_start) * k // cells_move + y_start
-                        painter.drawLine(tx_start, ty_start, tx_end, ty_end)
-                        tx_start = tx_end
-                        ty_start = y_start
-                        if self.parent.worker.force_stop:
-                            break
-                        self.setPixmap(canvas)
-                        time.sleep(delay)
-                painter.drawLine(x_start, y_start, x_end, y_end)
-                self.setPixmap(canvas)
-                time.sleep(delay)
+        painter.drawPixmap(0, 0, self.path_layer)
+        if partial is not None:
+            painter.setTransform(grid_transform(self.size, self.view))
+            painter.setPen(path_pen())
+            painter.drawPath(partial)
         painter.end()
         self.setPixmap(canvas)
 
+    def to_grid(self, position):
+        # Position in the widget to grid coordinates, the image is in the center
+        return self.view.to_grid(
+            position.x() - (self.width() - self.size) / 2, position.y() - (self.height() - self.size) / 2, self.size
+        )
+
+    def point_at(self, position):
+        # Index of the point of the drawn path clicked at position, None if the path is not there
+        x, y = self.to_grid(position)
+        segment = self.index.nearest(x, y, CLICK_DISTANCE * self.min_length())
+        if segment is None:
+            return None
+
+        start, end = self.index.positions[segment], self.index.positions[segment + 1]
+        if start < 0:
+            return None
+
+        # points between two corners go along one line, the click is on
+        # the move to the first point not closer to the start than it
+        x_start, y_start = self.way[start]
+        distance = abs(x - x_start) + abs(y - y_start)
+        for index in range(start + 1, end):
+            x_point, y_point = self.way[index]
+            if abs(x_point - x_start) + abs(y_point - y_start) >= distance:
+                return index
+        return end
+
+    def wheelEvent(self, event):
+        if self.size == 0:
+            return
+
+        x, y = self.to_grid(event.pos())
+        self.set_view(self.view.zoom(ZOOM_FACTOR ** (event.angleDelta().y() / 120), x, y, self.cell_num))
+
     def mousePressEvent(self, event):
+        self.drag_position = self.press_position = event.pos()
         if (datetime.now() - self.last_click).total_seconds() < 0.5:
             pass  # show large preview on doubleclick
         else:
             self.last_click = datetime.now()
+
+    def mouseMoveEvent(self, event):
+        if self.drag_position is None or self.size == 0:
+            return
+
+        step = self.view.step(self.size)
+        delta = event.pos() - self.drag_position
+        self.drag_position = event.pos()
+        # the grid goes with the mouse, y goes up on the grid
+        self.set_view(self.view.pan(-delta.x() / step, delta.y() / step, self.cell_num))
+
+    def mouseReleaseEvent(self, event):
+        press_position, self.drag_position, self.press_position = self.press_position, None, None
+        if press_position is None or self.size == 0 or not self.way:
+            return
+
+        if (event.pos() - press_position).manhattanLength() < CLICK_DISTANCE:
+            index = self.point_at(event.pos())
+            if index is not None:
+                self.point_clicked.emit(index)
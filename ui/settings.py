@@ -4,6 +4,8 @@ from PyQt5 import QtWidgets, uic
 from PyQt5.QtCore import QPoint, QPropertyAnimation, Qt
 from PyQt5.QtGui import QFont
 
+from interpreter.grid import GRID_SIZE
+
 
 class Settings(QtWidgets.QMainWindow):
     def __init__(self, db, parent=None):
@@ -23,6 +25,7 @@ class Settings(QtWidgets.QMainWindow):
         self.fade_in_anim.setDuration(200)
         self.setWindowOpacity(0)
         # set current settings
+        self.settings = {}
         try:
             self.settings = self.db.get_settings()
             self.default_filename_edit.setText(
@@ -38,6 +41,9 @@ class Settings(QtWidgets.QMainWindow):
                 self.settings.get("font_name", "Cascadia Code")
             )
             self.font_select.setCurrentFont(font)
+            self.grid_size_spin.setValue(
+                int(self.settings.get("grid_size", GRID_SIZE))
+            )
         except Exception as e:
             self.parent.log(e)
 
@@ -59,6 +65,7 @@ class Settings(QtWidgets.QMainWindow):
     def closeEvent(self, event):
         font_size = self.font_size_spin.value()
         font = self.font_select.currentFont().family()
+        grid_size = self.grid_size_spin.value()
         default_filename = self.default_filename_edit.text()
         if not default_filename:
             default_filename = "program"
@@ -69,14 +76,19 @@ class Settings(QtWidgets.QMainWindow):
             "font_size": font_size,
             "font_name": font,
             "default_filename": default_filename,
-            "save_on_exit": int(save_on_exit)
+            "save_on_exit": int(save_on_exit),
+            "grid_size": grid_size
         }
         try:
             self.db.save_settings(settings)
         except Exception as e:
             self.parent.log(e)
-        QtWidgets.QMessageBox.about(
-            self.parent,
-            "Требуется перезапуск",
-            "Перезапустите приложение для применения изменений"
-        )
+        # the grid size is applied at once, the editor font only on start
+        self.parent.set_grid_size(grid_size)
+        old_font = int(self.settings.get("font_size", 12)), self.settings.get("font_name", "Cascadia Code")
+        if (font_size, font) != old_font:
+            QtWidgets.QMessageBox.about(
+                self.parent,
+                "Требуется перезапуск",
+                "Перезапустите приложение для применения изменений шрифта"
+            )
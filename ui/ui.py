@@ -8,11 +8,13 @@ from PyQt5.QtGui import QColor, QIcon
 
 from .code_executor import Worker
 from .editor import Editor
-from .field import Field
+from .field import DEFAULT_SPEED, Field
 from .settings import Settings
 
 
 BASE_DIR = os.path.dirname(__file__)
+# animation speed multipliers in the speed box
+ANIMATION_SPEEDS = (1, 2, 5, 10, 100, 1000)
 
 
 # crutch for normal button generation
@@ -46,6 +48,9 @@ class Ui(QtWidgets.QMainWindow):
         uic.loadUi(os.path.join(BASE_DIR, "./main.ui"), self)
         self.setWindowTitle("Grid Master")
         self.setWindowIcon(QIcon(os.path.join(BASE_DIR, "./assets/logo_512.png")))
+        self.stop_icon = QIcon(os.path.join(BASE_DIR, "./assets/stop-icon.png"))
+        self.run_icon = QIcon(os.path.join(BASE_DIR, "./assets/run-icon.png"))
+        self.run_slowly_icon = QIcon(os.path.join(BASE_DIR, "./assets/run-animated-icon.png"))
         self.open_file_btn.clicked.connect(self.open_file)
         self.new_file_btn.clicked.connect(self.create_file)
         self.save_file_btn.clicked.connect(self.save_file)
@@ -55,7 +60,7 @@ class Ui(QtWidgets.QMainWindow):
         self.code_field = Editor(self)
         self.code_layout.addWidget(self.code_field)
         self.default_log_style = self.logs.currentCharFormat()
-        self.preview = Field(self, 20)
+        self.preview = Field(self, self.interpreter.grid_size)
         self.cords = QtWidgets.QLabel("X: 0\nY: 0")
         self.cords.setStyleSheet("font-size: 12pt; font-weight: 700;")
         self.cords.setAlignment(Qt.AlignCenter)
@@ -63,8 +68,27 @@ class Ui(QtWidgets.QMainWindow):
         self.preview_layout.addWidget(self.preview)
         self.preview_layout.addWidget(self.cords)
 
+        # animation controls: position in the path and playback speed
+        self.seek_slider = QtWidgets.QSlider(Qt.Horizontal)
+        self.seek_slider.setMaximum(0)
+        self.seek_slider.sliderMoved.connect(self.preview.seek)
+        self.preview.progress.connect(self.seek_slider.setValue)
+        self.preview.point_clicked.connect(self.show_source)
+        self.speed_box = QtWidgets.QComboBox()
+        for speed in ANIMATION_SPEEDS:
+            self.speed_box.addItem(f"x{speed}", speed)
+        self.speed_box.currentIndexChanged.connect(
+            lambda index: self.preview.set_speed(DEFAULT_SPEED * self.speed_box.itemData(index))
+        )
+        animation_layout = QtWidgets.QHBoxLayout()
+        animation_layout.addWidget(self.seek_slider)
+        animation_layout.addWidget(self.speed_box)
+        self.preview_layout.addLayout(animation_layout)
+
         self.filename = ""
         self.way = None
+        # source_map.SourceMap of self.way
+        self.source_map = None
         self.recent_layout.setAlignment(Qt.AlignTop)
         self.generate_recent()
 
@@ -73,7 +97,15 @@ class Ui(QtWidgets.QMainWindow):
         self.worker = Worker(self.interpreter, self)
         self.worker.moveToThread(self.thread)
         self.thread.started.connect(self.worker.run)
+        self.worker.started.connect(self.paint_btn)
+        self.worker.finished.connect(self.repaint_btn_back)
         self.worker.finished.connect(self.thread.quit)
+        self.worker.animation_ready.connect(self.start_animation)
+        self.worker.frame_ready.connect(self.preview.show_image)
+        self.worker.path_ready.connect(self.show_path)
+        self.worker.coords_changed.connect(self.cords.setText)
+        self.worker.message.connect(self.log)
+        self.worker.error_line.connect(self.code_field.highlight_line)
 
         self.show()
         self.preview.update()
@@ -142,21 +174,92 @@ class Ui(QtWidgets.QMainWindow):
                 self.db.update_recent(self.filename, time.time())
 
     def execute_code(self, event=None):
-        self.save_file(None)
         if self.thread.isRunning():
             self.worker.stop_it()
         else:
             self.worker.animate = False
+            self.worker.source = self.code_field.text()
             self.thread.start()
 
     def execute_code_n_animate(self, event=None):
-        self.save_file(None)
         if self.thread.isRunning():
             self.worker.stop_it()
         else:
             self.worker.animate = True
+            self.worker.source = self.code_field.text()
             self.thread.start()
 
+    def start_animation(self, way, source_map):
+        self.way = way
+        self.source_map = source_map
+        self.seek_slider.setMaximum(max(len(way) - 1, 0))
+        self.seek_slider.setValue(0)
+        self.preview.animate(way)
+
+    def show_path(self, way, source_map, index, image, view):
+        self.way = way
+        self.source_map = source_map
+        # the whole path is shown, the slider seeks in this path from its end
+        self.seek_slider.setMaximum(max(len(way) - 1, 0))
+        self.seek_slider.setValue(self.seek_slider.maximum())
+        self.preview.show_rendered(way, index, image, view)
+
+    def paint_btn(self):
+        # Buttons stop the running program
+        style = """
+            QPushButton {
+                border-radius: 4px;
+                background: rgb(170, 60, 60);
+            }
+
+            QPushButton:hover {
+                border-radius: 4px;
+                background: rgb(180, 70, 70);
+            }
+
+            QPushButton:pressed  {
+                border-radius: 4px;
+                background: rgb(190, 77, 77);
+            }
+        """
+        self.run_btn.setStyleSheet(style)
+        self.run_slowly_btn.setStyleSheet(style)
+        self.run_btn.setIcon(self.stop_icon)
+        self.run_slowly_btn.setIcon(self.stop_icon)
+
+    def repaint_btn_back(self):
+        style = """
+                    QPushButton {
+                        border-radius: 4px;
+                        background: rgb(50, 50, 50);
+                    }
+
+                    QPushButton:hover {
+                        border-radius: 4px;
+                        background: rgb(60, 60, 60);
+                    }
+
+                    QPushButton:pressed  {
+                        border-radius: 4px;
+                        background: rgb(77, 77, 77);
+                    }
+                """
+
+        self.run_btn.setStyleSheet(style)
+        self.run_slowly_btn.setStyleSheet(style)
+        self.run_btn.setIcon(self.run_icon)
+        self.run_slowly_btn.setIcon(self.run_slowly_icon)
+
+    def show_source(self, index):
+        # Shows the command that has made the point of the path
+        location = self.source_map.locate(index) if self.source_map is not None else None
+        if location is None:
+            return
+
+        self.code_field.highlight_line(location.line)
+        iterations = ", ".join(map(str, location.iterations)) or "-"
+        self.log(f"Point {self.way[index]} is made by line {location.line}, loop iterations: {iterations}")
+
     def log(self, text, level=logging.INFO):
         self.logger.log(
             level=level,
@@ -187,6 +290,20 @@ class Ui(QtWidgets.QMainWindow):
             self.logs.insertPlainText(f"Ida> {text}\n")
             self.logs.setCurrentCharFormat(self.default_log_style)
 
+    def set_grid_size(self, grid_size):
+        # The path of the old grid is dropped, a running program is stopped
+        if grid_size == self.interpreter.grid_size:
+            return
+
+        if self.thread.isRunning():
+            self.worker.stop_it()
+        self.interpreter.grid_size = grid_size
+        self.way = None
+        self.source_map = None
+        self.seek_slider.setMaximum(0)
+        self.preview.set_cell_num(grid_size)
+        self.log(f"Grid size is {grid_size} now")
+
     def open_settings(self, event=None):
         self.settings_dialog = Settings(self.db, self)
         self.settings_dialog.show()
@@ -194,8 +311,7 @@ class Ui(QtWidgets.QMainWindow):
 
     def resizeEvent(self, event=None):
         super().resizeEvent(event)
-        if self.thread.isRunning() and self.worker.drawing:
-            self.worker.stop_it()
+        # a running program is not stopped, its next frame is drawn in the new size
         self.preview.update(self.way)
 
     def closeEvent(self, event=None):